@@ -27,11 +27,17 @@ export const onRequest = defineMiddleware(async (context, next) => {
     const response = await fetch(serverRequest);
     const data = await response.arrayBuffer();
     
+    // fetch has already decompressed the body, so the encoding and length
+    // headers no longer describe the bytes being forwarded
+    const headers = new Headers(response.headers);
+    headers.delete('content-encoding');
+    headers.delete('content-length');
+    
     // Return the response from the API server
     return new Response(data, {
       status: response.status,
       statusText: response.statusText,
-      headers: response.headers,
+      headers,
     });
   } catch (error) {
     console.error('Error forwarding request to API:', error);
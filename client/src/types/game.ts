@@ -36,8 +36,9 @@ export interface Game {
  */
 export interface GamesResponse {
     games: Game[];
-    total: number;
+    total: number | null;
     hasMore: boolean;
+    nextCursor: string | null;
 }
 
 /**
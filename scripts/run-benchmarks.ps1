@@ -0,0 +1,21 @@
+# Run API benchmarks
+
+# Determine project root
+$ScriptDir = Split-Path -Parent $MyInvocation.MyCommand.Path
+$ProjectRoot = Split-Path -Parent $ScriptDir
+
+# Activate virtual environment
+$ActivateScript = "$ProjectRoot\venv\Scripts\Activate.ps1"
+if (Test-Path $ActivateScript) {
+    & $ActivateScript
+} else {
+    Write-Host "Virtual environment not found. Running setup-env.ps1..."
+    & "$ScriptDir\setup-env.ps1"
+    & $ActivateScript
+}
+
+# Run API benchmarks, passing through any arguments
+Set-Location "$ProjectRoot\server"
+Write-Host "Running API benchmarks..."
+
+python -m benchmarks.bench_api @args
@@ -50,6 +50,8 @@ if ($NeedsSeed) {
 
 # Start Flask server
 Set-Location server
+# Create missing tables and indexes; the app no longer does this when imported
+python -m flask --app app init-db
 $env:FLASK_DEBUG = "1"
 $env:FLASK_PORT = "5100"
 
@@ -54,6 +54,9 @@ cd server || {
     cd "$INITIAL_DIR"
     exit 1
 }
+# Create missing tables and indexes; the app no longer does this when imported
+python3 -m flask --app app init-db
+
 export FLASK_DEBUG=1
 export FLASK_PORT=5100
 
@@ -1,29 +1,72 @@
 import os
-from flask import Flask
+from typing import Any
+import click
+from flask import Flask, current_app
+from flask.cli import with_appcontext
 from routes.games import games_bp
 from routes.categories import categories_bp
 from routes.publishers import publishers_bp
-from models import db
-from utils.database import get_connection_string
+from routes.metrics import metrics_bp
+from utils.database import get_connection_string, init_database, init_schema
+from utils.data_version import init_data_version_watch
+from utils.json_provider import FastJSONProvider
+from utils.compression import init_compression
+from utils.metrics import init_metrics
+from utils.slow_query_log import init_slow_query_log
+from utils.catalog_snapshot import init_catalog_snapshot
+from utils.detail_cache import init_game_detail_cache
 
 # Get the server directory path
 base_dir: str = os.path.abspath(os.path.dirname(__file__))
 
-app: Flask = Flask(__name__)
 
-# Configure and initialize the database
-app.config['SQLALCHEMY_DATABASE_URI'] = get_connection_string()
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-db.init_app(app)
+def create_app(config: dict[str, Any] | None = None) -> Flask:
+    """
+    Builds the API app. config overrides the defaults, e.g. the database URI
+    for tests; DB_PROFILE selects the engine profile. Importing this module
+    and calling create_app don't touch the schema: run `flask --app app
+    init-db` (or init_schema) to create missing tables and indexes.
+    """
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
 
-# Create tables
-with app.app_context():
-    db.create_all()
+    # Configure and initialize the database
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config.update(config or {})
+    if 'SQLALCHEMY_DATABASE_URI' not in app.config:
+        app.config['SQLALCHEMY_DATABASE_URI'] = get_connection_string()
+    init_database(app, app.config.get('DB_PROFILE'))
+    # Notice commits from the seed script and other processes
+    init_data_version_watch(app)
+    # Off unless TAILSPIN_SLOW_QUERY_THRESHOLD_MS is set
+    init_slow_query_log(app)
+
+    # Metrics first so response sizes are measured after compression
+    init_metrics(app)
+    init_compression(app)
+
+    # Serve game pages from memory when TAILSPIN_CATALOG_SNAPSHOT_ENABLED is set
+    init_catalog_snapshot(app)
+    # Popular game detail responses are cached per id; GAME_DETAIL_CACHE_SIZE = 0 turns this off
+    init_game_detail_cache(app)
+
+    # Register blueprints
+    app.register_blueprint(games_bp)
+    app.register_blueprint(categories_bp)
+    app.register_blueprint(publishers_bp)
+    app.register_blueprint(metrics_bp)
+
+    app.cli.add_command(init_db_command)
+    return app
+
+
+@click.command('init-db')
+@with_appcontext
+def init_db_command() -> None:
+    """Create missing tables, the search index and any new indexes"""
+    created = init_schema(current_app)
+    click.echo(f"Database schema is up to date ({len(created)} indexes created)")
 
-# Register blueprints
-app.register_blueprint(games_bp)
-app.register_blueprint(categories_bp)
-app.register_blueprint(publishers_bp)
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5100) # Port 5100 to avoid macOS conflicts
\ No newline at end of file
+    create_app().run(debug=True, port=5100) # Port 5100 to avoid macOS conflicts
@@ -0,0 +1,179 @@
+"""
+Benchmarks the read API against file-backed SQLite catalogs of realistic size.
+
+Run from the server directory:
+
+    python -m benchmarks.bench_api --sizes 10000 100000 1000000 --output results.jsonl
+
+Each catalog is generated and bulk loaded once into --data-dir and reused by
+later runs. Every scenario writes one JSON line, tagged with the current git
+commit, so results from different commits can be diffed or plotted.
+"""
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any, TextIO
+from flask import Flask
+from models import db, Game, Category, Publisher
+from app import create_app
+from utils.database import init_schema, PROFILE_ENV_VAR, DEFAULT_PROFILE
+from utils.generate_seed_data import generate_synthetic_csv
+from utils.pagination import encode_cursor
+from utils.seed_database import bulk_load_games
+from benchmarks.stats import summarize_latencies
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DATA_DIR = os.path.join(os.path.dirname(SERVER_DIR), 'data', 'benchmarks')
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+DEFAULT_ITERATIONS = 200
+MEMORY_ITERATIONS = 20
+DATA_SEED = 1234
+
+
+def get_git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=SERVER_DIR, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def build_app(db_path: str, profile: str | None = None) -> Flask:
+    """Create the API app bound to the given database file"""
+    return create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{db_path}', 'DB_PROFILE': profile})
+
+
+def prepare_database(app: Flask, db_path: str, size: int, rebuild: bool) -> None:
+    """Bulk load size synthetic games unless a matching database already exists"""
+    with app.app_context():
+        if rebuild and os.path.exists(db_path):
+            db.engine.dispose()
+            os.remove(db_path)
+        init_schema(app)
+        if db.session.query(Game).count() == size:
+            return
+
+        db.drop_all()
+        init_schema(app)
+        csv_path = f'{db_path}.csv'
+        generate_synthetic_csv(csv_path, size, seed=DATA_SEED)
+        try:
+            start = time.perf_counter()
+            bulk_load_games(csv_path, seed=DATA_SEED)
+            print(f"Loaded {size} games in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+        finally:
+            os.remove(csv_path)
+
+
+def build_scenarios(app: Flask, size: int) -> dict[str, str]:
+    """Request paths covering the filter, offset and limit combinations of each endpoint"""
+    with app.app_context():
+        category_id = db.session.query(Category.id).order_by(Category.id).limit(1).scalar()
+        publisher_id = db.session.query(Publisher.id).order_by(Publisher.id).limit(1).scalar()
+        middle_game_id = db.session.query(Game.id).order_by(Game.id).offset(size // 2).limit(1).scalar()
+
+    deep_offset = size // 2
+    return {
+        'games_first_page': '/api/games',
+        'games_limit_100': '/api/games?limit=100',
+        'games_no_total': '/api/games?include_total=false',
+        'games_deep_offset': f'/api/games?offset={deep_offset}',
+        'games_deep_offset_limit_100': f'/api/games?offset={deep_offset}&limit=100',
+        'games_deep_cursor': f"/api/games?cursor={encode_cursor({'id': middle_game_id})}",
+        'games_category': f'/api/games?category_id={category_id}',
+        'games_publisher': f'/api/games?publisher_id={publisher_id}',
+        'games_category_publisher': f'/api/games?category_id={category_id}&publisher_id={publisher_id}',
+        'games_category_deep_offset': f'/api/games?category_id={category_id}&offset={deep_offset // 10}',
+        'games_top_rated': '/api/games?sort=-star_rating',
+        'games_top_rated_category': f'/api/games?category_id={category_id}&sort=-star_rating',
+        'games_sorted_by_title': '/api/games?sort=title',
+        'game_detail': f'/api/games/{middle_game_id}',
+        'categories': '/api/categories',
+        'publishers': '/api/publishers',
+    }
+
+
+def measure(request: Callable[[], Any], iterations: int) -> dict[str, Any]:
+    """Time iterations sequential requests, then sample peak memory separately"""
+    # Warm up caches and connections so the first request doesn't skew p99
+    request()
+
+    latencies: list[float] = []
+    start = time.perf_counter()
+    for _ in range(iterations):
+        request_start = time.perf_counter()
+        request()
+        latencies.append(time.perf_counter() - request_start)
+    elapsed = time.perf_counter() - start
+
+    # tracemalloc slows allocation down, so it only runs outside the timed loop
+    tracemalloc.start()
+    for _ in range(MEMORY_ITERATIONS):
+        request()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = summarize_latencies(latencies, elapsed)
+    result['peak_memory_kb'] = round(peak / 1024, 1)
+    return result
+
+
+def run_benchmarks(sizes: list[int], iterations: int, data_dir: str, rebuild: bool, output: TextIO,
+                   profile: str | None = None) -> None:
+    os.makedirs(data_dir, exist_ok=True)
+    metadata = {
+        'commit': get_git_commit(),
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'profile': profile or os.environ.get(PROFILE_ENV_VAR, DEFAULT_PROFILE),
+    }
+
+    for size in sizes:
+        db_path = os.path.join(data_dir, f'games-{size}.db')
+        app = build_app(db_path, profile)
+        prepare_database(app, db_path, size, rebuild)
+        client = app.test_client()
+
+        for scenario, path in build_scenarios(app, size).items():
+            def request() -> None:
+                response = client.get(path)
+                if response.status_code != 200:
+                    raise RuntimeError(f"{path} returned {response.status_code}")
+
+            record = {**metadata, 'size': size, 'scenario': scenario, 'path': path, 'iterations': iterations}
+            record.update(measure(request, iterations))
+            output.write(json.dumps(record) + '\n')
+            output.flush()
+
+        with app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the Tailspin Toys API at realistic catalog sizes")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="Catalog sizes to benchmark")
+    parser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS, help="Timed requests per scenario")
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR, help="Where generated databases are kept")
+    parser.add_argument('--rebuild', action='store_true', help="Regenerate databases even if they exist")
+    parser.add_argument('--output', default=None, help="JSON lines file to append results to (default: stdout)")
+    parser.add_argument('--profile', default=None, help="Database engine profile (default: TAILSPIN_DB_PROFILE or 'default')")
+    args = parser.parse_args()
+
+    if args.output:
+        with open(args.output, mode='a', encoding='utf-8') as output_file:
+            run_benchmarks(args.sizes, args.iterations, args.data_dir, args.rebuild, output_file, args.profile)
+    else:
+        run_benchmarks(args.sizes, args.iterations, args.data_dir, args.rebuild, sys.stdout, args.profile)
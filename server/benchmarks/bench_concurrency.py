@@ -0,0 +1,135 @@
+"""
+Compares database engine profiles under concurrent readers.
+
+Run from the server directory:
+
+    python -m benchmarks.bench_concurrency --size 100000 --threads 1 4 8 --profiles default production
+
+Each reader thread replays the bench_api scenarios round-robin through its
+own test client for --duration seconds. With --writer-interval a background
+thread also commits a rating update at that interval, which is where WAL
+journaling matters most. Results are JSON lines, one per profile and
+thread count.
+"""
+import argparse
+import itertools
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, TextIO
+from sqlalchemy import update
+from models import db, Game
+from benchmarks.bench_api import DEFAULT_DATA_DIR, build_app, build_scenarios, get_git_commit, prepare_database
+from benchmarks.stats import summarize_latencies
+
+DEFAULT_SIZE = 100_000
+DEFAULT_THREADS = [1, 4, 8]
+DEFAULT_DURATION = 10.0
+DEFAULT_PROFILES = ['default', 'production']
+
+
+def reset_journal_mode(db_path: str) -> None:
+    """WAL mode persists in the database file, so put it back before each run"""
+    connection = sqlite3.connect(db_path)
+    try:
+        connection.execute('PRAGMA journal_mode=DELETE')
+    finally:
+        connection.close()
+
+
+def run_profile(db_path: str, size: int, profile: str, threads: int, duration: float,
+                writer_interval: float) -> dict[str, Any]:
+    reset_journal_mode(db_path)
+    app = build_app(db_path, profile)
+    prepare_database(app, db_path, size, rebuild=False)
+    paths = list(build_scenarios(app, size).values())
+
+    latencies: list[float] = []
+    errors = 0
+    writes = 0
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def reader(offset: int) -> None:
+        nonlocal errors
+        client = app.test_client()
+        local_latencies: list[float] = []
+        local_errors = 0
+        for path in itertools.islice(itertools.cycle(paths), offset, None):
+            if stop.is_set():
+                break
+            start = time.perf_counter()
+            response = client.get(path)
+            local_latencies.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                local_errors += 1
+        with lock:
+            latencies.extend(local_latencies)
+            errors += local_errors
+
+    def writer() -> None:
+        nonlocal writes
+        with app.app_context():
+            while not stop.wait(writer_interval):
+                db.session.execute(update(Game).where(Game.id == 1).values(star_rating=4.0 + writes % 10 / 10))
+                db.session.commit()
+                writes += 1
+
+    workers = [threading.Thread(target=reader, args=(index,)) for index in range(threads)]
+    if writer_interval > 0:
+        workers.append(threading.Thread(target=writer))
+
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    time.sleep(duration)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+    result = summarize_latencies(latencies, elapsed)
+    result.update({'errors': errors, 'writes': writes})
+    return result
+
+
+def run_benchmarks(size: int, thread_counts: list[int], duration: float, profiles: list[str],
+                   writer_interval: float, data_dir: str, output: TextIO) -> None:
+    os.makedirs(data_dir, exist_ok=True)
+    db_path = os.path.join(data_dir, f'games-{size}.db')
+    commit = get_git_commit()
+
+    for threads in thread_counts:
+        for profile in profiles:
+            record: dict[str, Any] = {
+                'commit': commit,
+                'size': size,
+                'profile': profile,
+                'threads': threads,
+                'duration_s': duration,
+                'writer_interval_s': writer_interval,
+            }
+            record.update(run_profile(db_path, size, profile, threads, duration, writer_interval))
+            output.write(json.dumps(record) + '\n')
+            output.flush()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compare database engine profiles under concurrent readers")
+    parser.add_argument('--size', type=int, default=DEFAULT_SIZE, help="Catalog size to benchmark")
+    parser.add_argument('--threads', type=int, nargs='+', default=DEFAULT_THREADS, help="Reader thread counts")
+    parser.add_argument('--duration', type=float, default=DEFAULT_DURATION, help="Seconds per run")
+    parser.add_argument('--profiles', nargs='+', default=DEFAULT_PROFILES, help="Engine profiles to compare")
+    parser.add_argument('--writer-interval', type=float, default=0.0,
+                        help="Seconds between background writes (default: no writer)")
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR, help="Where generated databases are kept")
+    args = parser.parse_args()
+    run_benchmarks(args.size, args.threads, args.duration, args.profiles, args.writer_interval,
+                   args.data_dir, sys.stdout)
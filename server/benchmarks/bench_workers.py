@@ -0,0 +1,145 @@
+"""
+Measures API throughput against the number of serve.py worker processes.
+
+Run from the server directory:
+
+    python -m benchmarks.bench_workers --size 100000 --workers 1 2 4 --clients 8 --duration 10
+
+For each worker count a real serve.py is started on a free port against the
+bench_api catalog, and --clients client processes replay the bench_api
+scenarios round-robin over keep-alive HTTP connections for --duration
+seconds. Clients are forked processes, so the load generator isn't limited
+by one interpreter's GIL. Results are JSON lines, one per worker count.
+"""
+import argparse
+import http.client
+import itertools
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from typing import Any, TextIO
+from models import db
+from benchmarks.bench_api import DEFAULT_DATA_DIR, build_app, build_scenarios, get_git_commit, prepare_database
+from benchmarks.stats import summarize_latencies
+from utils.database import PROFILE_ENV_VAR, DEFAULT_PROFILE
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SIZE = 100_000
+DEFAULT_WORKERS = [1, 2, 4]
+DEFAULT_CLIENTS = 8
+DEFAULT_DURATION = 10.0
+STARTUP_TIMEOUT = 60.0
+
+
+def get_free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+
+def wait_for_server(port: int, process: subprocess.Popen) -> None:
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while True:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=1):
+                return
+        except OSError:
+            if process.poll() is not None:
+                raise RuntimeError(f"serve.py exited with status {process.returncode}")
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"serve.py didn't start listening within {STARTUP_TIMEOUT:.0f}s")
+            time.sleep(0.1)
+
+
+def run_client(port: int, paths: list[str], offset: int, duration: float) -> tuple[list[float], int]:
+    """Requests paths round-robin over one keep-alive connection until duration passes"""
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    latencies: list[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+    for path in itertools.islice(itertools.cycle(paths), offset, None):
+        start = time.perf_counter()
+        if start >= deadline:
+            break
+        try:
+            connection.request('GET', path)
+            response = connection.getresponse()
+            response.read()
+            if response.status != 200:
+                errors += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            connection.close()
+            continue
+        latencies.append(time.perf_counter() - start)
+    connection.close()
+    return latencies, errors
+
+
+def run_workers(db_path: str, paths: list[str], workers: int, clients: int, duration: float,
+                profile: str | None) -> dict[str, Any]:
+    port = get_free_port()
+    command = [sys.executable, 'serve.py', '--port', str(port), '--workers', str(workers), '--database', db_path]
+    if profile:
+        command += ['--profile', profile]
+    server = subprocess.Popen(command, cwd=SERVER_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_for_server(port, server)
+        # Forked clients start at once; spawned ones would first import Flask and SQLAlchemy
+        context = multiprocessing.get_context('fork' if hasattr(os, 'fork') else 'spawn')
+        with context.Pool(clients) as pool:
+            start = time.perf_counter()
+            results = pool.starmap(run_client, [(port, paths, index, duration) for index in range(clients)])
+            elapsed = time.perf_counter() - start
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait()
+
+    latencies = [latency for client_latencies, _ in results for latency in client_latencies]
+    result = summarize_latencies(latencies, elapsed)
+    result['errors'] = sum(errors for _, errors in results)
+    return result
+
+
+def run_benchmarks(size: int, worker_counts: list[int], clients: int, duration: float, profile: str | None,
+                   data_dir: str, output: TextIO) -> None:
+    os.makedirs(data_dir, exist_ok=True)
+    db_path = os.path.join(data_dir, f'games-{size}.db')
+    app = build_app(db_path, profile)
+    prepare_database(app, db_path, size, rebuild=False)
+    paths = list(build_scenarios(app, size).values())
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+    commit = get_git_commit()
+    for workers in worker_counts:
+        record: dict[str, Any] = {
+            'commit': commit,
+            'size': size,
+            'profile': profile or os.environ.get(PROFILE_ENV_VAR, DEFAULT_PROFILE),
+            'cpus': os.cpu_count(),
+            'workers': workers,
+            'clients': clients,
+            'duration_s': duration,
+        }
+        record.update(run_workers(db_path, paths, workers, clients, duration, profile))
+        output.write(json.dumps(record) + '\n')
+        output.flush()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Measure API throughput against the number of serve.py workers")
+    parser.add_argument('--size', type=int, default=DEFAULT_SIZE, help="Catalog size to benchmark")
+    parser.add_argument('--workers', type=int, nargs='+', default=DEFAULT_WORKERS, help="Worker counts to compare")
+    parser.add_argument('--clients', type=int, default=DEFAULT_CLIENTS, help="Concurrent client processes")
+    parser.add_argument('--duration', type=float, default=DEFAULT_DURATION, help="Seconds per run")
+    parser.add_argument('--profile', default=None, help="Database engine profile for the server")
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR, help="Where generated databases are kept")
+    args = parser.parse_args()
+    run_benchmarks(args.size, args.workers, args.clients, args.duration, args.profile, args.data_dir, sys.stdout)
@@ -0,0 +1,244 @@
+"""
+Replays storefront traffic against a running server to find how many
+concurrent shoppers one node can handle.
+
+Start a server (e.g. `python serve.py --workers 4`), then from the server
+directory:
+
+    python -m benchmarks.loadgen --url http://127.0.0.1:5100 --concurrency 16 32 64 --duration 30
+
+Each shopper thread keeps one keep-alive connection and behaves like the
+GameList and GameDetails components: a visit loads the filter bar
+(/api/categories, /api/publishers) and the first page of /api/games, then
+picks weighted actions (filter, load more, open a game's details or start
+a new visit), optionally pausing --think-time seconds between them. Ids
+come from earlier responses, so only existing games and filters are hit.
+
+Per-endpoint p50/p95/p99 latency, error rate and throughput are printed as
+a table and written as JSON lines, one per concurrency level and endpoint.
+Needs only the standard library and a reachable server.
+"""
+import argparse
+import http.client
+import json
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, TextIO
+from urllib.parse import urlencode, urlsplit
+from benchmarks.stats import summarize_latencies
+
+DEFAULT_URL = 'http://127.0.0.1:5100'
+DEFAULT_CONCURRENCY = [16]
+DEFAULT_DURATION = 30.0
+
+# Matches PAGE_SIZE in client/src/types/filter.ts
+PAGE_SIZE = 12
+
+# Relative frequency of what a shopper does after each page view
+ACTION_WEIGHTS: dict[str, int] = {
+    'view_game': 5,
+    'filter': 3,
+    'load_more': 2,
+    'new_visit': 1,
+}
+
+# Share of filter changes that pick a category, a publisher or both
+FILTER_WEIGHTS: dict[str, int] = {
+    'category': 5,
+    'publisher': 3,
+    'both': 2,
+}
+
+ALL_ENDPOINTS = 'all'
+
+
+@dataclass
+class EndpointStats:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+
+class Shopper:
+    """One simulated shopper browsing the storefront over a keep-alive connection"""
+
+    def __init__(self, host: str, port: int, rng: random.Random, think_time: float) -> None:
+        self.host = host
+        self.port = port
+        self.rng = rng
+        self.think_time = think_time
+        self.stats: dict[str, EndpointStats] = {}
+        self.connection: http.client.HTTPConnection | None = None
+        self.categories: list[int] = []
+        self.publishers: list[int] = []
+        self.filters: dict[str, int] = {}
+        self.offset = 0
+        self.game_ids: list[int] = []
+        self.has_more = False
+
+    def get(self, endpoint: str, path: str) -> Any:
+        """Requests path, recording it under endpoint; returns the JSON body or None on failure"""
+        stats = self.stats.setdefault(endpoint, EndpointStats())
+        if self.connection is None:
+            self.connection = http.client.HTTPConnection(self.host, self.port, timeout=30)
+        start = time.perf_counter()
+        try:
+            self.connection.request('GET', path)
+            response = self.connection.getresponse()
+            body = response.read()
+        except (OSError, http.client.HTTPException):
+            stats.latencies.append(time.perf_counter() - start)
+            stats.errors += 1
+            self.connection.close()
+            self.connection = None
+            return None
+        stats.latencies.append(time.perf_counter() - start)
+        if response.status != 200:
+            stats.errors += 1
+            return None
+        return json.loads(body)
+
+    def load_games(self, append: bool) -> None:
+        query = urlencode({**self.filters, 'limit': PAGE_SIZE, 'offset': self.offset})
+        data = self.get('/api/games', f'/api/games?{query}')
+        if data is None:
+            return
+        page_ids = [game['id'] for game in data['games']]
+        self.game_ids = self.game_ids + page_ids if append else page_ids
+        self.has_more = data['hasMore']
+
+    def new_visit(self) -> None:
+        categories = self.get('/api/categories', '/api/categories')
+        publishers = self.get('/api/publishers', '/api/publishers')
+        self.categories = [category['id'] for category in categories or []]
+        self.publishers = [publisher['id'] for publisher in publishers or []]
+        self.filters = {}
+        self.offset = 0
+        self.load_games(append=False)
+
+    def change_filter(self) -> None:
+        kind = self.rng.choices(list(FILTER_WEIGHTS), weights=list(FILTER_WEIGHTS.values()))[0]
+        self.filters = {}
+        if kind in ('category', 'both') and self.categories:
+            self.filters['category_id'] = self.rng.choice(self.categories)
+        if kind in ('publisher', 'both') and self.publishers:
+            self.filters['publisher_id'] = self.rng.choice(self.publishers)
+        self.offset = 0
+        self.load_games(append=False)
+
+    def load_more(self) -> None:
+        if not self.has_more:
+            self.change_filter()
+            return
+        self.offset += PAGE_SIZE
+        self.load_games(append=True)
+
+    def view_game(self) -> None:
+        if not self.game_ids:
+            self.new_visit()
+            return
+        self.get('/api/games/<id>', f'/api/games/{self.rng.choice(self.game_ids)}')
+
+    def run(self, stop: threading.Event) -> None:
+        actions = {
+            'view_game': self.view_game,
+            'filter': self.change_filter,
+            'load_more': self.load_more,
+            'new_visit': self.new_visit,
+        }
+        self.new_visit()
+        while not stop.is_set():
+            if self.think_time > 0 and stop.wait(self.rng.expovariate(1 / self.think_time)):
+                break
+            action = self.rng.choices(list(ACTION_WEIGHTS), weights=list(ACTION_WEIGHTS.values()))[0]
+            actions[action]()
+        if self.connection is not None:
+            self.connection.close()
+
+
+def summarize(stats: dict[str, EndpointStats], elapsed: float) -> dict[str, dict[str, Any]]:
+    """Latency percentiles, throughput and error rate per endpoint, plus all endpoints combined"""
+    combined = EndpointStats()
+    for endpoint_stats in stats.values():
+        combined.latencies += endpoint_stats.latencies
+        combined.errors += endpoint_stats.errors
+
+    summary: dict[str, dict[str, Any]] = {}
+    for endpoint, endpoint_stats in [*sorted(stats.items()), (ALL_ENDPOINTS, combined)]:
+        result = summarize_latencies(endpoint_stats.latencies, elapsed)
+        result['errors'] = endpoint_stats.errors
+        result['error_rate'] = round(endpoint_stats.errors / result['requests'], 4) if result['requests'] else 0.0
+        summary[endpoint] = result
+    return summary
+
+
+def run_load(url: str, concurrency: int, duration: float, think_time: float, seed: int | None) -> dict[str, dict[str, Any]]:
+    parts = urlsplit(url)
+    if parts.scheme != 'http':
+        raise ValueError(f"Only http:// URLs are supported, got '{url}'")
+    host, port = parts.hostname or '127.0.0.1', parts.port or 80
+    rng = random.Random(seed)
+    shoppers = [Shopper(host, port, random.Random(rng.random()), think_time) for _ in range(concurrency)]
+    stop = threading.Event()
+    threads = [threading.Thread(target=shopper.run, args=(stop,), daemon=True) for shopper in shoppers]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    stats: dict[str, EndpointStats] = {}
+    for shopper in shoppers:
+        for endpoint, endpoint_stats in shopper.stats.items():
+            merged = stats.setdefault(endpoint, EndpointStats())
+            merged.latencies += endpoint_stats.latencies
+            merged.errors += endpoint_stats.errors
+    return summarize(stats, elapsed)
+
+
+def print_table(concurrency: int, summary: dict[str, dict[str, Any]], output: TextIO) -> None:
+    output.write(f"\n{concurrency} concurrent shoppers\n")
+    output.write(f"{'Endpoint':<18} {'Requests':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'Errors':>8} {'Req/s':>8}\n")
+    for endpoint, result in summary.items():
+        output.write(
+            f"{endpoint:<18} {result['requests']:>9} {result['p50_ms']:>9.1f} {result['p95_ms']:>9.1f} "
+            f"{result['p99_ms']:>9.1f} {result['error_rate']:>8.2%} {result['throughput_rps']:>8.1f}\n"
+        )
+    output.flush()
+
+
+def run_loadgen(url: str, concurrency_levels: list[int], duration: float, think_time: float, seed: int | None,
+                output: TextIO) -> None:
+    for concurrency in concurrency_levels:
+        summary = run_load(url, concurrency, duration, think_time, seed)
+        print_table(concurrency, summary, sys.stderr)
+        for endpoint, result in summary.items():
+            record = {'url': url, 'concurrency': concurrency, 'duration_s': duration, 'think_time_s': think_time,
+                      'endpoint': endpoint, **result}
+            output.write(json.dumps(record) + '\n')
+        output.flush()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Replay storefront traffic against a running Tailspin Toys server")
+    parser.add_argument('--url', default=DEFAULT_URL, help="Base URL of the server")
+    parser.add_argument('--concurrency', type=int, nargs='+', default=DEFAULT_CONCURRENCY,
+                        help="Concurrent shoppers; several values run one after another")
+    parser.add_argument('--duration', type=float, default=DEFAULT_DURATION, help="Seconds per concurrency level")
+    parser.add_argument('--think-time', type=float, default=0.0,
+                        help="Mean seconds a shopper pauses between actions (default: none, maximum load)")
+    parser.add_argument('--seed', type=int, default=None, help="RNG seed for a reproducible traffic mix")
+    parser.add_argument('--output', default=None, help="JSON lines file to append results to (default: stdout)")
+    args = parser.parse_args()
+
+    if args.output:
+        with open(args.output, mode='a', encoding='utf-8') as output_file:
+            run_loadgen(args.url, args.concurrency, args.duration, args.think_time, args.seed, output_file)
+    else:
+        run_loadgen(args.url, args.concurrency, args.duration, args.think_time, args.seed, sys.stdout)
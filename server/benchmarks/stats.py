@@ -0,0 +1,26 @@
+import math
+from typing import Any
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of samples; pct is between 0 and 100."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize_latencies(latencies: list[float], elapsed: float) -> dict[str, Any]:
+    """
+    Summarizes per-request latencies (seconds) measured over elapsed wall
+    clock seconds into millisecond percentiles and requests per second.
+    """
+    return {
+        'requests': len(latencies),
+        'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+        'mean_ms': round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0,
+        'throughput_rps': round(len(latencies) / elapsed, 1) if elapsed > 0 else 0.0,
+    }
@@ -5,4 +5,5 @@ db = SQLAlchemy()
 # Import models after db is defined to avoid circular imports
 from .category import Category
 from .game import Game
-from .publisher import Publisher
\ No newline at end of file
+from .publisher import Publisher
+from .search import games_fts, ensure_search_index, search_index_suspended, build_match_expression
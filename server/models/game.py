@@ -1,3 +1,4 @@
+from collections.abc import Collection
 from typing import Any
 from . import db
 from .base import BaseModel
@@ -5,6 +6,25 @@ from sqlalchemy.orm import validates, relationship
 
 class Game(BaseModel):
     __tablename__ = 'games'
+    __table_args__ = (
+        # Filter by category and/or publisher, then page in id order. id is the
+        # rowid, so entries with equal keys are already stored in id order.
+        db.Index('ix_games_category_id', 'category_id'),
+        db.Index('ix_games_publisher_id', 'publisher_id'),
+        db.Index('ix_games_category_id_publisher_id', 'category_id', 'publisher_id'),
+        # Filter by category or publisher, then order by rating
+        db.Index('ix_games_category_id_star_rating', 'category_id', 'star_rating'),
+        db.Index('ix_games_publisher_id_star_rating', 'publisher_id', 'star_rating'),
+        # Sort the whole catalog by rating or title
+        db.Index('ix_games_star_rating', 'star_rating'),
+        db.Index('ix_games_title', 'title'),
+        # Filter by category or publisher, then order by title
+        db.Index('ix_games_category_id_title', 'category_id', 'title'),
+        db.Index('ix_games_publisher_id_title', 'publisher_id', 'title'),
+    )
+    
+    # Keys to_dict() can produce; a fields selection always includes id
+    SERIALIZED_FIELDS = ('id', 'title', 'description', 'publisher', 'category', 'starRating')
     
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(100), nullable=False)
@@ -32,12 +52,18 @@ class Game(BaseModel):
     def __repr__(self) -> str:
         return f'<Game {self.title}, ID: {self.id}>'
 
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            'id': self.id,
-            'title': self.title,
-            'description': self.description,
-            'publisher': {'id': self.publisher.id, 'name': self.publisher.name} if self.publisher else None,
-            'category': {'id': self.category.id, 'name': self.category.name} if self.category else None,
-            'starRating': self.star_rating  # Changed from star_rating to starRating
-        }
\ No newline at end of file
+    def to_dict(self, fields: Collection[str] | None = None) -> dict[str, Any]:
+        # Only the selected attributes are read, so columns left out of the
+        # query with load_only() are never lazy loaded
+        data: dict[str, Any] = {'id': self.id}
+        if fields is None or 'title' in fields:
+            data['title'] = self.title
+        if fields is None or 'description' in fields:
+            data['description'] = self.description
+        if fields is None or 'publisher' in fields:
+            data['publisher'] = {'id': self.publisher.id, 'name': self.publisher.name} if self.publisher else None
+        if fields is None or 'category' in fields:
+            data['category'] = {'id': self.category.id, 'name': self.category.name} if self.category else None
+        if fields is None or 'starRating' in fields:
+            data['starRating'] = self.star_rating  # Changed from star_rating to starRating
+        return data
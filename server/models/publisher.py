@@ -24,10 +24,14 @@ class Publisher(BaseModel):
     def __repr__(self) -> str:
         return f'<Publisher {self.name}>'
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, game_count: int | None = None) -> dict[str, Any]:
+        # Callers listing many rows should pass game_count from an aggregate
+        # query; falling back to len(self.games) loads every related game
+        if game_count is None:
+            game_count = len(self.games) if self.games else 0
         return {
             'id': self.id,
             'name': self.name,
             'description': self.description,
-            'game_count': len(self.games) if self.games else 0
+            'game_count': game_count
         }
\ No newline at end of file
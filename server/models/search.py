@@ -0,0 +1,81 @@
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from sqlalchemy import DDL, Connection, column, event, inspect, table, text
+from .game import Game
+
+# External-content FTS5 index over games.title and games.description. The
+# rows live in the games table; triggers keep the index in step with it.
+games_fts = table('games_fts', column('rowid'), column('rank'), column('games_fts'))
+
+_INSERT_TRIGGER = """CREATE TRIGGER IF NOT EXISTS games_fts_after_insert AFTER INSERT ON games BEGIN
+        INSERT INTO games_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END"""
+
+_CREATE_STATEMENTS: list[str] = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS games_fts USING fts5(
+        title, description, content='games', content_rowid='id'
+    )""",
+    _INSERT_TRIGGER,
+    """CREATE TRIGGER IF NOT EXISTS games_fts_after_delete AFTER DELETE ON games BEGIN
+        INSERT INTO games_fts(games_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS games_fts_after_update AFTER UPDATE OF title, description ON games BEGIN
+        INSERT INTO games_fts(games_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO games_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+]
+
+for _statement in _CREATE_STATEMENTS:
+    event.listen(Game.__table__, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
+event.listen(Game.__table__, 'before_drop', DDL('DROP TABLE IF EXISTS games_fts').execute_if(dialect='sqlite'))
+
+
+def ensure_search_index(connection: Connection) -> bool:
+    """
+    Adds the search index to a database whose games table predates it and
+    fills it from the existing rows. Returns True when the index was created.
+    """
+    if connection.dialect.name != 'sqlite' or inspect(connection).has_table('games_fts'):
+        return False
+
+    for statement in _CREATE_STATEMENTS:
+        connection.execute(text(statement))
+    connection.execute(text("INSERT INTO games_fts(games_fts) VALUES ('rebuild')"))
+    return True
+
+
+@contextmanager
+def search_index_suspended(connection: Connection) -> Iterator[None]:
+    """
+    Stops indexing inserted games row by row and rebuilds the index in one
+    pass once the block completes. Rebuilding is several times faster than
+    per-row trigger work for bulk loads, but rereads the whole games table.
+    """
+    if connection.dialect.name != 'sqlite' or not inspect(connection).has_table('games_fts'):
+        yield
+        return
+
+    connection.execute(text('DROP TRIGGER IF EXISTS games_fts_after_insert'))
+    try:
+        yield
+    finally:
+        connection.execute(text(_INSERT_TRIGGER))
+    connection.execute(text("INSERT INTO games_fts(games_fts) VALUES ('rebuild')"))
+
+
+def build_match_expression(search: str) -> str | None:
+    """
+    Turns free text into an FTS5 query: every word must match, and the last
+    word also matches as a prefix so results appear while the user types.
+    Words are quoted so FTS5 operators in user input are treated literally.
+    Returns None when the text has no searchable words.
+    """
+    words = re.findall(r'\w+', search)
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += '*'
+    return ' '.join(terms)
@@ -1,19 +1,34 @@
 from flask import jsonify, Response, Blueprint
-from models import db, Category
+from models import db, Category, Game
+from sqlalchemy import func, select
+from sqlalchemy.orm import Query
 from typing import Any
+from utils.http_cache import conditional_get
 
 # Create a Blueprint for categories routes
 categories_bp = Blueprint('categories', __name__)
 
 
+def get_categories_base_query() -> Query:
+    # Count games per row with a correlated subquery, which SQLite answers
+    # from the covering ix_games_category_id index instead of loading any games
+    game_count = select(func.count(Game.id)).where(
+        Game.category_id == Category.id
+    ).scalar_subquery()
+    return db.session.query(Category, game_count.label('game_count'))
+
+
 @categories_bp.route('/api/categories', methods=['GET'])
+@conditional_get
 def get_categories() -> Response:
     """Get all categories for filter dropdowns.
     
     Returns:
         JSON array of categories with id, name, description, and game_count
     """
-    categories = db.session.query(Category).order_by(Category.name).all()
-    categories_list: list[dict[str, Any]] = [category.to_dict() for category in categories]
+    categories = get_categories_base_query().order_by(Category.name).all()
+    categories_list: list[dict[str, Any]] = [
+        category.to_dict(game_count=game_count) for category, game_count in categories
+    ]
     
     return jsonify(categories_list)
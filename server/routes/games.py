@@ -1,7 +1,14 @@
-from flask import jsonify, Response, Blueprint, request
-from models import db, Game, Publisher, Category
-from sqlalchemy.orm import Query
+from collections.abc import Collection, Iterator
+from flask import jsonify, Response, Blueprint, request, current_app, stream_with_context
+from models import db, Game, Publisher, Category, games_fts, build_match_expression
+from sqlalchemy import func, or_, tuple_, ColumnElement, UnaryExpression
+from sqlalchemy.orm import Query, InstrumentedAttribute, contains_eager, load_only, undefer
 from typing import Any
+from utils.catalog_snapshot import get_catalog_snapshot, snapshot_response
+from utils.detail_cache import GameDetail, get_game_detail_cache
+from utils.http_cache import conditional_get
+from utils.pagination import encode_cursor, decode_cursor, is_sqlite_integer, InvalidCursorError
+from utils.query_cache import get_query_caches
 
 # Create a Blueprint for games routes
 games_bp = Blueprint('games', __name__)
@@ -10,70 +17,490 @@ games_bp = Blueprint('games', __name__)
 DEFAULT_LIMIT = 12
 MAX_LIMIT = 100
 
-def get_games_base_query() -> Query:
-    return db.session.query(Game).join(
-        Publisher, 
-        Game.publisher_id == Publisher.id, 
-        isouter=True
-    ).join(
-        Category, 
-        Game.category_id == Category.id, 
-        isouter=True
-    )
+# Columns get_games can sort by; a leading '-' sorts descending. Ties are
+# broken by id in the same direction, so each order walks an index on
+# (column, id) and cursors can seek straight into it.
+SORT_COLUMNS: dict[str, InstrumentedAttribute] = {
+    'id': Game.id,
+    'title': Game.title,
+    'star_rating': Game.star_rating,
+}
+DEFAULT_SORT = 'id'
+
+# Maximum number of ids accepted by the batch lookup
+MAX_BATCH_IDS = 100
+
+# Rows fetched from SQLite and encoded per chunk of the NDJSON export
+EXPORT_BATCH_SIZE = 1000
+
+# Game columns read by each scalar field a client can select with fields=
+FIELD_COLUMNS = {
+    'title': Game.title,
+    'description': Game.description,
+    'starRating': Game.star_rating,
+}
+
+def get_games_base_query(fields: Collection[str] | None = None) -> Query:
+    # Populate publisher and category from the joined rows so to_dict()
+    # doesn't issue a lazy SELECT per game. With a fields selection only the
+    # matching game columns are read and unrequested relations aren't joined.
+    query = db.session.query(Game)
+    if fields is not None:
+        query = query.options(load_only(Game.id, *[FIELD_COLUMNS[field] for field in fields if field in FIELD_COLUMNS]))
+    if fields is None or 'publisher' in fields:
+        query = query.join(
+            Publisher, 
+            Game.publisher_id == Publisher.id, 
+            isouter=True
+        ).options(contains_eager(Game.publisher).load_only(Publisher.id, Publisher.name))
+    if fields is None or 'category' in fields:
+        query = query.join(
+            Category, 
+            Game.category_id == Category.id, 
+            isouter=True
+        ).options(contains_eager(Game.category).load_only(Category.id, Category.name))
+    return query
+
+def get_games_filters(category_id: int | None, publisher_id: int | None) -> list[ColumnElement[bool]]:
+    filters: list[ColumnElement[bool]] = []
+    if category_id is not None:
+        filters.append(Game.category_id == category_id)
+    if publisher_id is not None:
+        filters.append(Game.publisher_id == publisher_id)
+    return filters
+
+def get_page_args() -> tuple[int, int]:
+    limit: int = max(min(request.args.get('limit', DEFAULT_LIMIT, type=int), MAX_LIMIT), 0)
+    offset: int = max(request.args.get('offset', 0, type=int), 0)
+    return limit, offset
+
+def get_fields_arg() -> set[str] | None:
+    """Parse the comma-separated fields= parameter; id is always included.
+    Returns None when the parameter is absent and raises ValueError for
+    names to_dict() doesn't produce."""
+    value: str | None = request.args.get('fields')
+    if value is None:
+        return None
+    fields = {name.strip() for name in value.split(',') if name.strip()}
+    unknown = fields.difference(Game.SERIALIZED_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return fields | {'id'}
+
+def is_total_requested() -> bool:
+    return request.args.get('include_total', 'true').lower() not in ('false', '0')
+
+def fetch_page(query: Query, limit: int) -> tuple[list[Game], bool]:
+    # Fetch one extra row to learn whether another page follows
+    games = query.limit(limit + 1).all()
+    return games[:limit], len(games) > limit
+
+def get_sort_arg() -> tuple[str, bool]:
+    """Parse sort=, e.g. -star_rating, into (column name, descending).
+    Raises ValueError for columns not in SORT_COLUMNS."""
+    sort: str = request.args.get('sort', DEFAULT_SORT)
+    name = sort.removeprefix('-')
+    if name not in SORT_COLUMNS:
+        raise ValueError(f"Unknown sort: {sort}")
+    return name, sort.startswith('-')
+
+def get_sort_order(name: str, descending: bool) -> list[UnaryExpression]:
+    columns = [Game.id] if name == 'id' else [SORT_COLUMNS[name], Game.id]
+    return [column.desc() if descending else column.asc() for column in columns]
+
+def get_cursor_position(game: Game, name: str) -> dict[str, Any]:
+    position: dict[str, Any] = {'id': game.id}
+    if name != 'id':
+        position['sort'] = name
+        position['value'] = getattr(game, SORT_COLUMNS[name].key)
+    return position
+
+def get_seek_conditions(name: str, descending: bool, position: dict[str, Any]) -> list[ColumnElement[bool]]:
+    """Conditions selecting the rows that follow position in the sort order.
+    
+    SQLite sorts NULLs first ascending and last descending, and row value
+    comparisons never match NULL. Rather than OR-ing the NULL rows in,
+    which turns the index seek into a scan, a nullable column yields one
+    condition per run (non-NULL values, NULLs) to be read in order.
+    
+    Raises InvalidCursorError when position was taken from another sort.
+    """
+    if position.get('sort', DEFAULT_SORT) != name:
+        raise InvalidCursorError("Cursor does not match sort")
+    after_id = Game.id < position['id'] if descending else Game.id > position['id']
+    if name == 'id':
+        return [after_id]
+    
+    column = SORT_COLUMNS[name]
+    value = position.get('value')
+    nullable: bool = Game.__table__.c[column.key].nullable
+    if value is None:
+        if not nullable:
+            raise InvalidCursorError("Invalid cursor")
+        # In the NULL run the order is by id alone
+        return [column.is_(None) & after_id] if descending else [column.is_(None) & after_id, column.is_not(None)]
+    
+    expected_types = (str,) if name == 'title' else (int, float)
+    if not isinstance(value, expected_types) or isinstance(value, bool):
+        raise InvalidCursorError("Invalid cursor")
+    if isinstance(value, int) and not is_sqlite_integer(value):
+        raise InvalidCursorError("Invalid cursor")
+    position_key = tuple_(value, position['id'])
+    if descending:
+        after_value = tuple_(column, Game.id) < position_key
+        return [after_value, column.is_(None)] if nullable else [after_value]
+    return [tuple_(column, Game.id) > position_key]
+
+def fetch_seek_page(query: Query, conditions: list[ColumnElement[bool]], limit: int) -> tuple[list[Game], bool]:
+    # Read each run in turn until one row past the page has been found;
+    # pages that don't reach the end of a run take a single query
+    games: list[Game] = []
+    for condition in conditions:
+        games += query.filter(condition).limit(limit + 1 - len(games)).all()
+        if len(games) > limit:
+            break
+    return games[:limit], len(games) > limit
 
 @games_bp.route('/api/games', methods=['GET'])
-def get_games() -> Response:
+@conditional_get
+def get_games() -> tuple[Response, int] | Response:
     """Get games with optional filtering and pagination.
     
+    Games are ordered by id unless sort names another column, with id
+    breaking ties. Pages can be requested either by offset or by an opaque
+    cursor taken from the previous page's nextCursor; cursor pages seek
+    straight to the last seen position, so they stay fast at any depth.
+    
+    hasMore is worked out by fetching one row past the page, so the total is
+    only needed for display. It is cached per filter combination until games
+    change, and can be skipped entirely with include_total=false.
+    
     Query Parameters:
         category_id (int, optional): Filter by category ID
         publisher_id (int, optional): Filter by publisher ID
         limit (int, optional): Number of games to return (default: 12, max: 100)
         offset (int, optional): Number of games to skip (default: 0)
+        sort (str, optional): id, title or star_rating, prefixed with - for
+            descending (default: id)
+        cursor (str, optional): nextCursor from a previous page; takes precedence over offset
+        include_total (bool, optional): Set to false to skip counting; total is then null
+        fields (str, optional): Comma-separated game fields to return, e.g.
+            title,starRating; only those columns are read (id is always included)
     
     Returns:
-        JSON with games array, total count, and hasMore flag
+        JSON with games array, total count, hasMore flag and nextCursor
     """
-    query = get_games_base_query()
+    try:
+        fields = get_fields_arg()
+        sort_name, descending = get_sort_arg()
+    except ValueError as error:
+        return jsonify({"error": str(error)}), 400
     
     # Apply optional filters
     category_id: int | None = request.args.get('category_id', type=int)
     publisher_id: int | None = request.args.get('publisher_id', type=int)
+    filters = get_games_filters(category_id, publisher_id)
     
-    if category_id is not None:
-        query = query.filter(Game.category_id == category_id)
-    if publisher_id is not None:
-        query = query.filter(Game.publisher_id == publisher_id)
+    limit, offset = get_page_args()
+    cursor: str | None = request.args.get('cursor')
+    
+    position: dict[str, Any] | None = None
+    if cursor:
+        try:
+            position = decode_cursor(cursor)
+            conditions = get_seek_conditions(sort_name, descending, position)
+        except InvalidCursorError:
+            return jsonify({"error": "Invalid cursor"}), 400
+    
+    # Full games in id order can be sliced from the in-memory snapshot when enabled
+    if fields is None and sort_name == DEFAULT_SORT and not descending:
+        snapshot = get_catalog_snapshot()
+        if snapshot is not None:
+            return snapshot_response(snapshot.get_page_json(
+                category_id, publisher_id, limit, offset,
+                position['id'] if position is not None else None, is_total_requested()
+            ))
+    
+    query = get_games_base_query(fields).filter(*filters)
+    if fields is not None:
+        # The next cursor needs the sort value even when it isn't returned
+        query = query.options(undefer(SORT_COLUMNS[sort_name]))
     
-    # Get total count before pagination
-    total: int = query.count()
+    # Get total count before pagination, unless the client opted out
+    total: int | None = None
+    if is_total_requested():
+        total = get_query_caches().game_counts.get_or_compute(
+            (category_id, publisher_id),
+            lambda: db.session.query(func.count(Game.id)).filter(*filters).scalar()
+        )
     
     # Apply pagination
-    limit: int = min(request.args.get('limit', DEFAULT_LIMIT, type=int), MAX_LIMIT)
-    offset: int = max(request.args.get('offset', 0, type=int), 0)
+    query = query.order_by(*get_sort_order(sort_name, descending))
     
-    games = query.offset(offset).limit(limit).all()
-    games_list: list[dict[str, Any]] = [game.to_dict() for game in games]
+    if position is not None:
+        games, has_more = fetch_seek_page(query, conditions, limit)
+    else:
+        games, has_more = fetch_page(query.offset(offset), limit)
+    
+    games_list: list[dict[str, Any]] = [game.to_dict(fields) for game in games]
+    next_cursor: str | None = None
+    if has_more and games:
+        next_cursor = encode_cursor(get_cursor_position(games[-1], sort_name))
+    
+    return jsonify({
+        'games': games_list,
+        'total': total,
+        'hasMore': has_more,
+        'nextCursor': next_cursor
+    })
+
+@games_bp.route('/api/games/search', methods=['GET'])
+@conditional_get
+def search_games() -> tuple[Response, int] | Response:
+    """Full-text search over game titles and descriptions, best matches first.
+    
+    Results are ranked with bm25 through the games_fts index and use the same
+    pagination envelope as get_games. Because ranks are not a stable sort
+    key, nextCursor carries the offset of the following page.
+    
+    Query Parameters:
+        q (str): Words to search for; the last word also matches as a prefix
+        category_id (int, optional): Filter by category ID
+        publisher_id (int, optional): Filter by publisher ID
+        limit (int, optional): Number of games to return (default: 12, max: 100)
+        offset (int, optional): Number of games to skip (default: 0)
+        cursor (str, optional): nextCursor from a previous page; takes precedence over offset
+        include_total (bool, optional): Set to false to skip counting; total is then null
+    
+    Returns:
+        JSON with games array, total count, hasMore flag and nextCursor
+    """
+    match: str | None = build_match_expression(request.args.get('q', ''))
+    if match is None:
+        return jsonify({"error": "Search query is required"}), 400
+    
+    category_id: int | None = request.args.get('category_id', type=int)
+    publisher_id: int | None = request.args.get('publisher_id', type=int)
+    filters = [
+        games_fts.c.games_fts.op('MATCH')(match),
+        *get_games_filters(category_id, publisher_id)
+    ]
     
-    # Calculate hasMore
-    has_more: bool = offset + len(games_list) < total
+    query = get_games_base_query().join(games_fts, games_fts.c.rowid == Game.id).filter(*filters)
+    
+    total: int | None = None
+    if is_total_requested():
+        total = get_query_caches().search_counts.get_or_compute(
+            (match, category_id, publisher_id),
+            lambda: db.session.query(func.count(Game.id)).join(
+                games_fts, games_fts.c.rowid == Game.id
+            ).filter(*filters).scalar()
+        )
+    
+    limit, offset = get_page_args()
+    cursor: str | None = request.args.get('cursor')
+    
+    if cursor:
+        try:
+            position = decode_cursor(cursor)
+        except InvalidCursorError:
+            return jsonify({"error": "Invalid cursor"}), 400
+        if not is_sqlite_integer(position.get('offset')) or position['offset'] < 0:
+            return jsonify({"error": "Invalid cursor"}), 400
+        offset = position['offset']
+    
+    # FTS5's rank column is bm25(); lower values are better matches
+    query = query.order_by(games_fts.c.rank, Game.id).offset(offset)
+    games, has_more = fetch_page(query, limit)
+    
+    games_list: list[dict[str, Any]] = [game.to_dict() for game in games]
+    next_cursor: str | None = None
+    if has_more and games:
+        next_cursor = encode_cursor({'id': games[-1].id, 'offset': offset + len(games)})
     
     return jsonify({
         'games': games_list,
         'total': total,
-        'hasMore': has_more
+        'hasMore': has_more,
+        'nextCursor': next_cursor
     })
 
+@games_bp.route('/api/games/export', methods=['GET'])
+@conditional_get
+def export_games() -> Response:
+    """Stream every game as newline-delimited JSON, ordered by id.
+    
+    Rows are read with yield_per in batches of EXPORT_BATCH_SIZE and each
+    batch is encoded and sent before the next is fetched, so memory stays
+    flat however large the catalog is. Each line has the same shape as
+    get_game.
+    
+    Query Parameters:
+        category_id (int, optional): Filter by category ID
+        publisher_id (int, optional): Filter by publisher ID
+    
+    Returns:
+        application/x-ndjson stream with one game per line
+    """
+    category_id: int | None = request.args.get('category_id', type=int)
+    publisher_id: int | None = request.args.get('publisher_id', type=int)
+    
+    query = get_games_base_query().filter(
+        *get_games_filters(category_id, publisher_id)
+    ).order_by(Game.id).yield_per(EXPORT_BATCH_SIZE)
+    
+    def generate() -> Iterator[str]:
+        lines: list[str] = []
+        for game in query:
+            lines.append(current_app.json.dumps(game.to_dict()))
+            if len(lines) >= EXPORT_BATCH_SIZE:
+                yield '\n'.join(lines) + '\n'
+                lines = []
+        if lines:
+            yield '\n'.join(lines) + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+def get_facet_counts(category_id: int | None, publisher_id: int | None) -> dict[str, Any]:
+    """Count games per category and per publisher with one grouped query.
+    
+    Facets are disjunctive: category counts apply only the publisher filter
+    and publisher counts only the category filter, so each option shows how
+    many games selecting it would return. The query groups games by
+    (category, publisher) pair and the facets are summed from those rows.
+    """
+    query = db.session.query(
+        Game.category_id, Category.name, Game.publisher_id, Publisher.name, func.count(Game.id)
+    ).join(
+        Category, Game.category_id == Category.id
+    ).join(
+        Publisher, Game.publisher_id == Publisher.id
+    ).group_by(Game.category_id, Game.publisher_id)
+    # Only rows matching neither filter count toward no facet
+    if category_id is not None and publisher_id is not None:
+        query = query.filter(or_(Game.category_id == category_id, Game.publisher_id == publisher_id))
+    rows = query.all()
+    
+    categories: dict[int, dict[str, Any]] = {}
+    publishers: dict[int, dict[str, Any]] = {}
+    total = 0
+    for row_category_id, category_name, row_publisher_id, publisher_name, count in rows:
+        category_matches = category_id is None or row_category_id == category_id
+        publisher_matches = publisher_id is None or row_publisher_id == publisher_id
+        if publisher_matches:
+            facet = categories.setdefault(row_category_id, {'id': row_category_id, 'name': category_name, 'count': 0})
+            facet['count'] += count
+        if category_matches:
+            facet = publishers.setdefault(row_publisher_id, {'id': row_publisher_id, 'name': publisher_name, 'count': 0})
+            facet['count'] += count
+        if category_matches and publisher_matches:
+            total += count
+    
+    return {
+        'categories': sorted(categories.values(), key=lambda facet: facet['name']),
+        'publishers': sorted(publishers.values(), key=lambda facet: facet['name']),
+        'total': total
+    }
+
+@games_bp.route('/api/games/facets', methods=['GET'])
+@conditional_get
+def get_games_facets() -> Response:
+    """Get per-category and per-publisher game counts for the current filters.
+    
+    Results are cached per filter combination until games change.
+    
+    Query Parameters:
+        category_id (int, optional): Category currently filtered on
+        publisher_id (int, optional): Publisher currently filtered on
+    
+    Returns:
+        JSON with categories and publishers as {id, name, count}, sorted by
+        name and omitting options with no games, and the total matching both filters
+    """
+    category_id: int | None = request.args.get('category_id', type=int)
+    publisher_id: int | None = request.args.get('publisher_id', type=int)
+    
+    facets = get_query_caches().facets.get_or_compute(
+        (category_id, publisher_id),
+        lambda: get_facet_counts(category_id, publisher_id)
+    )
+    return jsonify(facets)
+
+@games_bp.route('/api/games/batch', methods=['GET'])
+@conditional_get
+def get_games_batch() -> tuple[Response, int] | Response:
+    """Get several games by id with a single IN (...) query.
+    
+    Query Parameters:
+        ids (str): Comma-separated game ids, or the parameter repeated
+            (at most MAX_BATCH_IDS distinct ids)
+    
+    Returns:
+        JSON with games in the requested order, each shaped like get_game,
+        and the ids that were not found
+    """
+    ids: list[int] = []
+    for value in ','.join(request.args.getlist('ids')).split(','):
+        value = value.strip()
+        if not value:
+            continue
+        try:
+            game_id = int(value)
+        except ValueError:
+            game_id = None
+        if not is_sqlite_integer(game_id):
+            return jsonify({"error": "ids must be a comma-separated list of integers"}), 400
+        if game_id not in ids:
+            ids.append(game_id)
+    
+    if not ids:
+        return jsonify({"error": "ids is required"}), 400
+    if len(ids) > MAX_BATCH_IDS:
+        return jsonify({"error": f"At most {MAX_BATCH_IDS} ids can be requested at once"}), 400
+    
+    games_by_id = {game.id: game for game in get_games_base_query().filter(Game.id.in_(ids)).all()}
+    
+    return jsonify({
+        'games': [games_by_id[game_id].to_dict() for game_id in ids if game_id in games_by_id],
+        'missing': [game_id for game_id in ids if game_id not in games_by_id]
+    })
+
+def render_game_detail(id: int) -> GameDetail:
+    """Serializes the get_game response for the detail cache, including 404s"""
+    game = get_games_base_query().filter(Game.id == id).first()
+    if not game:
+        return GameDetail(404, current_app.json.dumps({"error": "Game not found"}).encode('utf-8') + b'\n')
+    body = current_app.json.dumps(game.to_dict()).encode('utf-8') + b'\n'
+    return GameDetail(200, body, game.publisher_id, game.category_id)
+
 @games_bp.route('/api/games/<int:id>', methods=['GET'])
+@conditional_get
 def get_game(id: int) -> tuple[Response, int] | Response:
+    try:
+        fields = get_fields_arg()
+    except ValueError as error:
+        return jsonify({"error": str(error)}), 400
+    
+    snapshot = get_catalog_snapshot() if fields is None else None
+    if snapshot is not None:
+        game_json = snapshot.get_game_json(id)
+        if game_json is None:
+            return jsonify({"error": "Game not found"}), 404
+        return snapshot_response(game_json + b'\n')
+    
+    detail_cache = get_game_detail_cache() if fields is None else None
+    if detail_cache is not None:
+        detail = detail_cache.get_or_compute(id, lambda: render_game_detail(id))
+        return current_app.response_class(detail.body, status=detail.status, mimetype=current_app.json.mimetype)
+    
     # Use the base query and add filter for specific game
-    game_query = get_games_base_query().filter(Game.id == id).first()
+    game_query = get_games_base_query(fields).filter(Game.id == id).first()
     
     # Return 404 if game not found
     if not game_query: 
         return jsonify({"error": "Game not found"}), 404
     
     # Convert the result using the model's to_dict method
-    game = game_query.to_dict()
+    game = game_query.to_dict(fields)
     
     return jsonify(game)
@@ -0,0 +1,20 @@
+from flask import Response, Blueprint
+from utils.catalog_snapshot import get_catalog_snapshot_store
+from utils.detail_cache import get_game_detail_cache
+from utils.metrics import get_request_metrics
+
+# Create a Blueprint for the metrics route
+metrics_bp = Blueprint('metrics', __name__)
+
+
+@metrics_bp.route('/metrics', methods=['GET'])
+def get_metrics() -> Response:
+    """Per-route request metrics in the Prometheus text exposition format"""
+    body = get_request_metrics().render_prometheus()
+    detail_cache = get_game_detail_cache()
+    if detail_cache is not None:
+        body += detail_cache.render_prometheus()
+    snapshot_store = get_catalog_snapshot_store()
+    if snapshot_store is not None:
+        body += snapshot_store.render_prometheus()
+    return Response(body, mimetype='text/plain; version=0.0.4')
@@ -1,19 +1,34 @@
 from flask import jsonify, Response, Blueprint
-from models import db, Publisher
+from models import db, Publisher, Game
+from sqlalchemy import func, select
+from sqlalchemy.orm import Query
 from typing import Any
+from utils.http_cache import conditional_get
 
 # Create a Blueprint for publishers routes
 publishers_bp = Blueprint('publishers', __name__)
 
 
+def get_publishers_base_query() -> Query:
+    # Count games per row with a correlated subquery, which SQLite answers
+    # from the covering ix_games_publisher_id index instead of loading any games
+    game_count = select(func.count(Game.id)).where(
+        Game.publisher_id == Publisher.id
+    ).scalar_subquery()
+    return db.session.query(Publisher, game_count.label('game_count'))
+
+
 @publishers_bp.route('/api/publishers', methods=['GET'])
+@conditional_get
 def get_publishers() -> Response:
     """Get all publishers for filter dropdowns.
     
     Returns:
         JSON array of publishers with id, name, description, and game_count
     """
-    publishers = db.session.query(Publisher).order_by(Publisher.name).all()
-    publishers_list: list[dict[str, Any]] = [publisher.to_dict() for publisher in publishers]
+    publishers = get_publishers_base_query().order_by(Publisher.name).all()
+    publishers_list: list[dict[str, Any]] = [
+        publisher.to_dict(game_count=game_count) for publisher, game_count in publishers
+    ]
     
     return jsonify(publishers_list)
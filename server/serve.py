@@ -0,0 +1,137 @@
+"""
+Production entry point: serves the API with gunicorn worker processes.
+
+    python serve.py --workers 4 --port 5100
+
+The app is built once in the parent, which also builds the catalog
+snapshot when enabled, and handed to gunicorn preloaded, so workers start
+without building their own. The parent binds the listening socket,
+gunicorn forks the workers, which all accept connections from it, and
+restarts any worker that exits. SIGTERM or Ctrl-C stops them all.
+
+Every API endpoint only reads, so by default workers open the database
+read-only (SQLite URI mode=ro). Run `flask --app app init-db` beforehand,
+since a read-only server can't create the schema. Each worker holds its
+own connection pool, caches and /metrics counters. Every sample carries
+the worker's pid label, and a scrape reaches whichever worker accepts it,
+so aggregate with `sum without (pid)` over rates. Commits made by other
+processes, such as reseeding, bump each worker's data version within
+DATA_VERSION_POLL_INTERVAL seconds, which invalidates its ETags, query
+caches and catalog snapshot.
+
+gunicorn needs a POSIX system; elsewhere a single process is served with
+Werkzeug's development server, which is only meant for local use.
+"""
+import argparse
+import logging
+import os
+import socket
+import sys
+from typing import Any
+from flask import Flask
+from werkzeug.serving import make_server, WSGIRequestHandler
+from app import create_app
+from models import db
+from utils.database import get_connection_string, get_read_only_uri
+
+# gunicorn imports fcntl, so it isn't available on Windows
+try:
+    from gunicorn.app.base import BaseApplication
+except ImportError:
+    BaseApplication = None
+
+logger = logging.getLogger('tailspin.serve')
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 5100
+DEFAULT_THREADS = 4
+LISTEN_BACKLOG = 1024
+# Seconds a worker may spend on one request before gunicorn restarts it
+WORKER_TIMEOUT = 30
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    """Skips the per-request access log line, which costs throughput under load"""
+
+    def log_request(self, code: int | str = '-', size: int | str = '-') -> None:
+        pass
+
+
+def build_serving_app(database: str | None, read_only: bool, profile: str | None) -> Flask:
+    database_uri = f'sqlite:///{os.path.abspath(database)}' if database else get_connection_string()
+    config: dict[str, Any] = {
+        'SQLALCHEMY_DATABASE_URI': get_read_only_uri(database_uri) if read_only else database_uri,
+        'DB_PROFILE': profile,
+    }
+    return create_app(config)
+
+
+def get_gunicorn_options(listener: socket.socket, workers: int, threads: int, access_log: bool) -> dict[str, Any]:
+    return {
+        'bind': [f'fd://{listener.fileno()}'],
+        'workers': workers,
+        # The threaded worker keeps connections alive; the sync one closes them after each response
+        'worker_class': 'gthread' if threads > 1 else 'sync',
+        'threads': threads,
+        'backlog': LISTEN_BACKLOG,
+        'timeout': WORKER_TIMEOUT,
+        'accesslog': '-' if access_log else None,
+        'preload_app': True,
+    }
+
+
+def run_development_server(app: Flask, listener: socket.socket, access_log: bool) -> None:
+    host, port = listener.getsockname()[:2]
+    handler = WSGIRequestHandler if access_log else QuietRequestHandler
+    server = make_server(host, port, app, threaded=True, request_handler=handler, fd=listener.fileno())
+    server.serve_forever()
+
+
+def serve(app: Flask, host: str, port: int, workers: int, threads: int = DEFAULT_THREADS,
+          access_log: bool = False) -> None:
+    listener = socket.create_server((host, port), backlog=LISTEN_BACKLOG)
+    logger.info('Serving on http://%s:%d with %d worker(s)', host, listener.getsockname()[1], workers)
+
+    if BaseApplication is None:
+        logger.warning("gunicorn isn't available, serving one process with Werkzeug's development server")
+        run_development_server(app, listener, access_log)
+        return
+
+    # Connections opened while building the app (e.g. for the catalog
+    # snapshot) must not be shared with the workers
+    with app.app_context():
+        db.engine.dispose()
+
+    class PreloadedApplication(BaseApplication):
+        def load_config(self) -> None:
+            for key, value in get_gunicorn_options(listener, workers, threads, access_log).items():
+                self.cfg.set(key, value)
+            # Newer gunicorn versions open a control socket in the home directory, which
+            # several servers on one machine would fight over
+            if 'control_socket_disable' in self.cfg.settings:
+                self.cfg.set('control_socket_disable', True)
+
+        def load(self) -> Flask:
+            return app
+
+    # gunicorn takes over the listening socket and exits the process when stopped
+    PreloadedApplication().run()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Serve the Tailspin Toys API from several worker processes")
+    parser.add_argument('--host', default=DEFAULT_HOST, help="Interface to listen on")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="Port to listen on (0 picks a free one)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Worker processes (default: CPU count)")
+    parser.add_argument('--threads', type=int, default=DEFAULT_THREADS,
+                        help="Request threads per worker; 1 uses gunicorn's sync worker")
+    parser.add_argument('--database', default=None, help="SQLite database file (default: data/tailspin-toys.db)")
+    parser.add_argument('--read-only', action=argparse.BooleanOptionalAction, default=True,
+                        help="Open the database with SQLite's read-only URI mode")
+    parser.add_argument('--profile', default=None, help="Database engine profile (default: TAILSPIN_DB_PROFILE or 'default')")
+    parser.add_argument('--access-log', action='store_true', help="Log a line per request")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(process)d %(levelname)s %(message)s', stream=sys.stderr)
+    serving_app = build_serving_app(args.database, args.read_only, args.profile)
+    serve(serving_app, args.host, args.port, args.workers, args.threads, args.access_log)
@@ -0,0 +1,136 @@
+"""
+Helpers that guard route tests against query regressions.
+
+SQLRecorder captures every SQL statement an engine executes. QueryBudgetMixin
+uses it to fail a test when a request issues more statements than its budget
+(an N+1) or when the EXPLAIN QUERY PLAN of any statement differs from the
+snapshot in query_plans.json (e.g. an index lookup turned into a full scan).
+
+After an intended change to queries or indexes, refresh the snapshot with:
+
+    UPDATE_QUERY_PLANS=1 python -m unittest discover -s tests -p "*.py"
+"""
+import json
+import os
+import re
+from dataclasses import dataclass
+from typing import Any
+from flask import Flask, Response
+from flask.testing import FlaskClient
+from sqlalchemy import Engine, event
+from models import db
+
+QUERY_PLANS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'query_plans.json')
+UPDATE_ENV_VAR = 'UPDATE_QUERY_PLANS'
+
+# SQLAlchemy creates a table's indexes in set order, and SQLite picks between
+# equally good indexes by creation order, so snapshots leave index names out
+# and keep the access path (SCAN/SEARCH, COVERING, constrained columns)
+_INDEX_NAME_PATTERN = re.compile(r'(INDEX) [A-Za-z_]\w*')
+
+
+@dataclass
+class RecordedStatement:
+    statement: str
+    parameters: Any
+    executemany: bool
+
+
+class SQLRecorder:
+    """Context manager recording the statements executed on an engine"""
+
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+        self.statements: list[RecordedStatement] = []
+
+    def _record(self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any,
+                executemany: bool) -> None:
+        self.statements.append(RecordedStatement(statement, parameters, executemany))
+
+    def __enter__(self) -> 'SQLRecorder':
+        event.listen(self.engine, 'before_cursor_execute', self._record)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        event.remove(self.engine, 'before_cursor_execute', self._record)
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+    def explain(self) -> list[list[str]]:
+        """
+        Returns the EXPLAIN QUERY PLAN of each recorded query, one line per
+        plan step, indented by its depth in the plan tree, without index names.
+        """
+        plans: list[list[str]] = []
+        with self.engine.connect() as connection:
+            for recorded in self.statements:
+                if recorded.executemany or not recorded.statement.lstrip().upper().startswith(('SELECT', 'WITH')):
+                    continue
+                rows = connection.exec_driver_sql(
+                    f'EXPLAIN QUERY PLAN {recorded.statement}', recorded.parameters
+                ).all()
+                depths: dict[int, int] = {0: -1}
+                plan: list[str] = []
+                for node_id, parent_id, _, detail in rows:
+                    depths[node_id] = depths.get(parent_id, -1) + 1
+                    plan.append('  ' * depths[node_id] + _INDEX_NAME_PATTERN.sub(r'\1', detail))
+                plans.append(plan)
+        return plans
+
+
+def load_query_plans() -> dict[str, list[list[str]]]:
+    if not os.path.exists(QUERY_PLANS_PATH):
+        return {}
+    with open(QUERY_PLANS_PATH, encoding='utf-8') as plans_file:
+        return json.load(plans_file)
+
+
+def save_query_plan(key: str, plans: list[list[str]]) -> None:
+    snapshot = load_query_plans()
+    snapshot[key] = plans
+    with open(QUERY_PLANS_PATH, mode='w', encoding='utf-8') as plans_file:
+        json.dump(snapshot, plans_file, indent=2, sort_keys=True)
+        plans_file.write('\n')
+
+
+class QueryBudgetMixin:
+    """
+    Mixin for unittest.TestCase classes that have self.app and self.client.
+    Snapshot keys are '<TestCase class>.<name>'.
+    """
+    app: Flask
+    client: FlaskClient
+
+    def get_with_recorder(self, path: str, headers: dict[str, str] | None = None) -> tuple[Response, SQLRecorder]:
+        """Serve a request while recording the SQL it issues"""
+        with self.app.app_context():
+            engine = db.engine
+        with SQLRecorder(engine) as recorder:
+            response = self.client.get(path, headers=headers)
+        return response, recorder
+
+    def assertQueryBudget(self, name: str, path: str, max_statements: int) -> Response:
+        """
+        Fails when the request issues more than max_statements statements or
+        when its query plans differ from the snapshot.
+        """
+        response, recorder = self.get_with_recorder(path)
+        self.assertEqual(response.status_code, 200, f'{path} returned {response.status_code}')
+        self.assertLessEqual(
+            len(recorder), max_statements,
+            f'{path} issued {len(recorder)} statements, budget is {max_statements}:\n'
+            + '\n'.join(recorded.statement for recorded in recorder.statements)
+        )
+
+        key = f'{type(self).__name__}.{name}'
+        with self.app.app_context():
+            plans = recorder.explain()
+        if os.environ.get(UPDATE_ENV_VAR):
+            save_query_plan(key, plans)
+            return response
+
+        snapshot = load_query_plans()
+        self.assertIn(key, snapshot, f'No query plan snapshot for {key}; run with {UPDATE_ENV_VAR}=1 to record it')
+        self.assertEqual(plans, snapshot[key], f'Query plan for {path} changed; run with {UPDATE_ENV_VAR}=1 if intended')
+        return response
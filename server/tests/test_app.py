@@ -0,0 +1,114 @@
+import unittest
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+from typing import Dict, Any
+from flask import Flask
+from app import create_app
+from models import db
+from utils.detail_cache import EXTENSION_KEY as DETAIL_CACHE_KEY
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Imports app in a fresh interpreter, reporting the time taken and the
+# number of SQLite connections opened along the way
+IMPORT_PROBE = '''
+import json, sqlite3, time
+connections = []
+connect = sqlite3.connect
+sqlite3.connect = lambda *args, **kwargs: connections.append(args) or connect(*args, **kwargs)
+start = time.perf_counter()
+import app
+print(json.dumps({'seconds': time.perf_counter() - start, 'connections': len(connections)}))
+'''
+
+
+class TestApp(unittest.TestCase):
+    """Test cases for the app factory and startup cost"""
+
+    # Test data
+    TEST_DATA: Dict[str, Any] = {
+        # Cold import of app, dominated by Flask and SQLAlchemy. Preforked
+        # workers pay this once; check `python -X importtime -c "import app"`
+        # if it is exceeded.
+        "import_budget_seconds": 2.0
+    }
+
+    def setUp(self) -> None:
+        """Set up a scratch directory for database files"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'tailspin-toys.db')
+
+    def tearDown(self) -> None:
+        """Clean up scratch files"""
+        self.temp_dir.cleanup()
+
+    def _create_app(self) -> Flask:
+        """Helper method to build an app bound to the scratch database"""
+        app = create_app({'TESTING': True, 'SQLALCHEMY_DATABASE_URI': f'sqlite:///{self.db_path}'})
+        self.addCleanup(self._dispose, app)
+        return app
+
+    def _dispose(self, app: Flask) -> None:
+        """Helper method to close the app's connections"""
+        with app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+
+    def test_import_within_budget(self) -> None:
+        """Test that importing app is fast and doesn't connect to the database"""
+        # Act
+        result = subprocess.run(
+            [sys.executable, '-c', IMPORT_PROBE], cwd=SERVER_DIR, capture_output=True, text=True, check=True
+        )
+        probe = json.loads(result.stdout)
+
+        # Assert
+        self.assertEqual(probe['connections'], 0)
+        self.assertLess(probe['seconds'], self.TEST_DATA["import_budget_seconds"])
+
+    def test_create_app_does_not_open_database(self) -> None:
+        """Test that building the app leaves schema creation to init-db"""
+        # Act
+        app = self._create_app()
+
+        # Assert
+        self.assertIn('games.get_games', app.view_functions)
+        self.assertFalse(os.path.exists(self.db_path))
+
+    def test_init_db_command_creates_schema(self) -> None:
+        """Test that init-db creates the tables and is safe to rerun"""
+        # Arrange
+        app = self._create_app()
+        runner = app.test_cli_runner()
+
+        # Act
+        first = runner.invoke(args=['init-db'])
+        second = runner.invoke(args=['init-db'])
+
+        # Assert
+        self.assertEqual(first.exit_code, 0, first.output)
+        self.assertEqual(second.exit_code, 0, second.output)
+        self.assertIn('0 indexes created', second.output)
+        connection = sqlite3.connect(self.db_path)
+        try:
+            tables = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        finally:
+            connection.close()
+        self.assertTrue({'games', 'categories', 'publishers'} <= tables)
+
+    def test_config_overrides_defaults(self) -> None:
+        """Test that config passed to the factory is applied before the extensions"""
+        # Act
+        app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:', 'GAME_DETAIL_CACHE_SIZE': 0})
+
+        # Assert
+        self.assertEqual(app.config['SQLALCHEMY_DATABASE_URI'], 'sqlite:///:memory:')
+        self.assertNotIn(DETAIL_CACHE_KEY, app.extensions)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,245 @@
+import unittest
+import json
+from typing import Dict, Any
+from unittest import mock
+from flask import Response
+from app import create_app
+from models import Game, Publisher, Category, db
+from utils.catalog_snapshot import get_catalog_snapshot, EXTENSION_KEY
+from utils.database import init_schema
+import utils.catalog_snapshot as catalog_snapshot
+from utils.metrics import get_process_labels
+from tests.query_harness import SQLRecorder
+
+
+class TestCatalogSnapshot(unittest.TestCase):
+    """Test cases for serving games from the in-memory catalog snapshot"""
+
+    # Test data
+    TEST_DATA: Dict[str, Any] = {
+        "publishers": [
+            {"name": "DevGames Inc"},
+            {"name": "Scrum Masters"}
+        ],
+        "categories": [
+            {"name": "Strategy"},
+            {"name": "Card Game"}
+        ],
+        "games": [
+            {"title": "Pipeline Panic", "publisher_index": 0, "category_index": 0, "star_rating": 4.5},
+            {"title": "Agile Adventures", "publisher_index": 1, "category_index": 1, "star_rating": 4.2},
+            {"title": "Merge Mayhem", "publisher_index": 0, "category_index": 1, "star_rating": None}
+        ]
+    }
+
+    # API paths
+    GAMES_API_PATH: str = '/api/games'
+    METRICS_PATH: str = '/metrics'
+
+    # Snapshot rebuilt inside the request; the detail cache is off so detail lookups hit the snapshot or SQLite
+    APP_CONFIG: Dict[str, Any] = {
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+        'CATALOG_SNAPSHOT_ENABLED': True,
+        'CATALOG_SNAPSHOT_BACKGROUND': False,
+        'GAME_DETAIL_CACHE_SIZE': 0
+    }
+
+    def setUp(self) -> None:
+        """Set up test database, seed data and build the snapshot"""
+        self.app = create_app(self.APP_CONFIG)
+        self.client = self.app.test_client()
+
+        init_schema(self.app)
+        with self.app.app_context():
+            self._seed_test_data()
+
+        self.store = self.app.extensions[EXTENSION_KEY]
+        self.store.rebuild()
+
+    def tearDown(self) -> None:
+        """Clean up test database"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _seed_test_data(self) -> None:
+        """Helper method to seed test data"""
+        publishers = [Publisher(**data) for data in self.TEST_DATA["publishers"]]
+        categories = [Category(**data) for data in self.TEST_DATA["categories"]]
+        db.session.add_all(publishers + categories)
+        for data in self.TEST_DATA["games"]:
+            db.session.add(Game(
+                title=data["title"],
+                description=f"{data['title']} is a game about software teams",
+                publisher=publishers[data["publisher_index"]],
+                category=categories[data["category_index"]],
+                star_rating=data["star_rating"]
+            ))
+        db.session.commit()
+
+    def _get_response_data(self, response: Response) -> Any:
+        """Helper method to parse response data"""
+        return json.loads(response.data)
+
+    def _get_from_database(self, path: str) -> Response:
+        """Helper method to serve a request with the snapshot switched off"""
+        store = self.app.extensions.pop(EXTENSION_KEY)
+        try:
+            return self.client.get(path)
+        finally:
+            self.app.extensions[EXTENSION_KEY] = store
+
+    def _get_with_statement_count(self, path: str) -> tuple[Response, int]:
+        """Helper method to count SQL statements issued while serving a request"""
+        with self.app.app_context():
+            engine = db.engine
+        with SQLRecorder(engine) as recorder:
+            response = self.client.get(path)
+        return response, len(recorder)
+
+    def test_snapshot_disabled_by_default(self) -> None:
+        """Test that no snapshot is built unless enabled"""
+        # Arrange
+        config = {key: value for key, value in self.APP_CONFIG.items() if not key.startswith('CATALOG_SNAPSHOT_')}
+
+        # Act
+        app = create_app(config)
+
+        # Assert
+        self.assertNotIn(EXTENSION_KEY, app.extensions)
+        with app.app_context():
+            self.assertIsNone(get_catalog_snapshot())
+            db.engine.dispose()
+
+    def test_snapshot_reports_memory(self) -> None:
+        """Test that the snapshot records its size"""
+        # Assert
+        self.assertEqual(len(self.store.snapshot.games), len(self.TEST_DATA["games"]))
+        self.assertGreater(self.store.snapshot.memory_bytes, 0)
+        # create_app ran before init_schema, so it must not have tried to build
+        self.assertEqual(self.store.failures, 0)
+
+    def test_pages_match_database(self) -> None:
+        """Test that snapshot pages have the same content as database pages"""
+        for query in ['', '?limit=2', '?offset=1&limit=1', '?category_id=2', '?category_id=2&publisher_id=1',
+                      '?publisher_id=2&include_total=false', '?category_id=99', '?offset=10']:
+            with self.subTest(query):
+                # Act
+                response, statement_count = self._get_with_statement_count(f'{self.GAMES_API_PATH}{query}')
+                expected = self._get_from_database(f'{self.GAMES_API_PATH}{query}')
+
+                # Assert
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(statement_count, 0)
+                self.assertEqual(self._get_response_data(response), self._get_response_data(expected))
+
+    def test_cursor_pages_match_database(self) -> None:
+        """Test that following nextCursor through the snapshot visits every game once"""
+        # Arrange
+        data = self._get_response_data(self.client.get(f'{self.GAMES_API_PATH}?limit=1'))
+        ids = [game['id'] for game in data['games']]
+
+        # Act
+        while data['nextCursor']:
+            path = f"{self.GAMES_API_PATH}?limit=1&cursor={data['nextCursor']}"
+            data = self._get_response_data(self.client.get(path))
+            self.assertEqual(data, self._get_response_data(self._get_from_database(path)))
+            ids += [game['id'] for game in data['games']]
+
+        # Assert
+        self.assertEqual(ids, sorted(self.store.snapshot.games))
+
+    def test_game_detail_from_snapshot(self) -> None:
+        """Test that detail lookups, including misses, are served from the snapshot"""
+        # Arrange
+        game_id = next(iter(self.store.snapshot.games))
+
+        # Act
+        response, statement_count = self._get_with_statement_count(f'{self.GAMES_API_PATH}/{game_id}')
+        missing, _ = self._get_with_statement_count(f'{self.GAMES_API_PATH}/999')
+
+        # Assert
+        self.assertEqual(statement_count, 0)
+        self.assertEqual(
+            self._get_response_data(response),
+            self._get_response_data(self._get_from_database(f'{self.GAMES_API_PATH}/{game_id}'))
+        )
+        self.assertEqual(missing.status_code, 404)
+
+    def test_other_sorts_and_fields_use_database(self) -> None:
+        """Test that requests the snapshot can't answer fall back to SQLite"""
+        for query in ['?sort=-star_rating', '?fields=title']:
+            with self.subTest(query):
+                # Act
+                response, statement_count = self._get_with_statement_count(f'{self.GAMES_API_PATH}{query}')
+
+                # Assert
+                self.assertEqual(response.status_code, 200)
+                self.assertGreater(statement_count, 0)
+
+    def test_snapshot_rebuilt_after_write(self) -> None:
+        """Test that a write makes the next request see a rebuilt snapshot"""
+        # Arrange
+        old_snapshot = self.store.snapshot
+        with self.app.app_context():
+            db.session.query(Game).filter_by(title="Pipeline Panic").one().title = "Pipeline Pandemonium"
+            db.session.commit()
+
+        # Act
+        response = self.client.get(self.GAMES_API_PATH)
+        titles = [game['title'] for game in self._get_response_data(response)['games']]
+
+        # Assert
+        self.assertIsNot(self.store.snapshot, old_snapshot)
+        self.assertEqual(self.store.rebuilds, 2)
+        self.assertIn("Pipeline Pandemonium", titles)
+
+    def test_failed_rebuild_backs_off(self) -> None:
+        """Test that after a failed build requests use SQLite until the retry backoff passes"""
+        # Arrange
+        old_snapshot = self.store.snapshot
+        with self.app.app_context():
+            db.session.query(Game).filter_by(title="Pipeline Panic").one().title = "Pipeline Pandemonium"
+            db.session.commit()
+
+        # Act
+        with mock.patch.object(catalog_snapshot, 'build_catalog_snapshot', side_effect=RuntimeError) as build, \
+                self.assertLogs(catalog_snapshot.logger, 'ERROR'):
+            responses = [self.client.get(self.GAMES_API_PATH) for _ in range(3)]
+            calls_during_backoff = build.call_count
+            self.store.failed_at -= self.store.retry_backoff
+            self.client.get(self.GAMES_API_PATH)
+
+        # Assert
+        self.assertEqual([response.status_code for response in responses], [200] * 3)
+        self.assertIn("Pipeline Pandemonium", [game['title'] for game in self._get_response_data(responses[-1])['games']])
+        self.assertEqual(calls_during_backoff, 1)
+        self.assertEqual(build.call_count, 2)
+        self.assertEqual(self.store.failures, 2)
+        self.assertIs(self.store.snapshot, old_snapshot)
+
+    def test_snapshot_in_metrics(self) -> None:
+        """Test that the snapshot's size and rebuild counters are exported on /metrics"""
+        # Act
+        body = self.client.get(self.METRICS_PATH).get_data(as_text=True)
+
+        # Assert
+        labels = get_process_labels()
+        self.assertIn(f'tailspin_catalog_snapshot_games{{{labels}}} {len(self.TEST_DATA["games"])}', body)
+        self.assertIn(f'tailspin_catalog_snapshot_memory_bytes{{{labels}}} {self.store.snapshot.memory_bytes}', body)
+        self.assertIn(f'tailspin_catalog_snapshot_rebuilds_total{{{labels}}} 1', body)
+        self.assertIn(f'tailspin_catalog_snapshot_rebuild_failures_total{{{labels}}} 0', body)
+
+    def test_invalid_cursor_rejected(self) -> None:
+        """Test that invalid cursors return 400 with the snapshot enabled"""
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}?cursor=not-a-cursor')
+
+        # Assert
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
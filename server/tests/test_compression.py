@@ -0,0 +1,173 @@
+import unittest
+import gzip
+import json
+from typing import Dict, Any
+from unittest import mock
+from flask import jsonify
+from app import create_app
+from models import db
+import utils.compression as compression
+from utils.compression import get_compressed_body_cache
+from utils.data_version import bump_data_version
+from utils.http_cache import conditional_get
+
+
+class TestCompression(unittest.TestCase):
+    """Test cases for response compression"""
+
+    # Test data
+    TEST_DATA: Dict[str, Any] = {
+        "payload": {"games": [{"id": index, "title": f"Game {index}"} for index in range(100)]},
+        "small_payload": {"id": 1},
+        "min_size": 256,
+        "cache_size": 2,
+        "detail_ids": [1, 2, 3, 4]
+    }
+
+    # API paths
+    LARGE_PATH: str = '/large'
+    SMALL_PATH: str = '/small'
+    CACHED_PATH: str = '/cached'
+    DETAIL_PATH: str = '/cached/{id}'
+
+    APP_CONFIG: Dict[str, Any] = {
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+        'CATALOG_SNAPSHOT_ENABLED': False,
+        'COMPRESS_MIN_SIZE': TEST_DATA["min_size"],
+        'COMPRESS_CACHE_SIZE': TEST_DATA["cache_size"]
+    }
+
+    def setUp(self) -> None:
+        """Set up an app with compression and test routes of different sizes"""
+        self.app = create_app(self.APP_CONFIG)
+
+        @self.app.route(self.LARGE_PATH)
+        def large() -> Any:
+            return jsonify(self.TEST_DATA["payload"])
+
+        @self.app.route(self.SMALL_PATH)
+        def small() -> Any:
+            return jsonify(self.TEST_DATA["small_payload"])
+
+        @self.app.route(self.CACHED_PATH)
+        @conditional_get
+        def cached() -> Any:
+            return jsonify(self.TEST_DATA["payload"])
+
+        @self.app.route('/cached/<int:id>')
+        @conditional_get
+        def cached_detail(id: int) -> Any:
+            return jsonify({**self.TEST_DATA["payload"], "id": id})
+
+        self.client = self.app.test_client()
+
+    def tearDown(self) -> None:
+        """Close the app's database connections"""
+        with self.app.app_context():
+            db.engine.dispose()
+
+    def _get_cache_size(self) -> int:
+        """Helper method to count the compressed bodies the app keeps"""
+        with self.app.app_context():
+            return len(get_compressed_body_cache())
+
+    def test_gzip_when_accepted(self) -> None:
+        """Test that large responses are gzipped for clients that accept it"""
+        # Act
+        response = self.client.get(self.LARGE_PATH, headers={'Accept-Encoding': 'gzip'})
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+        self.assertEqual(json.loads(gzip.decompress(response.data)), self.TEST_DATA["payload"])
+
+    def test_identity_without_accept_encoding(self) -> None:
+        """Test that responses are uncompressed when the client accepts no encoding"""
+        # Act
+        response = self.client.get(self.LARGE_PATH)
+
+        # Assert
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertEqual(json.loads(response.data), self.TEST_DATA["payload"])
+
+    def test_small_response_not_compressed(self) -> None:
+        """Test that bodies below the minimum size are sent as they are"""
+        # Act
+        response = self.client.get(self.SMALL_PATH, headers={'Accept-Encoding': 'gzip'})
+
+        # Assert
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertEqual(json.loads(response.data), self.TEST_DATA["small_payload"])
+
+    def test_brotli_preferred_when_available(self) -> None:
+        """Test that brotli is chosen over gzip when installed and accepted"""
+        # Arrange
+        fake_brotli = mock.Mock()
+        fake_brotli.compress.return_value = b'brotli-body'
+
+        # Act
+        with mock.patch.object(compression, 'brotli', fake_brotli):
+            response = self.client.get(self.LARGE_PATH, headers={'Accept-Encoding': 'gzip, br'})
+
+        # Assert
+        self.assertEqual(response.headers['Content-Encoding'], 'br')
+        self.assertEqual(response.data, b'brotli-body')
+
+    def test_gzip_without_brotli(self) -> None:
+        """Test that gzip is used when brotli is accepted but not installed"""
+        # Act
+        with mock.patch.object(compression, 'brotli', None):
+            response = self.client.get(self.LARGE_PATH, headers={'Accept-Encoding': 'br, gzip'})
+
+        # Assert
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+
+    def test_cacheable_response_compressed_once(self) -> None:
+        """Test that responses with an ETag are compressed once per data version"""
+        # Act
+        with mock.patch.object(compression, 'compress_body', wraps=compression.compress_body) as compress_body:
+            first = self.client.get(self.CACHED_PATH, headers={'Accept-Encoding': 'gzip'})
+            second = self.client.get(self.CACHED_PATH, headers={'Accept-Encoding': 'gzip'})
+            bump_data_version()
+            third = self.client.get(self.CACHED_PATH, headers={'Accept-Encoding': 'gzip'})
+
+        # Assert
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(json.loads(gzip.decompress(third.data)), self.TEST_DATA["payload"])
+        self.assertEqual(compress_body.call_count, 2)
+
+    def test_uncacheable_response_not_cached(self) -> None:
+        """Test that responses without an ETag are not stored"""
+        # Act
+        self.client.get(self.LARGE_PATH, headers={'Accept-Encoding': 'gzip'})
+
+        # Assert
+        self.assertEqual(self._get_cache_size(), 0)
+
+    def test_hot_response_survives_other_cached_responses(self) -> None:
+        """Test that the most recently used bodies stay cached while others are evicted"""
+        # Act
+        with mock.patch.object(compression, 'compress_body', wraps=compression.compress_body) as compress_body:
+            for id in self.TEST_DATA["detail_ids"]:
+                self.client.get(self.CACHED_PATH, headers={'Accept-Encoding': 'gzip'})
+                self.client.get(self.DETAIL_PATH.format(id=id), headers={'Accept-Encoding': 'gzip'})
+
+        # Assert
+        self.assertEqual(compress_body.call_count, 1 + len(self.TEST_DATA["detail_ids"]))
+        self.assertEqual(self._get_cache_size(), self.TEST_DATA["cache_size"])
+
+    def test_large_response_not_cached(self) -> None:
+        """Test that bodies above the cacheable size are compressed without being stored"""
+        # Act
+        with mock.patch.object(compression, 'MAX_CACHED_SIZE', self.TEST_DATA["min_size"]):
+            response = self.client.get(self.CACHED_PATH, headers={'Accept-Encoding': 'gzip'})
+
+        # Assert
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(self._get_cache_size(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
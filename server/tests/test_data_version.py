@@ -0,0 +1,109 @@
+import unittest
+import json
+import os
+import tempfile
+from typing import Dict, Any
+from flask import Flask
+from sqlalchemy import create_engine, text
+from app import create_app
+from models import Category, db
+from utils.data_version import EXTENSION_KEY
+from utils.database import init_schema
+
+
+class TestDataVersion(unittest.TestCase):
+    """Test cases for noticing catalog writes made by other processes"""
+
+    # Test data
+    TEST_DATA: Dict[str, Any] = {
+        "categories": [
+            {"name": "Strategy", "description": "Games requiring tactical thinking"}
+        ],
+        "renamed": "Deck Builder"
+    }
+
+    # API paths
+    CATEGORIES_API_PATH: str = '/api/categories'
+
+    def setUp(self) -> None:
+        """Set up a seeded database file"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.database_uri = f"sqlite:///{os.path.join(self.temp_dir.name, 'tailspin-toys.db')}"
+
+    def tearDown(self) -> None:
+        """Clean up scratch files"""
+        self.temp_dir.cleanup()
+
+    def _create_app(self, poll_interval: float) -> Flask:
+        """Helper method to build a seeded app bound to the scratch database"""
+        app = create_app({
+            'TESTING': True,
+            'SQLALCHEMY_DATABASE_URI': self.database_uri,
+            'DATA_VERSION_POLL_INTERVAL': poll_interval
+        })
+        self.addCleanup(self._dispose, app)
+        init_schema(app)
+        with app.app_context():
+            db.session.add_all([Category(**data) for data in self.TEST_DATA["categories"]])
+            db.session.commit()
+        return app
+
+    def _dispose(self, app: Flask) -> None:
+        """Helper method to close the app's connections"""
+        with app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+
+    def _write_from_another_process(self) -> None:
+        """Helper method to rename the category through an engine the app doesn't know about"""
+        engine = create_engine(self.database_uri)
+        try:
+            with engine.begin() as connection:
+                connection.execute(text('UPDATE categories SET name = :name'), {'name': self.TEST_DATA["renamed"]})
+        finally:
+            engine.dispose()
+
+    def test_etag_changes_after_external_write(self) -> None:
+        """Test that a commit through a separate engine invalidates ETags and cached results"""
+        # Arrange
+        client = self._create_app(poll_interval=0).test_client()
+        etag = client.get(self.CATEGORIES_API_PATH).headers['ETag']
+        self._write_from_another_process()
+
+        # Act
+        response = client.get(self.CATEGORIES_API_PATH, headers={'If-None-Match': etag})
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+        self.assertEqual([category['name'] for category in json.loads(response.data)], [self.TEST_DATA["renamed"]])
+
+    def test_checks_throttled_by_poll_interval(self) -> None:
+        """Test that external writes are only looked for once per poll interval"""
+        # Arrange
+        app = self._create_app(poll_interval=3600)
+        client = app.test_client()
+        etag = client.get(self.CATEGORIES_API_PATH).headers['ETag']
+        self._write_from_another_process()
+
+        # Act
+        throttled = client.get(self.CATEGORIES_API_PATH, headers={'If-None-Match': etag})
+        app.extensions[EXTENSION_KEY].poll_interval = 0
+        polled = client.get(self.CATEGORIES_API_PATH, headers={'If-None-Match': etag})
+
+        # Assert
+        self.assertEqual(throttled.status_code, 304)
+        self.assertEqual(polled.status_code, 200)
+
+    def test_no_watch_for_memory_database(self) -> None:
+        """Test that in-memory databases, which no other process can write, aren't watched"""
+        # Act
+        app = create_app({'TESTING': True, 'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:'})
+        self.addCleanup(self._dispose, app)
+
+        # Assert
+        self.assertNotIn(EXTENSION_KEY, app.extensions)
+
+
+if __name__ == '__main__':
+    unittest.main()
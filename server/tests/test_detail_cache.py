@@ -0,0 +1,311 @@
+import unittest
+import json
+from typing import Dict, Any
+from unittest import mock
+from flask import Response
+from app import create_app
+from models import Game, Publisher, Category, db
+from utils.database import init_schema
+from utils.detail_cache import GameDetail, GameDetailCache, EXTENSION_KEY
+import utils.detail_cache as detail_cache
+from utils.metrics import get_process_labels
+from tests.query_harness import SQLRecorder
+
+
+class TestGameDetailCache(unittest.TestCase):
+    """Test cases for the per-id game detail cache"""
+
+    # Test data
+    TEST_DATA: Dict[str, Any] = {
+        "publishers": [
+            {"name": "DevGames Inc"},
+            {"name": "Scrum Masters"}
+        ],
+        "categories": [
+            {"name": "Strategy"},
+            {"name": "Card Game"}
+        ],
+        "games": [
+            {"title": "Pipeline Panic", "publisher_index": 0, "category_index": 0},
+            {"title": "Agile Adventures", "publisher_index": 1, "category_index": 1}
+        ]
+    }
+
+    # API paths
+    GAMES_API_PATH: str = '/api/games'
+    METRICS_PATH: str = '/metrics'
+
+    # The catalog snapshot would answer detail lookups before the cache
+    APP_CONFIG: Dict[str, Any] = {
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+        'CATALOG_SNAPSHOT_ENABLED': False
+    }
+
+    def setUp(self) -> None:
+        """Set up test database, seed data and register the cache"""
+        self.app = create_app(self.APP_CONFIG)
+        self.client = self.app.test_client()
+
+        init_schema(self.app)
+        with self.app.app_context():
+            self._seed_test_data()
+            self.game_ids = [game.id for game in db.session.query(Game).order_by(Game.id)]
+
+        self.cache = self.app.extensions[EXTENSION_KEY]
+
+    def tearDown(self) -> None:
+        """Clean up test database"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _seed_test_data(self) -> None:
+        """Helper method to seed test data"""
+        publishers = [Publisher(**data) for data in self.TEST_DATA["publishers"]]
+        categories = [Category(**data) for data in self.TEST_DATA["categories"]]
+        db.session.add_all(publishers + categories)
+        for data in self.TEST_DATA["games"]:
+            db.session.add(Game(
+                title=data["title"],
+                description=f"{data['title']} is a game about software teams",
+                publisher=publishers[data["publisher_index"]],
+                category=categories[data["category_index"]],
+                star_rating=4.0
+            ))
+        db.session.commit()
+
+    def _get_response_data(self, response: Response) -> Any:
+        """Helper method to parse response data"""
+        return json.loads(response.data)
+
+    def _get_with_statement_count(self, path: str) -> tuple[Response, int]:
+        """Helper method to count SQL statements issued while serving a request"""
+        with self.app.app_context():
+            engine = db.engine
+        with SQLRecorder(engine) as recorder:
+            response = self.client.get(path)
+        return response, len(recorder)
+
+    def test_repeat_lookup_served_from_cache(self) -> None:
+        """Test that the second request for a game issues no SQL"""
+        # Arrange
+        path = f'{self.GAMES_API_PATH}/{self.game_ids[0]}'
+
+        # Act
+        first, first_count = self._get_with_statement_count(path)
+        second, second_count = self._get_with_statement_count(path)
+
+        # Assert
+        self.assertEqual(first.status_code, 200)
+        self.assertGreater(first_count, 0)
+        self.assertEqual(second_count, 0)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second.headers['ETag'], first.headers['ETag'])
+        self.assertEqual(self._get_response_data(second)['title'], "Pipeline Panic")
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_missing_game_cached(self) -> None:
+        """Test that 404s for missing ids are cached too"""
+        # Act
+        self.client.get(f'{self.GAMES_API_PATH}/999')
+        response, statement_count = self._get_with_statement_count(f'{self.GAMES_API_PATH}/999')
+
+        # Assert
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(self._get_response_data(response)['error'], "Game not found")
+        self.assertEqual(statement_count, 0)
+
+    def test_created_game_replaces_cached_404(self) -> None:
+        """Test that adding a game invalidates its cached 404"""
+        # Arrange
+        next_id = max(self.game_ids) + 1
+        self.client.get(f'{self.GAMES_API_PATH}/{next_id}')
+        with self.app.app_context():
+            db.session.add(Game(title="Retro Rumble", description="A retrospective board game", publisher_id=1,
+                                category_id=1))
+            db.session.commit()
+
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}/{next_id}')
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._get_response_data(response)['title'], "Retro Rumble")
+
+    def test_game_update_invalidates_entry(self) -> None:
+        """Test that changing a game drops only its own entry"""
+        # Arrange
+        for game_id in self.game_ids:
+            self.client.get(f'{self.GAMES_API_PATH}/{game_id}')
+        with self.app.app_context():
+            db.session.get(Game, self.game_ids[0]).title = "Pipeline Pandemonium"
+            db.session.commit()
+
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}/{self.game_ids[0]}')
+        _, other_count = self._get_with_statement_count(f'{self.GAMES_API_PATH}/{self.game_ids[1]}')
+
+        # Assert
+        self.assertEqual(self._get_response_data(response)['title'], "Pipeline Pandemonium")
+        self.assertEqual(other_count, 0)
+        self.assertEqual(self.cache.invalidations, 1)
+
+    def test_publisher_rename_invalidates_its_games(self) -> None:
+        """Test that renaming a publisher drops the entries of its games"""
+        # Arrange
+        for game_id in self.game_ids:
+            self.client.get(f'{self.GAMES_API_PATH}/{game_id}')
+        with self.app.app_context():
+            db.session.query(Publisher).filter_by(name="DevGames Inc").one().name = "DevGames Ltd"
+            db.session.commit()
+
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}/{self.game_ids[0]}')
+        _, other_count = self._get_with_statement_count(f'{self.GAMES_API_PATH}/{self.game_ids[1]}')
+
+        # Assert
+        self.assertEqual(self._get_response_data(response)['publisher']['name'], "DevGames Ltd")
+        self.assertEqual(other_count, 0)
+
+    def test_category_rename_invalidates_its_games(self) -> None:
+        """Test that renaming a category drops the entries of its games"""
+        # Arrange
+        self.client.get(f'{self.GAMES_API_PATH}/{self.game_ids[1]}')
+        with self.app.app_context():
+            db.session.query(Category).filter_by(name="Card Game").one().name = "Deck Builder"
+            db.session.commit()
+
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}/{self.game_ids[1]}')
+
+        # Assert
+        self.assertEqual(self._get_response_data(response)['category']['name'], "Deck Builder")
+
+    def test_other_publisher_changes_keep_entries(self) -> None:
+        """Test that publisher writes that don't touch the name keep cached games"""
+        # Arrange
+        self.client.get(f'{self.GAMES_API_PATH}/{self.game_ids[0]}')
+        with self.app.app_context():
+            db.session.query(Publisher).filter_by(name="DevGames Inc").one().description = "Makers of dev games"
+            db.session.commit()
+
+        # Act
+        _, statement_count = self._get_with_statement_count(f'{self.GAMES_API_PATH}/{self.game_ids[0]}')
+
+        # Assert
+        self.assertEqual(statement_count, 0)
+
+    def test_rolled_back_write_keeps_entries(self) -> None:
+        """Test that flushed but rolled back changes don't invalidate anything"""
+        # Arrange
+        self.client.get(f'{self.GAMES_API_PATH}/{self.game_ids[0]}')
+        with self.app.app_context():
+            db.session.get(Game, self.game_ids[0]).title = "Never Saved"
+            db.session.flush()
+            db.session.rollback()
+
+        # Act
+        _, statement_count = self._get_with_statement_count(f'{self.GAMES_API_PATH}/{self.game_ids[0]}')
+
+        # Assert
+        self.assertEqual(statement_count, 0)
+
+    def test_bulk_update_clears_cache(self) -> None:
+        """Test that bulk statements, which can't be traced to ids, clear the cache"""
+        # Arrange
+        self.client.get(f'{self.GAMES_API_PATH}/{self.game_ids[0]}')
+        with self.app.app_context():
+            db.session.query(Game).update({Game.star_rating: 1.0})
+            db.session.commit()
+
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}/{self.game_ids[0]}')
+
+        # Assert
+        self.assertEqual(self._get_response_data(response)['starRating'], 1.0)
+
+    def test_fields_bypass_cache(self) -> None:
+        """Test that sparse fieldsets are not cached"""
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}/{self.game_ids[0]}?fields=title')
+
+        # Assert
+        self.assertEqual(self._get_response_data(response), {'id': self.game_ids[0], 'title': "Pipeline Panic"})
+        self.assertEqual(len(self.cache), 0)
+
+    def test_entries_expire(self) -> None:
+        """Test that entries older than the time to live are recomputed"""
+        # Arrange
+        path = f'{self.GAMES_API_PATH}/{self.game_ids[0]}'
+        with mock.patch.object(detail_cache.time, 'monotonic', return_value=1000.0):
+            self.client.get(path)
+
+        # Act
+        with mock.patch.object(detail_cache.time, 'monotonic', return_value=1000.0 + self.cache.ttl + 1):
+            _, statement_count = self._get_with_statement_count(path)
+
+        # Assert
+        self.assertGreater(statement_count, 0)
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_least_recently_used_evicted(self) -> None:
+        """Test that the cache stays bounded by evicting the least recently used id"""
+        # Arrange
+        cache = GameDetailCache(max_entries=2)
+        for game_id in (1, 2, 1, 3):
+            cache.get_or_compute(game_id, lambda: GameDetail(200, b'{}'))
+
+        # Act
+        cache.get_or_compute(2, lambda: GameDetail(200, b'{}'))
+
+        # Assert
+        self.assertEqual(cache.evictions, 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 4))
+        self.assertEqual(len(cache), 2)
+
+    def test_invalidation_during_compute_not_stored(self) -> None:
+        """Test that a value computed across an invalidation isn't cached"""
+        # Arrange
+        cache = GameDetailCache()
+
+        def compute() -> GameDetail:
+            cache.invalidate({1}, set(), set())
+            return GameDetail(200, b'{"stale":true}')
+
+        # Act
+        cache.get_or_compute(1, compute)
+
+        # Assert
+        self.assertEqual(len(cache), 0)
+
+    def test_disabled_with_zero_size(self) -> None:
+        """Test that a size of 0 leaves the cache off"""
+        # Act
+        app = create_app({**self.APP_CONFIG, 'GAME_DETAIL_CACHE_SIZE': 0})
+
+        # Assert
+        self.assertNotIn(EXTENSION_KEY, app.extensions)
+        with app.app_context():
+            db.engine.dispose()
+
+    def test_counters_in_metrics(self) -> None:
+        """Test that hit, miss and eviction counters are exported on /metrics"""
+        # Arrange
+        self.client.get(f'{self.GAMES_API_PATH}/{self.game_ids[0]}')
+        self.client.get(f'{self.GAMES_API_PATH}/{self.game_ids[0]}')
+
+        # Act
+        body = self.client.get(self.METRICS_PATH).get_data(as_text=True)
+
+        # Assert
+        labels = get_process_labels()
+        self.assertIn(f'tailspin_game_detail_cache_hits_total{{{labels}}} 1', body)
+        self.assertIn(f'tailspin_game_detail_cache_misses_total{{{labels}}} 1', body)
+        self.assertIn(f'tailspin_game_detail_cache_evictions_total{{{labels}}} 0', body)
+        self.assertIn(f'tailspin_game_detail_cache_entries{{{labels}}} 1', body)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,16 @@
 import unittest
 import json
 from typing import Dict, Any
-from flask import Flask, Response
+from flask import Response
+from unittest import mock
 from models import Game, Publisher, Category, db
-from routes.games import games_bp
+import routes.games
+from app import create_app
+from utils.pagination import encode_cursor
+from utils.database import init_schema
+from tests.query_harness import QueryBudgetMixin
 
-class TestGamesRoutes(unittest.TestCase):
+class TestGamesRoutes(QueryBudgetMixin, unittest.TestCase):
     # Test data as complete objects
     TEST_DATA: Dict[str, Any] = {
         "publishers": [
@@ -36,27 +41,49 @@ class TestGamesRoutes(unittest.TestCase):
     
     # API paths
     GAMES_API_PATH: str = '/api/games'
+    SEARCH_API_PATH: str = '/api/games/search'
+    EXPORT_API_PATH: str = '/api/games/export'
+    BATCH_API_PATH: str = '/api/games/batch'
+    FACETS_API_PATH: str = '/api/games/facets'
+    
+    # Statement budget per request; plans are snapshotted in query_plans.json
+    QUERY_BUDGETS: Dict[str, tuple[str, int]] = {
+        'games_first_page': ('/api/games', 2),
+        'games_cursor': (f"/api/games?cursor={encode_cursor({'id': 1})}", 2),
+        'games_category': ('/api/games?category_id=1', 2),
+        'games_category_publisher': ('/api/games?category_id=1&publisher_id=1', 2),
+        'games_sparse_fields': ('/api/games?fields=title,starRating&include_total=false', 1),
+        'game_detail': ('/api/games/1', 1),
+        'games_batch': ('/api/games/batch?ids=1,2', 1),
+        'games_search': ('/api/games/search?q=pipeline', 2),
+        'games_facets': ('/api/games/facets', 1),
+        'games_sorted_by_title': ('/api/games?sort=title&include_total=false', 1),
+        'games_top_rated_in_category': ('/api/games?category_id=1&sort=-star_rating&include_total=false', 1),
+        # Reads past the last rated game into the unrated ones, one query each
+        'games_top_rated_cursor': (
+            f"/api/games?sort=-star_rating&include_total=false&cursor={encode_cursor({'id': 1, 'sort': 'star_rating', 'value': 4.5})}",
+            2
+        ),
+        'games_facets_filtered': ('/api/games/facets?category_id=1&publisher_id=1', 1),
+    }
+
+    # App configuration shared by every test
+    APP_CONFIG: Dict[str, Any] = {
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+    }
 
     def setUp(self) -> None:
         """Set up test database and seed data"""
-        # Create a fresh Flask app for testing
-        self.app = Flask(__name__)
-        self.app.config['TESTING'] = True
-        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-        
-        # Register the games blueprint
-        self.app.register_blueprint(games_bp)
+        # Create a fresh app for testing with an in-memory database
+        self.app = create_app(self.APP_CONFIG)
         
         # Initialize the test client
         self.client = self.app.test_client()
         
-        # Initialize in-memory database for testing
-        db.init_app(self.app)
-        
         # Create tables and seed data
+        init_schema(self.app)
         with self.app.app_context():
-            db.create_all()
             self._seed_test_data()
 
     def tearDown(self) -> None:
@@ -103,6 +130,16 @@ class TestGamesRoutes(unittest.TestCase):
         """Helper method to parse response data"""
         return json.loads(response.data)
 
+    def _get_with_statements(self, path: str, headers: Dict[str, str] | None = None) -> tuple[Response, list[str]]:
+        """Helper method to record SQL statements issued while serving a request"""
+        response, recorder = self.get_with_recorder(path, headers)
+        return response, [recorded.statement for recorded in recorder.statements]
+
+    def _get_with_statement_count(self, path: str, headers: Dict[str, str] | None = None) -> tuple[Response, int]:
+        """Helper method to count SQL statements issued while serving a request"""
+        response, statements = self._get_with_statements(path, headers)
+        return response, len(statements)
+
     def test_get_games_success(self) -> None:
         """Test successful retrieval of multiple games with pagination response"""
         # Act
@@ -336,6 +373,682 @@ class TestGamesRoutes(unittest.TestCase):
         if data['games']:
             self.assertEqual(data['games'][0]['category']['id'], category_id)
 
+    def test_pagination_cursor_walks_all_games(self) -> None:
+        """Test that following nextCursor visits every game exactly once"""
+        # Arrange
+        response = self.client.get(f'{self.GAMES_API_PATH}?limit=1')
+        data = self._get_response_data(response)
+        titles = [game['title'] for game in data['games']]
+        
+        # Act
+        while data['nextCursor']:
+            response = self.client.get(f"{self.GAMES_API_PATH}?limit=1&cursor={data['nextCursor']}")
+            self.assertEqual(response.status_code, 200)
+            data = self._get_response_data(response)
+            titles.extend(game['title'] for game in data['games'])
+        
+        # Assert
+        self.assertEqual(titles, [game["title"] for game in self.TEST_DATA["games"]])
+        self.assertFalse(data['hasMore'])
+
+    def test_pagination_cursor_last_page(self) -> None:
+        """Test that the final cursor page reports no further pages"""
+        # Arrange
+        response = self.client.get(f'{self.GAMES_API_PATH}?limit=1')
+        cursor = self._get_response_data(response)['nextCursor']
+        
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}?limit=1&cursor={cursor}')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(data['games']), 1)
+        self.assertEqual(data['games'][0]['title'], self.TEST_DATA["games"][1]["title"])
+        self.assertEqual(data['total'], len(self.TEST_DATA["games"]))
+        self.assertFalse(data['hasMore'])
+        self.assertIsNone(data['nextCursor'])
+
+    def test_pagination_cursor_with_filter(self) -> None:
+        """Test that cursor pages respect the active filters"""
+        # Arrange
+        response = self.client.get(self.GAMES_API_PATH)
+        category_id = self._get_response_data(response)['games'][1]['category']['id']
+        
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}?limit=1&category_id={category_id}')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(data['games']), 1)
+        self.assertFalse(data['hasMore'])
+        self.assertIsNone(data['nextCursor'])
+
+    def test_pagination_invalid_cursor(self) -> None:
+        """Test that a malformed cursor returns 400"""
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}?cursor=not-a-cursor')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(data['error'], "Invalid cursor")
+
+    def test_pagination_cursor_out_of_range(self) -> None:
+        """Test that cursors holding integers SQLite can't store return 400"""
+        for path in [
+            f"{self.GAMES_API_PATH}?cursor={encode_cursor({'id': 10**20})}",
+            f"{self.GAMES_API_PATH}?sort=-star_rating&cursor={encode_cursor({'id': 1, 'sort': 'star_rating', 'value': 10**20})}",
+            f"{self.SEARCH_API_PATH}?q=your&cursor={encode_cursor({'id': 1, 'offset': 10**20})}",
+        ]:
+            with self.subTest(path):
+                # Act
+                response = self.client.get(path)
+
+                # Assert
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(self._get_response_data(response)['error'], "Invalid cursor")
+
+    def test_totals_not_shared_between_apps(self) -> None:
+        """Test that cached totals belong to the app, not to every app in the process"""
+        # Arrange - a second app with its own, empty database
+        other_app = create_app(self.APP_CONFIG)
+        init_schema(other_app)
+        self.client.get(self.GAMES_API_PATH)
+
+        # Act
+        response = other_app.test_client().get(self.GAMES_API_PATH)
+        with other_app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+
+        # Assert
+        self.assertEqual(self._get_response_data(response)['total'], 0)
+        self.assertEqual(
+            self._get_response_data(self.client.get(self.GAMES_API_PATH))['total'], len(self.TEST_DATA["games"])
+        )
+
+    def test_get_games_without_total(self) -> None:
+        """Test that include_total=false skips the count but still reports hasMore"""
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}?limit=1&include_total=false')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(data['games']), 1)
+        self.assertIsNone(data['total'])
+        self.assertTrue(data['hasMore'])
+
+    def test_get_games_total_refreshed_after_change(self) -> None:
+        """Test that the cached total is invalidated when games change"""
+        # Arrange - prime the cached total
+        self.client.get(self.GAMES_API_PATH)
+        with self.app.app_context():
+            game = db.session.query(Game).first()
+            db.session.delete(game)
+            db.session.commit()
+        
+        # Act
+        response = self.client.get(self.GAMES_API_PATH)
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['total'], len(self.TEST_DATA["games"]) - 1)
+
+    def test_get_games_single_statement(self) -> None:
+        """Test that a games page loads publishers and categories in one statement"""
+        # Act
+        response, statement_count = self._get_with_statement_count(f'{self.GAMES_API_PATH}?include_total=false')
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(statement_count, 1)
+
+    def test_get_game_by_id_single_statement(self) -> None:
+        """Test that the game detail endpoint issues a single statement"""
+        # Arrange
+        response = self.client.get(self.GAMES_API_PATH)
+        game_id = self._get_response_data(response)['games'][0]['id']
+        
+        # Act
+        response, statement_count = self._get_with_statement_count(f'{self.GAMES_API_PATH}/{game_id}')
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(statement_count, 1)
+
+    def test_get_games_sets_etag(self) -> None:
+        """Test that list responses carry a revalidation ETag and Cache-Control"""
+        # Act
+        response = self.client.get(self.GAMES_API_PATH)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(response.headers.get('ETag'))
+        self.assertIn('must-revalidate', response.headers['Cache-Control'])
+
+    def test_get_games_not_modified(self) -> None:
+        """Test that a matching If-None-Match returns 304 without querying the database"""
+        # Arrange
+        etag = self.client.get(self.GAMES_API_PATH).headers['ETag']
+        
+        # Act
+        response, statement_count = self._get_with_statement_count(
+            self.GAMES_API_PATH, headers={'If-None-Match': etag}
+        )
+        
+        # Assert
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers['ETag'], etag)
+        self.assertEqual(statement_count, 0)
+
+    def test_get_game_by_id_not_modified(self) -> None:
+        """Test that the detail endpoint honours If-None-Match"""
+        # Arrange
+        data = self._get_response_data(self.client.get(self.GAMES_API_PATH))
+        game_path = f"{self.GAMES_API_PATH}/{data['games'][0]['id']}"
+        etag = self.client.get(game_path).headers['ETag']
+        
+        # Act
+        response = self.client.get(game_path, headers={'If-None-Match': etag})
+        
+        # Assert
+        self.assertEqual(response.status_code, 304)
+
+    def test_get_game_by_id_not_found_has_no_etag(self) -> None:
+        """Test that error responses are not tagged for caching"""
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}/999')
+        
+        # Assert
+        self.assertEqual(response.status_code, 404)
+        self.assertIsNone(response.headers.get('ETag'))
+
+    def test_get_games_etag_changes_after_write(self) -> None:
+        """Test that writing a game invalidates previously issued ETags"""
+        # Arrange
+        etag = self.client.get(self.GAMES_API_PATH).headers['ETag']
+        with self.app.app_context():
+            game = db.session.query(Game).first()
+            game.star_rating = 1.0
+            db.session.commit()
+        
+        # Act
+        response = self.client.get(self.GAMES_API_PATH, headers={'If-None-Match': etag})
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+
+    def test_search_games_by_title(self) -> None:
+        """Test that search matches words in game titles"""
+        # Act
+        response = self.client.get(f'{self.SEARCH_API_PATH}?q=pipeline')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([game['title'] for game in data['games']], ["Pipeline Panic"])
+        self.assertEqual(data['total'], 1)
+        self.assertFalse(data['hasMore'])
+        self.assertIsNone(data['nextCursor'])
+
+    def test_search_games_by_description_prefix(self) -> None:
+        """Test that the last search word matches description words as a prefix"""
+        # Act
+        response = self.client.get(f'{self.SEARCH_API_PATH}?q=spri')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([game['title'] for game in data['games']], ["Agile Adventures"])
+
+    def test_search_games_no_matches(self) -> None:
+        """Test that a search without matches returns an empty page"""
+        # Act
+        response = self.client.get(f'{self.SEARCH_API_PATH}?q=nonexistent')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['games'], [])
+        self.assertEqual(data['total'], 0)
+
+    def test_search_games_treats_operators_literally(self) -> None:
+        """Test that FTS5 syntax in user input does not cause errors"""
+        # Act
+        response = self.client.get(f'{self.SEARCH_API_PATH}?q=pipeline OR "chaos')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(data['games']), 0)
+
+    def test_search_games_missing_query(self) -> None:
+        """Test that a search without any words returns 400"""
+        # Act
+        response = self.client.get(f'{self.SEARCH_API_PATH}?q=%20!')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(data['error'], "Search query is required")
+
+    def test_search_games_cursor_pagination(self) -> None:
+        """Test that search results can be paged with nextCursor"""
+        # Arrange - both seeded games mention "your"
+        response = self.client.get(f'{self.SEARCH_API_PATH}?q=your&limit=1')
+        first_page = self._get_response_data(response)
+        
+        # Act
+        response = self.client.get(f"{self.SEARCH_API_PATH}?q=your&limit=1&cursor={first_page['nextCursor']}")
+        second_page = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(first_page['hasMore'])
+        self.assertFalse(second_page['hasMore'])
+        titles = {first_page['games'][0]['title'], second_page['games'][0]['title']}
+        self.assertEqual(titles, {game["title"] for game in self.TEST_DATA["games"]})
+
+    def test_search_games_index_follows_updates(self) -> None:
+        """Test that the search index stays in sync when a game is renamed or deleted"""
+        # Arrange
+        with self.app.app_context():
+            game = db.session.query(Game).filter(Game.title == "Pipeline Panic").one()
+            game.title = "Deployment Derby"
+            db.session.delete(db.session.query(Game).filter(Game.title == "Agile Adventures").one())
+            db.session.commit()
+        
+        # Act
+        renamed = self._get_response_data(self.client.get(f'{self.SEARCH_API_PATH}?q=derby'))
+        old_title = self._get_response_data(self.client.get(f'{self.SEARCH_API_PATH}?q=panic'))
+        deleted = self._get_response_data(self.client.get(f'{self.SEARCH_API_PATH}?q=sprints'))
+        
+        # Assert
+        self.assertEqual([game['title'] for game in renamed['games']], ["Deployment Derby"])
+        self.assertEqual(old_title['games'], [])
+        self.assertEqual(deleted['games'], [])
+
+    def _get_export_lines(self, path: str) -> list[Any]:
+        """Helper method to parse every line of an NDJSON export"""
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        return [json.loads(line) for line in response.data.decode('utf-8').splitlines()]
+
+    def test_export_games_success(self) -> None:
+        """Test that the export streams every game in the detail shape"""
+        # Act
+        games = self._get_export_lines(self.EXPORT_API_PATH)
+        
+        # Assert
+        self.assertEqual([game['title'] for game in games], [game["title"] for game in self.TEST_DATA["games"]])
+        required_fields = ['id', 'title', 'description', 'publisher', 'category', 'starRating']
+        for field in required_fields:
+            self.assertIn(field, games[0])
+
+    def test_export_games_across_batches(self) -> None:
+        """Test that games spanning several fetch batches are all exported"""
+        # Act
+        with mock.patch.object(routes.games, 'EXPORT_BATCH_SIZE', 1):
+            games = self._get_export_lines(self.EXPORT_API_PATH)
+        
+        # Assert
+        self.assertEqual(len(games), len(self.TEST_DATA["games"]))
+
+    def test_export_games_with_filter(self) -> None:
+        """Test that the export honours the category filter"""
+        # Arrange
+        all_games = self._get_export_lines(self.EXPORT_API_PATH)
+        category_id = all_games[1]['category']['id']
+        
+        # Act
+        games = self._get_export_lines(f'{self.EXPORT_API_PATH}?category_id={category_id}')
+        
+        # Assert
+        self.assertEqual([game['id'] for game in games], [all_games[1]['id']])
+
+    def test_export_games_empty_database(self) -> None:
+        """Test that exporting an empty catalog returns an empty body"""
+        # Arrange
+        with self.app.app_context():
+            db.session.query(Game).delete()
+            db.session.commit()
+        
+        # Act
+        games = self._get_export_lines(self.EXPORT_API_PATH)
+        
+        # Assert
+        self.assertEqual(games, [])
+
+    def _get_game_ids(self) -> list[int]:
+        """Helper method to get the ids of all seeded games in order"""
+        data = self._get_response_data(self.client.get(self.GAMES_API_PATH))
+        return [game['id'] for game in data['games']]
+
+    def test_get_games_batch_success(self) -> None:
+        """Test that a batch lookup returns games in the requested order"""
+        # Arrange
+        first_id, second_id = self._get_game_ids()
+        
+        # Act
+        response, statement_count = self._get_with_statement_count(
+            f'{self.BATCH_API_PATH}?ids={second_id},{first_id}'
+        )
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([game['id'] for game in data['games']], [second_id, first_id])
+        self.assertEqual(data['missing'], [])
+        self.assertEqual(statement_count, 1)
+
+    def test_get_games_batch_matches_detail_shape(self) -> None:
+        """Test that batch entries have the same shape as the detail endpoint"""
+        # Arrange
+        game_id = self._get_game_ids()[0]
+        detail = self._get_response_data(self.client.get(f'{self.GAMES_API_PATH}/{game_id}'))
+        
+        # Act
+        response = self.client.get(f'{self.BATCH_API_PATH}?ids={game_id}')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['games'], [detail])
+
+    def test_get_games_batch_reports_missing(self) -> None:
+        """Test that unknown ids are listed as missing and duplicates collapse"""
+        # Arrange
+        game_id = self._get_game_ids()[0]
+        
+        # Act
+        response = self.client.get(f'{self.BATCH_API_PATH}?ids={game_id}&ids=999,{game_id}')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([game['id'] for game in data['games']], [game_id])
+        self.assertEqual(data['missing'], [999])
+
+    def test_get_games_batch_invalid_ids(self) -> None:
+        """Test that non-integer ids return 400"""
+        # Act
+        response = self.client.get(f'{self.BATCH_API_PATH}?ids=1,abc')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('error', data)
+
+    def test_get_games_batch_unparseable_ids(self) -> None:
+        """Test that Unicode digits and ids SQLite can't store return 400"""
+        for ids in ['²', '99999999999999999999']:
+            with self.subTest(ids):
+                # Act
+                response = self.client.get(f'{self.BATCH_API_PATH}?ids=1,{ids}')
+                data = self._get_response_data(response)
+
+                # Assert
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(data['error'], "ids must be a comma-separated list of integers")
+
+    def test_get_games_batch_missing_ids(self) -> None:
+        """Test that a batch lookup without ids returns 400"""
+        # Act
+        response = self.client.get(self.BATCH_API_PATH)
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(data['error'], "ids is required")
+
+    def test_get_games_batch_too_many_ids(self) -> None:
+        """Test that requesting more than the maximum number of ids returns 400"""
+        # Arrange
+        ids = ','.join(str(game_id) for game_id in range(1, routes.games.MAX_BATCH_IDS + 2))
+        
+        # Act
+        response = self.client.get(f'{self.BATCH_API_PATH}?ids={ids}')
+        
+        # Assert
+        self.assertEqual(response.status_code, 400)
+
+    def test_get_games_sparse_fields(self) -> None:
+        """Test that fields limits the returned keys and always includes id"""
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}?fields=title,starRating')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(data['games']), len(self.TEST_DATA["games"]))
+        for game in data['games']:
+            self.assertEqual(set(game), {'id', 'title', 'starRating'})
+
+    def test_get_games_sparse_fields_skips_columns(self) -> None:
+        """Test that unrequested columns and relations are not read from the database"""
+        # Act
+        response, statements = self._get_with_statements(
+            f'{self.GAMES_API_PATH}?fields=title,publisher&include_total=false'
+        )
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(statements), 1)
+        self.assertNotIn('description', statements[0])
+        self.assertNotIn('categories', statements[0])
+        self.assertIn('publishers', statements[0])
+        self.assertEqual(set(self._get_response_data(response)['games'][0]), {'id', 'title', 'publisher'})
+
+    def test_get_game_by_id_sparse_fields(self) -> None:
+        """Test that the detail endpoint honors fields"""
+        # Arrange
+        game_id = self._get_game_ids()[0]
+        
+        # Act
+        response, statement_count = self._get_with_statement_count(
+            f'{self.GAMES_API_PATH}/{game_id}?fields=category'
+        )
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(statement_count, 1)
+        self.assertEqual(set(data), {'id', 'category'})
+        self.assertIsNotNone(data['category']['name'])
+
+    def test_get_games_unknown_field(self) -> None:
+        """Test that an unknown field name returns 400"""
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}?fields=title,secret')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(data['error'], "Unknown fields: secret")
+
+    def _get_facet_counts(self, facets: list[Dict[str, Any]]) -> Dict[str, int]:
+        """Helper method to map facet names to counts"""
+        return {facet['name']: facet['count'] for facet in facets}
+
+    def test_get_games_facets_without_filters(self) -> None:
+        """Test that facets count every game per category and publisher"""
+        # Act
+        response = self.client.get(self.FACETS_API_PATH)
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['total'], len(self.TEST_DATA["games"]))
+        self.assertEqual(self._get_facet_counts(data['categories']), {'Card Game': 1, 'Strategy': 1})
+        self.assertEqual(self._get_facet_counts(data['publishers']), {'DevGames Inc': 1, 'Scrum Masters': 1})
+        self.assertEqual([facet['name'] for facet in data['categories']], ['Card Game', 'Strategy'])
+
+    def test_get_games_facets_are_disjunctive(self) -> None:
+        """Test that each facet ignores its own filter and applies the other"""
+        # Arrange
+        with self.app.app_context():
+            strategy = db.session.query(Category).filter_by(name="Strategy").one()
+            scrum_masters = db.session.query(Publisher).filter_by(name="Scrum Masters").one()
+            category_id, publisher_id = strategy.id, scrum_masters.id
+            db.session.add(Game(
+                title="Retro Rumble",
+                description="Settle sprint disputes in the arena",
+                publisher=scrum_masters,
+                category=strategy,
+                star_rating=3.9
+            ))
+            db.session.commit()
+        
+        # Act
+        response = self.client.get(f'{self.FACETS_API_PATH}?category_id={category_id}')
+        data = self._get_response_data(response)
+        both_response = self.client.get(
+            f'{self.FACETS_API_PATH}?category_id={category_id}&publisher_id={publisher_id}'
+        )
+        both_data = self._get_response_data(both_response)
+        
+        # Assert
+        self.assertEqual(data['total'], 2)
+        self.assertEqual(self._get_facet_counts(data['categories']), {'Card Game': 1, 'Strategy': 2})
+        self.assertEqual(self._get_facet_counts(data['publishers']), {'DevGames Inc': 1, 'Scrum Masters': 1})
+        self.assertEqual(both_data['total'], 1)
+        self.assertEqual(self._get_facet_counts(both_data['categories']), {'Card Game': 1, 'Strategy': 1})
+        self.assertEqual(self._get_facet_counts(both_data['publishers']), {'DevGames Inc': 1, 'Scrum Masters': 1})
+
+    def test_get_games_facets_cached_until_change(self) -> None:
+        """Test that facets are served from the cache until games change"""
+        # Arrange
+        self.client.get(self.FACETS_API_PATH)
+        
+        # Act
+        cached_response, cached_statements = self._get_with_statement_count(self.FACETS_API_PATH)
+        with self.app.app_context():
+            db.session.delete(db.session.query(Game).filter_by(title="Pipeline Panic").one())
+            db.session.commit()
+        response = self.client.get(self.FACETS_API_PATH)
+        
+        # Assert
+        self.assertEqual(cached_response.status_code, 200)
+        self.assertEqual(cached_statements, 0)
+        self.assertEqual(self._get_response_data(response)['total'], 1)
+
+    def _add_games_for_sorting(self) -> None:
+        """Helper method to add games with tied and missing ratings"""
+        with self.app.app_context():
+            publisher = db.session.query(Publisher).first()
+            category = db.session.query(Category).first()
+            for title, star_rating in [("Merge Mayhem", 4.2), ("Null Pointer", None), ("Cache Crusade", None),
+                                       ("Backlog Blitz", 4.5)]:
+                db.session.add(Game(
+                    title=title,
+                    description=f"{title} is a game about software teams",
+                    publisher=publisher,
+                    category=category,
+                    star_rating=star_rating
+                ))
+            db.session.commit()
+
+    def _walk_pages(self, path: str) -> list[Dict[str, Any]]:
+        """Helper method to follow nextCursor from the first page to the last"""
+        games: list[Dict[str, Any]] = []
+        data = self._get_response_data(self.client.get(path))
+        games += data['games']
+        while data['nextCursor']:
+            response = self.client.get(f"{path}&cursor={data['nextCursor']}")
+            self.assertEqual(response.status_code, 200)
+            data = self._get_response_data(response)
+            games += data['games']
+        return games
+
+    def test_sort_by_star_rating_descending(self) -> None:
+        """Test that -star_rating puts the best rated first, ties by id, unrated last"""
+        # Arrange
+        self._add_games_for_sorting()
+        
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}?sort=-star_rating')
+        games = self._get_response_data(response)['games']
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([game['title'] for game in games], [
+            "Backlog Blitz", "Pipeline Panic", "Merge Mayhem", "Agile Adventures", "Cache Crusade", "Null Pointer"
+        ])
+
+    def test_sort_by_title(self) -> None:
+        """Test that games can be sorted by title"""
+        # Arrange
+        self._add_games_for_sorting()
+        
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}?sort=title')
+        titles = [game['title'] for game in self._get_response_data(response)['games']]
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(titles, sorted(titles))
+
+    def test_sort_cursor_pages_match_offset_order(self) -> None:
+        """Test that cursor pages walk every sort in the same order as one large page"""
+        # Arrange
+        self._add_games_for_sorting()
+        
+        for sort in ['id', '-id', 'title', '-title', 'star_rating', '-star_rating']:
+            with self.subTest(sort):
+                # Act
+                expected = self._get_response_data(
+                    self.client.get(f'{self.GAMES_API_PATH}?sort={sort}')
+                )['games']
+                walked = self._walk_pages(f'{self.GAMES_API_PATH}?sort={sort}&limit=1')
+                
+                # Assert
+                self.assertEqual([game['id'] for game in walked], [game['id'] for game in expected])
+
+    def test_sort_cursor_with_sparse_fields(self) -> None:
+        """Test that cursors carry the sort value even when it isn't returned"""
+        # Arrange
+        self._add_games_for_sorting()
+        
+        # Act
+        walked = self._walk_pages(f'{self.GAMES_API_PATH}?sort=-star_rating&fields=title&limit=2')
+        
+        # Assert
+        self.assertEqual(len(walked), len(self.TEST_DATA["games"]) + 4)
+        self.assertEqual(set(walked[0]), {'id', 'title'})
+
+    def test_sort_unknown_column(self) -> None:
+        """Test that sorting by an unsupported column returns 400"""
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}?sort=description')
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(data['error'], "Unknown sort: description")
+
+    def test_sort_cursor_from_other_sort(self) -> None:
+        """Test that a cursor taken under one sort is rejected under another"""
+        # Arrange
+        cursor = encode_cursor({'id': 1, 'sort': 'title', 'value': 'Pipeline Panic'})
+        
+        # Act
+        response = self.client.get(f'{self.GAMES_API_PATH}?sort=-star_rating&cursor={cursor}')
+        
+        # Assert
+        self.assertEqual(response.status_code, 400)
+
+    def test_query_budgets(self) -> None:
+        """Test statement counts and query plans of each endpoint against their budgets"""
+        for name, (path, max_statements) in self.QUERY_BUDGETS.items():
+            with self.subTest(name):
+                self.assertQueryBudget(name, path, max_statements)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
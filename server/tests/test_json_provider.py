@@ -0,0 +1,112 @@
+import unittest
+import json
+from typing import Dict, Any
+from unittest import mock
+from flask import Flask, jsonify
+import utils.json_provider as json_provider
+from utils.json_provider import FastJSONProvider
+
+
+class TestJSONProvider(unittest.TestCase):
+    """Test cases for the fast JSON provider"""
+    
+    # Test data
+    TEST_DATA: Dict[str, Any] = {
+        "payload": {
+            "games": [{"title": "Pipeline Panic", "starRating": 4.5, "id": 1, "publisher": None}],
+            "total": 1,
+            "hasMore": False,
+            "nextCursor": None
+        },
+        "stream_threshold": 5
+    }
+    
+    # API paths
+    SMALL_PATH: str = '/small'
+    LARGE_PATH: str = '/large'
+
+    def setUp(self) -> None:
+        """Set up an app that serves small and large JSON payloads"""
+        self.app = Flask(__name__)
+        self.app.config['TESTING'] = True
+        self.app.config['JSON_STREAM_THRESHOLD'] = self.TEST_DATA["stream_threshold"]
+        self.app.json = FastJSONProvider(self.app)
+        
+        @self.app.route(self.SMALL_PATH)
+        def small() -> Any:
+            return jsonify(self.TEST_DATA["payload"])
+        
+        @self.app.route(self.LARGE_PATH)
+        def large() -> Any:
+            return jsonify({"games": self._large_list(), "total": 12})
+        
+        self.client = self.app.test_client()
+
+    def _large_list(self) -> list[dict[str, Any]]:
+        """Helper method to build a list long enough to be streamed"""
+        return [{"id": index, "title": f"Game {index}"} for index in range(12)]
+
+    def test_dumps_matches_default_provider(self) -> None:
+        """Test that output decodes to the same data with sorted keys"""
+        # Act
+        encoded = self.app.json.dumps(self.TEST_DATA["payload"])
+        
+        # Assert
+        self.assertEqual(json.loads(encoded), self.TEST_DATA["payload"])
+        self.assertEqual(list(json.loads(encoded)), sorted(self.TEST_DATA["payload"]))
+
+    def test_dumps_without_orjson(self) -> None:
+        """Test that the stdlib encoder is used when orjson is unavailable"""
+        # Act
+        with mock.patch.object(json_provider, 'orjson', None):
+            encoded = self.app.json.dumps_bytes(self.TEST_DATA["payload"])
+        
+        # Assert
+        self.assertEqual(json.loads(encoded), self.TEST_DATA["payload"])
+
+    def test_dumps_non_string_keys(self) -> None:
+        """Test that payloads orjson rejects fall back to the stdlib encoder"""
+        # Act
+        encoded = self.app.json.dumps_bytes({1: "one"})
+        
+        # Assert
+        self.assertEqual(json.loads(encoded), {"1": "one"})
+
+    def test_response_small_payload_buffered(self) -> None:
+        """Test that small payloads are returned as a single buffered body"""
+        # Act
+        response = self.client.get(self.SMALL_PATH)
+        with self.app.app_context():
+            is_streamed = self.app.json.response(self.TEST_DATA["payload"]).is_streamed
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/json')
+        self.assertFalse(is_streamed)
+        self.assertEqual(json.loads(response.data), self.TEST_DATA["payload"])
+
+    def test_response_large_payload_streamed(self) -> None:
+        """Test that payloads holding long lists are streamed as valid JSON"""
+        # Act
+        response = self.client.get(self.LARGE_PATH)
+        with self.app.app_context():
+            is_streamed = self.app.json.response(self._large_list()).is_streamed
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(is_streamed)
+        self.assertEqual(json.loads(response.data), {"games": self._large_list(), "total": 12})
+
+    def test_iter_dumps_chunks_join_to_valid_json(self) -> None:
+        """Test that streamed chunks form the same document for every shape"""
+        # Arrange
+        payloads = [self._large_list() * 20, [], {"games": []}, "text", None]
+        
+        # Act & Assert
+        for payload in payloads:
+            encoded = b''.join(self.app.json.iter_dumps(payload))
+            self.assertEqual(json.loads(encoded), payload)
+
+
+if __name__ == '__main__':
+    unittest.main()
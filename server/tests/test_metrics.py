@@ -0,0 +1,99 @@
+import unittest
+from typing import Dict, Any
+from app import create_app
+from models import Category, db
+from utils.database import init_schema
+from utils.metrics import EXTENSION_KEY, UNMATCHED_ROUTE, get_process_labels
+
+
+class TestMetrics(unittest.TestCase):
+    """Test cases for request instrumentation and the metrics endpoint"""
+
+    # Test data
+    TEST_DATA: Dict[str, Any] = {
+        "categories": [
+            {"name": "Strategy", "description": "Games requiring tactical thinking"},
+            {"name": "Card Game", "description": "Card-based gameplay mechanics"}
+        ]
+    }
+
+    # API paths
+    CATEGORIES_API_PATH: str = '/api/categories'
+    METRICS_PATH: str = '/metrics'
+
+    # No catalog snapshot, so its build statements don't count towards the metrics
+    APP_CONFIG: Dict[str, Any] = {
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+        'CATALOG_SNAPSHOT_ENABLED': False
+    }
+
+    def setUp(self) -> None:
+        """Set up an instrumented app with test data"""
+        self.app = create_app(self.APP_CONFIG)
+        self.client = self.app.test_client()
+
+        init_schema(self.app)
+        with self.app.app_context():
+            db.session.add_all([Category(**data) for data in self.TEST_DATA["categories"]])
+            db.session.commit()
+
+    def tearDown(self) -> None:
+        """Clean up test database"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def test_server_timing_header(self) -> None:
+        """Test that responses report SQL and app time in Server-Timing"""
+        # Act
+        response = self.client.get(self.CATEGORIES_API_PATH)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(response.headers['Server-Timing'], r'^db;dur=[\d.]+;desc="1 queries", app;dur=[\d.]+$')
+
+    def test_records_route_metrics(self) -> None:
+        """Test that latency, statements and response size are recorded per route"""
+        # Act
+        first = self.client.get(self.CATEGORIES_API_PATH)
+        second = self.client.get(self.CATEGORIES_API_PATH)
+        metrics = self.app.extensions[EXTENSION_KEY].get(self.CATEGORIES_API_PATH)
+
+        # Assert
+        self.assertEqual(metrics.latency.count, 2)
+        self.assertEqual(metrics.statements.sum, 2)
+        self.assertEqual(metrics.response_bytes, len(first.data) + len(second.data))
+        self.assertEqual(dict(metrics.responses), {200: 2})
+
+    def test_unmatched_route(self) -> None:
+        """Test that requests matching no route share one label"""
+        # Act
+        self.client.get('/api/nothing-here')
+        metrics = self.app.extensions[EXTENSION_KEY].get(UNMATCHED_ROUTE)
+
+        # Assert
+        self.assertEqual(dict(metrics.responses), {404: 1})
+
+    def test_metrics_endpoint(self) -> None:
+        """Test that the metrics endpoint renders Prometheus text"""
+        # Arrange
+        self.client.get(self.CATEGORIES_API_PATH)
+
+        # Act
+        response = self.client.get(self.METRICS_PATH)
+        body = response.get_data(as_text=True)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'text/plain')
+        labels = f'route="{self.CATEGORIES_API_PATH}",method="GET",{get_process_labels()}'
+        self.assertIn(f'tailspin_http_requests_total{{{labels},status="200"}} 1', body)
+        self.assertIn(f'tailspin_http_request_duration_seconds_count{{{labels}}} 1', body)
+        self.assertIn(f'tailspin_db_statements_per_request_bucket{{{labels},le="1"}} 1', body)
+        self.assertIn('# TYPE tailspin_db_duration_seconds_total counter', body)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,9 @@
 import unittest
 from typing import Dict, Any
 from flask import Flask
-from models import Game, Publisher, Category, db
+from sqlalchemy import inspect, text
+from models import Game, Publisher, Category, db, ensure_search_index
+from utils.database import ensure_indexes
 
 class TestModels(unittest.TestCase):
     """Test suite for model validations"""
@@ -145,5 +147,51 @@ class TestModels(unittest.TestCase):
             self.assertIsNotNone(publisher.id)
             self.assertIsNone(publisher.description)
 
+    def test_ensure_search_index_backfills_existing_games(self) -> None:
+        """Test that the search index can be added to a database created without it"""
+        with self.app.app_context():
+            # Create a game, then drop the index to mimic a database that predates it
+            publisher = Publisher(**self.TEST_DATA["valid_publisher"])
+            category = Category(**self.TEST_DATA["valid_category"])
+            game = Game(**self.TEST_DATA["valid_game"], publisher=publisher, category=category)
+            db.session.add(game)
+            db.session.commit()
+            with db.engine.begin() as connection:
+                connection.execute(text("DROP TABLE games_fts"))
+            
+            # Act
+            with db.engine.begin() as connection:
+                created = ensure_search_index(connection)
+                created_again = ensure_search_index(connection)
+                matches = connection.execute(
+                    text("SELECT rowid FROM games_fts WHERE games_fts MATCH 'exciting'")
+                ).scalars().all()
+            
+            # Assert
+            self.assertTrue(created)
+            self.assertFalse(created_again)
+            self.assertEqual(matches, [game.id])
+
+    def test_ensure_indexes_adds_missing_indexes(self) -> None:
+        """Test that indexes declared on the models are added to an existing database"""
+        with self.app.app_context():
+            # Drop the games indexes to mimic a database created before they existed
+            index_names = {index.name for index in Game.__table__.indexes}
+            with db.engine.begin() as connection:
+                for index_name in index_names:
+                    connection.execute(text(f"DROP INDEX {index_name}"))
+            
+            # Act
+            with db.engine.begin() as connection:
+                created = ensure_indexes(connection)
+                created_again = ensure_indexes(connection)
+                existing = {index['name'] for index in inspect(connection).get_indexes('games')}
+            
+            # Assert
+            self.assertEqual(set(created), index_names)
+            self.assertEqual(created_again, [])
+            self.assertTrue(index_names.issubset(existing))
+
+
 if __name__ == '__main__':
     unittest.main()
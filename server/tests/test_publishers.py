@@ -1,12 +1,14 @@
 import unittest
 import json
 from typing import Dict, Any
-from flask import Flask, Response
-from models import Publisher, db
-from routes.publishers import publishers_bp
+from flask import Response
+from models import Publisher, Category, Game, db
+from app import create_app
+from utils.database import init_schema
+from tests.query_harness import QueryBudgetMixin
 
 
-class TestPublishersRoutes(unittest.TestCase):
+class TestPublishersRoutes(QueryBudgetMixin, unittest.TestCase):
     """Test cases for publishers API endpoints"""
     
     # Test data
@@ -20,21 +22,25 @@ class TestPublishersRoutes(unittest.TestCase):
     
     # API paths
     PUBLISHERS_API_PATH: str = '/api/publishers'
+    
+    # Statement budget per request; plans are snapshotted in query_plans.json
+    QUERY_BUDGETS: Dict[str, tuple[str, int]] = {
+        'publishers': ('/api/publishers', 1),
+    }
+
+    # App configuration shared by every test
+    APP_CONFIG: Dict[str, Any] = {
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+    }
 
     def setUp(self) -> None:
         """Set up test database and seed data"""
-        self.app = Flask(__name__)
-        self.app.config['TESTING'] = True
-        self.app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'
-        self.app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-        
-        self.app.register_blueprint(publishers_bp)
+        self.app = create_app(self.APP_CONFIG)
         self.client = self.app.test_client()
         
-        db.init_app(self.app)
-        
+        init_schema(self.app)
         with self.app.app_context():
-            db.create_all()
             self._seed_test_data()
 
     def tearDown(self) -> None:
@@ -117,6 +123,68 @@ class TestPublishersRoutes(unittest.TestCase):
             self.assertIn('game_count', publisher)
             self.assertEqual(publisher['game_count'], 0)
 
+    def test_get_publishers_game_count_with_games(self) -> None:
+        """Test that game_count reflects the games assigned to each publisher"""
+        # Arrange - two games for the first publisher, one for the second
+        with self.app.app_context():
+            publishers = db.session.query(Publisher).order_by(Publisher.id).all()
+            other = Category(name="Strategy")
+            db.session.add_all([
+                Game(title=f"Game {index}", description="A game seeded for counting",
+                     publisher=publishers[0 if index < 2 else 1], category=other)
+                for index in range(3)
+            ])
+            db.session.commit()
+            expected = {
+                publishers[0].name: 2,
+                publishers[1].name: 1,
+                publishers[2].name: 0
+            }
+        
+        # Act
+        response = self.client.get(self.PUBLISHERS_API_PATH)
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        counts = {publisher['name']: publisher['game_count'] for publisher in data}
+        self.assertEqual(counts, expected)
+
+    def test_get_publishers_not_modified(self) -> None:
+        """Test that a matching If-None-Match returns 304"""
+        # Arrange
+        etag = self.client.get(self.PUBLISHERS_API_PATH).headers['ETag']
+        
+        # Act
+        response = self.client.get(self.PUBLISHERS_API_PATH, headers={'If-None-Match': etag})
+        
+        # Assert
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+
+    def test_get_publishers_etag_changes_after_write(self) -> None:
+        """Test that renaming a publisher invalidates previously issued ETags"""
+        # Arrange
+        etag = self.client.get(self.PUBLISHERS_API_PATH).headers['ETag']
+        with self.app.app_context():
+            publisher = db.session.query(Publisher).first()
+            publisher.name = "Renamed Publisher"
+            db.session.commit()
+        
+        # Act
+        response = self.client.get(self.PUBLISHERS_API_PATH, headers={'If-None-Match': etag})
+        data = self._get_response_data(response)
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Renamed Publisher", [item['name'] for item in data])
+
+    def test_query_budgets(self) -> None:
+        """Test statement counts and query plans of each endpoint against their budgets"""
+        for name, (path, max_statements) in self.QUERY_BUDGETS.items():
+            with self.subTest(name):
+                self.assertQueryBudget(name, path, max_statements)
+
 
 if __name__ == '__main__':
     unittest.main()
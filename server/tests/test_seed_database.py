@@ -0,0 +1,141 @@
+import os
+import tempfile
+import unittest
+from typing import Dict, Any
+from models import Game, Publisher, Category, db
+from utils.seed_database import bulk_load_games, create_app, read_game_rows
+from utils.generate_seed_data import generate_synthetic_csv
+
+
+class TestSeedDatabase(unittest.TestCase):
+    """Test cases for the bulk loader and synthetic seed data generator"""
+    
+    # Test data
+    TEST_DATA: Dict[str, Any] = {
+        "synthetic_count": 45,
+        "batch_size": 10,
+        "seed": 42
+    }
+
+    APP_CONFIG: Dict[str, Any] = {
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:'
+    }
+
+    def setUp(self) -> None:
+        """Set up test database and a scratch directory for CSV files"""
+        self.app = create_app(self.APP_CONFIG)
+        
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.temp_dir.name, 'games.csv')
+
+    def tearDown(self) -> None:
+        """Clean up test database and scratch files"""
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+        self.temp_dir.cleanup()
+
+    def _generate_csv(self) -> None:
+        """Helper method to write the synthetic CSV used by most tests"""
+        generate_synthetic_csv(self.csv_path, self.TEST_DATA["synthetic_count"], seed=self.TEST_DATA["seed"])
+
+    def _load_ratings(self) -> list[float]:
+        """Helper method to bulk load the CSV and return the generated ratings"""
+        with self.app.app_context():
+            bulk_load_games(self.csv_path, self.TEST_DATA["batch_size"], seed=self.TEST_DATA["seed"])
+            return [rating for (rating,) in db.session.query(Game.star_rating).order_by(Game.id)]
+
+    def test_generate_synthetic_csv_row_count(self) -> None:
+        """Test that the generator writes the requested number of unique titles"""
+        # Act
+        self._generate_csv()
+        rows = list(read_game_rows(self.csv_path))
+        
+        # Assert
+        self.assertEqual(len(rows), self.TEST_DATA["synthetic_count"])
+        self.assertEqual(len({row['Title'] for row in rows}), self.TEST_DATA["synthetic_count"])
+
+    def test_generate_synthetic_csv_is_deterministic(self) -> None:
+        """Test that the same seed produces the same file"""
+        # Arrange
+        other_path = os.path.join(self.temp_dir.name, 'other.csv')
+        
+        # Act
+        self._generate_csv()
+        generate_synthetic_csv(other_path, self.TEST_DATA["synthetic_count"], seed=self.TEST_DATA["seed"])
+        
+        # Assert
+        with open(self.csv_path, encoding='utf-8') as first, open(other_path, encoding='utf-8') as second:
+            self.assertEqual(first.read(), second.read())
+
+    def test_bulk_load_games_success(self) -> None:
+        """Test that every CSV row is loaded across several batches"""
+        # Arrange
+        self._generate_csv()
+        rows = list(read_game_rows(self.csv_path))
+        
+        # Act
+        with self.app.app_context():
+            game_count = bulk_load_games(self.csv_path, self.TEST_DATA["batch_size"], seed=self.TEST_DATA["seed"])
+            
+            # Assert
+            self.assertEqual(game_count, len(rows))
+            self.assertEqual(db.session.query(Game).count(), len(rows))
+            self.assertEqual(db.session.query(Category).count(), len({row['Category'] for row in rows}))
+            self.assertEqual(db.session.query(Publisher).count(), len({row['Publisher'] for row in rows}))
+            first_game = db.session.query(Game).order_by(Game.id).first()
+            self.assertEqual(first_game.title, rows[0]['Title'])
+            self.assertEqual(first_game.category.name, rows[0]['Category'])
+            self.assertEqual(first_game.publisher.name, rows[0]['Publisher'])
+
+    def test_bulk_load_games_reuses_existing_lookups(self) -> None:
+        """Test that loading twice does not duplicate categories or publishers"""
+        # Arrange
+        self._generate_csv()
+        
+        # Act
+        with self.app.app_context():
+            bulk_load_games(self.csv_path, self.TEST_DATA["batch_size"])
+            category_count = db.session.query(Category).count()
+            bulk_load_games(self.csv_path, self.TEST_DATA["batch_size"])
+            
+            # Assert
+            self.assertEqual(db.session.query(Category).count(), category_count)
+            self.assertEqual(db.session.query(Game).count(), self.TEST_DATA["synthetic_count"] * 2)
+
+    def test_bulk_load_games_deterministic_ratings(self) -> None:
+        """Test that the same seed produces the same star ratings"""
+        # Arrange
+        self._generate_csv()
+        first_ratings = self._load_ratings()
+        with self.app.app_context():
+            db.session.query(Game).delete()
+            db.session.commit()
+        
+        # Act
+        second_ratings = self._load_ratings()
+        
+        # Assert
+        self.assertEqual(first_ratings, second_ratings)
+        self.assertTrue(all(3.0 <= rating <= 5.0 for rating in first_ratings))
+
+    def test_bulk_load_games_indexes_for_search(self) -> None:
+        """Test that bulk loaded games are searchable once the load completes"""
+        # Arrange
+        self._generate_csv()
+        
+        # Act
+        with self.app.app_context():
+            bulk_load_games(self.csv_path, self.TEST_DATA["batch_size"])
+            matches = db.session.execute(
+                db.text("SELECT COUNT(*) FROM games_fts WHERE games_fts MATCH 'mona'")
+            ).scalar()
+        
+        # Assert
+        self.assertGreater(matches, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+import unittest
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from typing import Dict, Any
+from flask import Flask
+from sqlalchemy.exc import OperationalError
+from app import create_app
+from models import Category, db
+from serve import BaseApplication, build_serving_app, get_gunicorn_options
+from utils.database import get_read_only_uri, init_schema
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestServe(unittest.TestCase):
+    """Test cases for the multi-process serving entry point"""
+
+    # Test data
+    TEST_DATA: Dict[str, Any] = {
+        "categories": [
+            {"name": "Strategy", "description": "Games requiring tactical thinking"}
+        ],
+        "workers": 2,
+        "startup_timeout_seconds": 15
+    }
+
+    # API paths
+    CATEGORIES_API_PATH: str = '/api/categories'
+
+    def setUp(self) -> None:
+        """Set up a seeded database file"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'tailspin-toys.db')
+
+        app = create_app({'TESTING': True, 'SQLALCHEMY_DATABASE_URI': f'sqlite:///{self.db_path}'})
+        init_schema(app)
+        with app.app_context():
+            db.session.add_all([Category(**data) for data in self.TEST_DATA["categories"]])
+            db.session.commit()
+        self._dispose(app)
+
+    def tearDown(self) -> None:
+        """Clean up scratch files"""
+        self.temp_dir.cleanup()
+
+    def _dispose(self, app: Flask) -> None:
+        """Helper method to close the app's connections"""
+        with app.app_context():
+            db.session.remove()
+            db.engine.dispose()
+
+    def _get_free_port(self) -> int:
+        """Helper method to find a port nothing listens on"""
+        with socket.socket() as probe:
+            probe.bind(('127.0.0.1', 0))
+            return probe.getsockname()[1]
+
+    def _wait_for_server(self, url: str, process: subprocess.Popen) -> Any:
+        """Helper method to poll the server until it answers"""
+        deadline = time.monotonic() + self.TEST_DATA["startup_timeout_seconds"]
+        while True:
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    return json.loads(response.read())
+            except OSError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise
+                time.sleep(0.1)
+
+    def test_read_only_uri(self) -> None:
+        """Test that file URIs are rewritten to SQLite's read-only mode"""
+        # Act
+        uri = get_read_only_uri(f'sqlite:///{self.db_path}')
+
+        # Assert
+        self.assertTrue(uri.startswith('sqlite:///file:'))
+        self.assertTrue(uri.endswith('?mode=ro&uri=true'))
+        self.assertEqual(get_read_only_uri(uri), uri)
+        with self.assertRaises(ValueError):
+            get_read_only_uri('sqlite:///:memory:')
+
+    def test_read_only_app_reads_but_cannot_write(self) -> None:
+        """Test that a read-only serving app, even with WAL in its profile, only reads"""
+        # Arrange
+        app = build_serving_app(self.db_path, read_only=True, profile='production')
+        self.addCleanup(self._dispose, app)
+
+        # Act
+        response = app.test_client().get(self.CATEGORIES_API_PATH)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.get_json()), len(self.TEST_DATA["categories"]))
+        with app.app_context():
+            db.session.add(Category(name="Card Game", description="Card-based gameplay mechanics"))
+            with self.assertRaisesRegex(OperationalError, 'readonly'):
+                db.session.commit()
+            db.session.rollback()
+
+    def test_gunicorn_options(self) -> None:
+        """Test that gunicorn preloads the app and serves from the bound socket"""
+        # Arrange
+        with socket.create_server(('127.0.0.1', 0)) as listener:
+            for threads, worker_class in [(1, 'sync'), (4, 'gthread')]:
+                with self.subTest(threads=threads):
+                    # Act
+                    options = get_gunicorn_options(listener, self.TEST_DATA["workers"], threads, access_log=False)
+
+                    # Assert
+                    self.assertTrue(options['preload_app'])
+                    self.assertEqual(options['bind'], [f'fd://{listener.fileno()}'])
+                    self.assertEqual(options['workers'], self.TEST_DATA["workers"])
+                    self.assertEqual(options['worker_class'], worker_class)
+                    self.assertIsNone(options['accesslog'])
+
+    @unittest.skipIf(BaseApplication is None, "Worker processes need gunicorn")
+    def test_workers_serve_and_stop(self) -> None:
+        """Test that forked workers answer requests and exit on SIGTERM"""
+        # Arrange
+        port = self._get_free_port()
+        process = subprocess.Popen(
+            [sys.executable, 'serve.py', '--port', str(port), '--workers', str(self.TEST_DATA["workers"]),
+             '--database', self.db_path],
+            cwd=SERVER_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+        )
+        self.addCleanup(process.stderr.close)
+
+        try:
+            # Act
+            data = self._wait_for_server(f'http://127.0.0.1:{port}{self.CATEGORIES_API_PATH}', process)
+        finally:
+            process.send_signal(signal.SIGTERM)
+            return_code = process.wait(timeout=self.TEST_DATA["startup_timeout_seconds"])
+
+        # Assert
+        self.assertEqual(data[0]['name'], "Strategy")
+        self.assertEqual(return_code, 0)
+        self.assertIn(f"with {self.TEST_DATA['workers']} worker(s)", process.stderr.read())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+from typing import Dict, Any
+from unittest import mock
+from flask import Flask
+from app import create_app
+from models import Category, db
+from utils.database import init_schema
+import utils.slow_query_log as slow_query_log
+from utils.slow_query_log import init_slow_query_log
+
+
+class TestSlowQueryLog(unittest.TestCase):
+    """Test cases for the slow query log"""
+
+    # Test data
+    TEST_DATA: Dict[str, Any] = {
+        "categories": [
+            {"name": "Strategy", "description": "Games requiring tactical thinking"}
+        ]
+    }
+
+    # API paths
+    CATEGORIES_API_PATH: str = '/api/categories'
+    LOGGER_NAME: str = 'tailspin.slow_query'
+
+    # The catalog snapshot and detail cache are off so every request reaches SQLite
+    APP_CONFIG: Dict[str, Any] = {
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+        'CATALOG_SNAPSHOT_ENABLED': False,
+        'GAME_DETAIL_CACHE_SIZE': 0
+    }
+
+    def setUp(self) -> None:
+        """Set up test database and seed data with the slow query log off"""
+        self.app = self._create_app({})
+
+    def tearDown(self) -> None:
+        """Clean up test database without logging the teardown statements"""
+        with mock.patch.object(slow_query_log.logger, 'disabled', True), self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+            db.engine.dispose()
+
+    def _create_app(self, config: Dict[str, Any]) -> Flask:
+        """Helper method to build a seeded app, replacing the one from setUp"""
+        if hasattr(self, 'app'):
+            self.tearDown()
+
+        # Setting up the schema is not what's under test, so it isn't logged
+        with mock.patch.object(slow_query_log.logger, 'disabled', True):
+            app = create_app({**self.APP_CONFIG, **config})
+            init_schema(app)
+            with app.app_context():
+                db.session.add_all([Category(**data) for data in self.TEST_DATA["categories"]])
+                db.session.commit()
+
+        self.app = app
+        self.client = app.test_client()
+        return app
+
+    def test_logs_statement_with_request_context(self) -> None:
+        """Test that statements over the threshold are logged with endpoint and args"""
+        # Arrange
+        self._create_app({'SLOW_QUERY_THRESHOLD_MS': 0})
+
+        # Act
+        with self.assertLogs(self.LOGGER_NAME, level='WARNING') as logs:
+            response = self.client.get(f'{self.CATEGORIES_API_PATH}?page=2')
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn('categories.get_categories', logs.output[0])
+        self.assertIn("args={'page': ['2']}", logs.output[0])
+        self.assertIn('FROM categories', logs.output[0])
+        self.assertRegex(logs.output[0], r'Slow query \([\d.]+ ms\)')
+
+    def test_fast_statements_not_logged(self) -> None:
+        """Test that statements under the threshold are not logged"""
+        # Arrange
+        self._create_app({'SLOW_QUERY_THRESHOLD_MS': 60_000})
+
+        # Act
+        with self.assertNoLogs(self.LOGGER_NAME, level='WARNING'):
+            response = self.client.get(self.CATEGORIES_API_PATH)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+
+    def test_sampling(self) -> None:
+        """Test that only the sampled fraction of slow statements is logged"""
+        # Arrange
+        self._create_app({'SLOW_QUERY_THRESHOLD_MS': 0, 'SLOW_QUERY_SAMPLE_RATE': 0.5})
+
+        # Act
+        with mock.patch.object(slow_query_log.random, 'random', side_effect=[0.9, 0.1]):
+            with self.assertNoLogs(self.LOGGER_NAME, level='WARNING'):
+                self.client.get(self.CATEGORIES_API_PATH)
+            with self.assertLogs(self.LOGGER_NAME, level='WARNING') as logs:
+                self.client.get(self.CATEGORIES_API_PATH)
+
+        # Assert
+        self.assertEqual(len(logs.output), 1)
+
+    def test_disabled_without_threshold(self) -> None:
+        """Test that the log is off unless a threshold is configured"""
+        # Act
+        with mock.patch.dict('os.environ', {}, clear=True):
+            enabled = init_slow_query_log(self.app)
+
+        # Assert
+        self.assertFalse(enabled)
+
+    def test_threshold_from_environment(self) -> None:
+        """Test that the threshold can be set through the environment"""
+        # Act
+        with mock.patch.dict('os.environ', {'TAILSPIN_SLOW_QUERY_THRESHOLD_MS': '250'}):
+            enabled = init_slow_query_log(self.app)
+
+        # Assert
+        self.assertTrue(enabled)
+
+    def test_invalid_sample_rate(self) -> None:
+        """Test that a sample rate outside 0..1 is rejected"""
+        # Act / Assert
+        with self.assertRaises(ValueError):
+            create_app({**self.APP_CONFIG, 'SLOW_QUERY_THRESHOLD_MS': 100, 'SLOW_QUERY_SAMPLE_RATE': 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
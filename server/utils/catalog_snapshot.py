@@ -0,0 +1,227 @@
+"""
+Optional in-memory snapshot of the serialized game catalog.
+
+The snapshot holds every game already encoded as JSON bytes plus, for each
+(category_id, publisher_id) filter combination, the matching ids in id
+order. List pages and detail lookups in the default order then become a
+bisect, a slice and a byte join, with no SQL, ORM objects or encoding.
+
+A snapshot is tagged with the data version it was built under and is only
+served while that version is current. After a write the next request finds
+it stale, starts a rebuild in a background thread and falls back to SQLite
+until the new snapshot replaces the old one in a single assignment. When a
+build fails, no new one starts for that data version until the retry
+backoff has passed, so a broken build doesn't run on every request.
+
+Enable with CATALOG_SNAPSHOT_ENABLED (or TAILSPIN_CATALOG_SNAPSHOT_ENABLED=1).
+"""
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from flask import Flask, Response, current_app
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, contains_eager
+from models import db, Game
+from utils.data_version import get_data_version
+from utils.metrics import get_process_labels
+from utils.pagination import encode_cursor
+
+logger = logging.getLogger('tailspin.catalog_snapshot')
+
+ENABLED_CONFIG_KEY = 'CATALOG_SNAPSHOT_ENABLED'
+ENABLED_ENV_VAR = 'TAILSPIN_CATALOG_SNAPSHOT_ENABLED'
+# Rebuild in a background thread (default) or inside the request that finds the snapshot stale
+BACKGROUND_CONFIG_KEY = 'CATALOG_SNAPSHOT_BACKGROUND'
+# Seconds to wait after a failed build before building the same data version again
+RETRY_BACKOFF_CONFIG_KEY = 'CATALOG_SNAPSHOT_RETRY_BACKOFF'
+DEFAULT_RETRY_BACKOFF_SECONDS = 30.0
+
+# Key of the CatalogSnapshotStore in app.extensions
+EXTENSION_KEY = 'tailspin_catalog_snapshot'
+# Games read from SQLite per batch while building
+BUILD_BATCH_SIZE = 1000
+
+FilterKey = tuple[int | None, int | None]
+
+_NO_IDS = array('q')
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    version: int
+    # Game id -> the game's to_dict() encoded as JSON
+    games: dict[int, bytes]
+    # (category_id, publisher_id) with None for "any" -> matching ids, ascending
+    ids: dict[FilterKey, array]
+    memory_bytes: int
+
+    def get_game_json(self, game_id: int) -> bytes | None:
+        return self.games.get(game_id)
+
+    def get_page_json(self, category_id: int | None, publisher_id: int | None, limit: int, offset: int,
+                      after_id: int | None, include_total: bool) -> bytes:
+        """
+        Returns the get_games response body for a page in id order, starting
+        after after_id when a cursor was given and at offset otherwise.
+        """
+        ids = self.ids.get((category_id, publisher_id), _NO_IDS)
+        start = bisect_right(ids, after_id) if after_id is not None else offset
+        page_ids = ids[start:start + limit + 1]
+        has_more = len(page_ids) > limit
+        page_ids = page_ids[:limit]
+
+        next_cursor = encode_cursor({'id': page_ids[-1]}) if has_more and page_ids else None
+        return b''.join([
+            b'{"games":[', b','.join(self.games[game_id] for game_id in page_ids),
+            b'],"hasMore":', json.dumps(has_more).encode(),
+            b',"nextCursor":', json.dumps(next_cursor).encode(),
+            b',"total":', json.dumps(len(ids) if include_total else None).encode(),
+            b'}\n',
+        ])
+
+
+def build_catalog_snapshot(app: Flask) -> CatalogSnapshot:
+    """Reads and serializes the whole catalog. Needs an app context."""
+    version = get_data_version()
+    games: dict[int, bytes] = {}
+    ids: dict[FilterKey, array] = {}
+
+    # A separate session keeps the catalog's ORM objects out of the request's identity map
+    with Session(db.engine) as session:
+        query = session.query(Game).outerjoin(Game.publisher).outerjoin(Game.category).options(
+            contains_eager(Game.publisher), contains_eager(Game.category)
+        ).order_by(Game.id).yield_per(BUILD_BATCH_SIZE)
+        for game in query:
+            games[game.id] = app.json.dumps(game.to_dict()).encode('utf-8')
+            for key in ((None, None), (game.category_id, None), (None, game.publisher_id),
+                        (game.category_id, game.publisher_id)):
+                ids.setdefault(key, array('q')).append(game.id)
+
+    memory_bytes = (
+        sys.getsizeof(games) + sum(sys.getsizeof(body) for body in games.values())
+        + sys.getsizeof(ids) + sum(sys.getsizeof(id_list) for id_list in ids.values())
+    )
+    return CatalogSnapshot(version, games, ids, memory_bytes)
+
+
+class CatalogSnapshotStore:
+    """Holds the current snapshot for one app and rebuilds it when it goes stale"""
+
+    def __init__(self, app: Flask, background: bool = True,
+                 retry_backoff: float = DEFAULT_RETRY_BACKOFF_SECONDS) -> None:
+        self.app = app
+        self.background = background
+        self.retry_backoff = retry_backoff
+        self.snapshot: CatalogSnapshot | None = None
+        self.rebuilds = 0
+        self.failures = 0
+        # Data version and time.monotonic() of the last failed build
+        self.failed_version: int | None = None
+        self.failed_at = 0.0
+        self._rebuild_lock = threading.Lock()
+
+    def get(self) -> CatalogSnapshot | None:
+        """Returns the snapshot if it is current, otherwise starts a rebuild and returns None"""
+        snapshot = self.snapshot
+        version = get_data_version()
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+        if self._backing_off(version):
+            return None
+
+        if self.background:
+            if not self._rebuild_lock.locked():
+                threading.Thread(target=self.rebuild, name='catalog-snapshot', daemon=True).start()
+            return None
+        self.rebuild()
+        snapshot = self.snapshot
+        return snapshot if snapshot is not None and snapshot.version == get_data_version() else None
+
+    def _backing_off(self, version: int) -> bool:
+        return self.failed_version == version and time.monotonic() - self.failed_at < self.retry_backoff
+
+    def rebuild(self) -> None:
+        # A rebuild already under way will pick up the latest version, or the
+        # next request will start another one
+        if not self._rebuild_lock.acquire(blocking=False):
+            return
+        version = get_data_version()
+        try:
+            start = time.perf_counter()
+            with self.app.app_context():
+                snapshot = build_catalog_snapshot(self.app)
+            self.snapshot = snapshot
+            self.rebuilds += 1
+            self.failed_version = None
+            logger.info(
+                'Built catalog snapshot of %d games for data version %d in %.0f ms using %.1f MiB',
+                len(snapshot.games), snapshot.version, (time.perf_counter() - start) * 1000,
+                snapshot.memory_bytes / (1024 * 1024)
+            )
+        except Exception:
+            self.failures += 1
+            self.failed_version = version
+            self.failed_at = time.monotonic()
+            logger.exception(
+                'Building the catalog snapshot for data version %d failed, retrying in %.0f s',
+                version, self.retry_backoff
+            )
+        finally:
+            self._rebuild_lock.release()
+
+    def render_prometheus(self) -> str:
+        snapshot = self.snapshot
+        labels = get_process_labels()
+        lines: list[str] = []
+        for name, metric_type, help_text, value in (
+            ('games', 'gauge', 'Games in the current snapshot.', len(snapshot.games) if snapshot else 0),
+            ('memory_bytes', 'gauge', 'Estimated size of the current snapshot.', snapshot.memory_bytes if snapshot else 0),
+            ('rebuilds_total', 'counter', 'Snapshots built successfully.', self.rebuilds),
+            ('rebuild_failures_total', 'counter', 'Snapshot builds that failed.', self.failures),
+        ):
+            lines += [f'# HELP tailspin_catalog_snapshot_{name} {help_text}',
+                      f'# TYPE tailspin_catalog_snapshot_{name} {metric_type}',
+                      f'tailspin_catalog_snapshot_{name}{{{labels}}} {value}']
+        return '\n'.join(lines) + '\n'
+
+
+def get_catalog_snapshot() -> CatalogSnapshot | None:
+    """Returns the app's current snapshot, or None when it is disabled or stale"""
+    store = get_catalog_snapshot_store()
+    return store.get() if store is not None else None
+
+
+def get_catalog_snapshot_store() -> CatalogSnapshotStore | None:
+    return current_app.extensions.get(EXTENSION_KEY)
+
+
+def snapshot_response(body: bytes) -> Response:
+    return current_app.response_class(body, mimetype=current_app.json.mimetype)
+
+
+def init_catalog_snapshot(app: Flask) -> CatalogSnapshotStore | None:
+    """
+    Registers the store on the app when enabled and builds the first
+    snapshot if the schema exists; otherwise the first request after
+    init-db builds it. Returns None when disabled.
+    """
+    enabled = app.config.get(ENABLED_CONFIG_KEY, os.environ.get(ENABLED_ENV_VAR, '').lower() in ('1', 'true'))
+    if not enabled:
+        return None
+
+    store = CatalogSnapshotStore(
+        app, background=app.config.get(BACKGROUND_CONFIG_KEY, True),
+        retry_backoff=float(app.config.get(RETRY_BACKOFF_CONFIG_KEY, DEFAULT_RETRY_BACKOFF_SECONDS))
+    )
+    with app.app_context():
+        schema_exists = inspect(db.engine).has_table(Game.__tablename__)
+    if schema_exists:
+        store.rebuild()
+    app.extensions[EXTENSION_KEY] = store
+    return store
@@ -0,0 +1,86 @@
+import gzip
+from flask import Flask, Response, current_app, request
+from utils.query_cache import QueryCache
+
+# brotli is listed in requirements.txt; without it only gzip is offered
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bodies smaller than this many bytes are sent as they are; config key COMPRESS_MIN_SIZE
+DEFAULT_MIN_SIZE = 1024
+# Bodies larger than this are compressed per request instead of being cached
+MAX_CACHED_SIZE = 256 * 1024
+# Compressed bodies kept per app; config key COMPRESS_CACHE_SIZE
+DEFAULT_CACHE_SIZE = 256
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+COMPRESSIBLE_MIMETYPES = ('application/json', 'application/x-ndjson', 'text/html', 'text/plain')
+
+# Compressed bodies of responses tagged by conditional_get, keyed by
+# (path with query string, ETag, encoding). The ETag carries the data
+# version, and the cache is dropped whenever that version changes. Least
+# recently used bodies are evicted first, so the hot responses
+# (categories, publishers, first pages of /api/games) stay cached while
+# game details and deep pages come and go.
+EXTENSION_KEY = 'tailspin_compressed_body_cache'
+
+
+def get_compressed_body_cache() -> QueryCache | None:
+    """The current app's cache of compressed bodies, if compression is registered"""
+    return current_app.extensions.get(EXTENSION_KEY)
+
+
+def get_available_encodings() -> list[str]:
+    """Encodings the server can produce, in order of preference"""
+    return ['br', 'gzip'] if brotli is not None else ['gzip']
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def compress_response(response: Response) -> Response:
+    """
+    Compresses a buffered response with the best encoding the client
+    accepts. Streamed responses are left alone so they keep flowing chunk
+    by chunk; so are small bodies, where the savings don't pay for the CPU.
+    """
+    if (response.status_code != 200 or response.mimetype not in COMPRESSIBLE_MIMETYPES
+            or 'Content-Encoding' in response.headers):
+        return response
+
+    response.vary.add('Accept-Encoding')
+    if response.is_streamed or response.direct_passthrough:
+        return response
+
+    encoding = request.accept_encodings.best_match(get_available_encodings())
+    if encoding is None:
+        return response
+
+    body = response.get_data()
+    if len(body) < current_app.config.get('COMPRESS_MIN_SIZE', DEFAULT_MIN_SIZE):
+        return response
+
+    etag, _ = response.get_etag()
+    cache = get_compressed_body_cache()
+    if etag is not None and cache is not None and len(body) <= MAX_CACHED_SIZE:
+        compressed = cache.get_or_compute(
+            (request.full_path, etag, encoding), lambda: compress_body(body, encoding)
+        )
+    else:
+        compressed = compress_body(body, encoding)
+
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+
+def init_compression(app: Flask) -> None:
+    """Negotiates gzip or brotli compression for every response of the app"""
+    app.extensions[EXTENSION_KEY] = QueryCache(max_entries=app.config.get('COMPRESS_CACHE_SIZE', DEFAULT_CACHE_SIZE))
+    app.after_request(compress_response)
@@ -0,0 +1,157 @@
+"""
+Global catalog data version.
+
+The version is bumped on every commit that writes a Game, Category or
+Publisher row, whether through the unit of work or a bulk query
+update/delete/insert. Caches and ETags derive from it so they go stale
+the moment the catalog changes.
+
+The counter lives in process memory and is combined with a random boot id,
+so two processes never hand out the same ETag. Commits made by other
+processes (the seed script, init-db, admin tooling or another worker) are
+picked up by init_data_version_watch: before a request it reads SQLite's
+PRAGMA data_version on a dedicated connection, at most once every
+DATA_VERSION_POLL_INTERVAL seconds, and bumps the version when the file has
+changed since the last check.
+"""
+import os
+import threading
+import time
+import uuid
+from typing import Any
+from flask import Flask
+from sqlalchemy import Engine, event
+from sqlalchemy.orm import Session, ORMExecuteState
+
+# Session.info key used to remember that a transaction wrote catalog rows
+_CATALOG_CHANGED_KEY = 'data_version_catalog_changed'
+
+# Key of the ExternalWriteWatcher in app.extensions
+EXTENSION_KEY = 'tailspin_data_version_watch'
+# Seconds between checks for commits made by other processes; 0 checks before every request
+POLL_INTERVAL_CONFIG_KEY = 'DATA_VERSION_POLL_INTERVAL'
+DEFAULT_POLL_INTERVAL_SECONDS = 1.0
+
+_boot_id: str = uuid.uuid4().hex[:8]
+_version: int = 0
+_lock = threading.Lock()
+
+
+def get_data_version() -> int:
+    return _version
+
+
+def bump_data_version() -> int:
+    global _version
+    with _lock:
+        _version += 1
+        return _version
+
+
+def get_data_etag() -> str:
+    """Returns an entity tag identifying the current catalog contents."""
+    return f'{_boot_id}-{_version}'
+
+
+class ExternalWriteWatcher:
+    """
+    Bumps the data version when any other connection, in this process or
+    another, has committed to the database file since the last poll.
+    """
+
+    def __init__(self, engine: Engine, poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS) -> None:
+        self.engine = engine
+        self.poll_interval = poll_interval
+        self._connection: Any = None
+        self._pid: int | None = None
+        self._file_version: int | None = None
+        self._checked_at = float('-inf')
+        self._lock = threading.Lock()
+
+    def poll(self) -> None:
+        now = time.monotonic()
+        # Another thread already checking is as good as checking here
+        if now - self._checked_at < self.poll_interval or not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._checked_at = now
+            file_version = self._read_file_version()
+            if self._file_version is not None and file_version != self._file_version:
+                bump_data_version()
+            self._file_version = file_version
+        finally:
+            self._lock.release()
+
+    def _read_file_version(self) -> int:
+        # PRAGMA data_version only changes for commits made by other
+        # connections, so it needs a connection of its own, opened in the
+        # process that uses it rather than inherited across a fork
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = self.engine.raw_connection()
+            self._connection.detach()
+            self._pid = os.getpid()
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute('PRAGMA data_version')
+            return cursor.fetchone()[0]
+        finally:
+            cursor.close()
+
+
+def init_data_version_watch(app: Flask) -> ExternalWriteWatcher | None:
+    """
+    Checks for commits from other processes before requests. Returns None
+    for in-memory or non-SQLite databases, which no other process can write.
+    """
+    from models import db
+
+    with app.app_context():
+        engine = db.engine
+    if engine.dialect.name != 'sqlite' or engine.url.database in (None, '', ':memory:'):
+        return None
+
+    watcher = ExternalWriteWatcher(engine, float(app.config.get(POLL_INTERVAL_CONFIG_KEY, DEFAULT_POLL_INTERVAL_SECONDS)))
+    app.extensions[EXTENSION_KEY] = watcher
+    app.before_request(watcher.poll)
+    return watcher
+
+
+def _catalog_models() -> tuple[type, ...]:
+    # Imported lazily to avoid a circular import with the models package
+    from models import Game, Category, Publisher
+    return (Game, Category, Publisher)
+
+
+def _touches_catalog(session: Session) -> bool:
+    models = _catalog_models()
+    return any(
+        isinstance(instance, models)
+        for instances in (session.new, session.dirty, session.deleted)
+        for instance in instances
+    )
+
+
+@event.listens_for(Session, 'after_flush')
+def _record_catalog_writes(session: Session, flush_context: Any) -> None:
+    if _touches_catalog(session):
+        session.info[_CATALOG_CHANGED_KEY] = True
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _record_bulk_catalog_writes(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.is_select:
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and issubclass(mapper.class_, _catalog_models()):
+        orm_execute_state.session.info[_CATALOG_CHANGED_KEY] = True
+
+
+@event.listens_for(Session, 'after_commit')
+def _bump_after_commit(session: Session) -> None:
+    if session.info.pop(_CATALOG_CHANGED_KEY, False):
+        bump_data_version()
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_after_rollback(session: Session, previous_transaction: Any) -> None:
+    session.info.pop(_CATALOG_CHANGED_KEY, None)
@@ -1,4 +1,48 @@
 import os
+import re
+from typing import Any
+from urllib.parse import quote
+from flask import Flask
+from sqlalchemy import Connection, Engine, event, inspect, make_url, text
+from models import db, ensure_search_index
+
+# Environment variable selecting one of ENGINE_PROFILES
+PROFILE_ENV_VAR = 'TAILSPIN_DB_PROFILE'
+DEFAULT_PROFILE = 'default'
+
+# Named engine profiles: PRAGMAs applied to every new SQLite connection and
+# pool settings for file-backed databases. 'default' leaves SQLite and
+# SQLAlchemy untouched; 'production' is tuned for many concurrent readers.
+ENGINE_PROFILES: dict[str, dict[str, dict[str, Any]]] = {
+    'default': {
+        'pragmas': {},
+        'pool': {},
+    },
+    'production': {
+        'pragmas': {
+            'journal_mode': 'WAL',       # readers no longer block on the writer
+            'synchronous': 'NORMAL',     # safe with WAL, avoids an fsync per commit
+            'cache_size': -65536,        # 64 MiB page cache per connection
+            'mmap_size': 268435456,      # read up to 256 MiB through the OS page cache
+            'temp_store': 'MEMORY',
+            'busy_timeout': 5000,        # wait up to 5s for locks instead of failing
+        },
+        'pool': {
+            'pool_size': 10,
+            'max_overflow': 20,
+            'pool_recycle': 3600,
+            'pool_pre_ping': True,
+        },
+    },
+}
+
+# Individual settings can be overridden with TAILSPIN_SQLITE_<PRAGMA> and
+# TAILSPIN_DB_<POOL_OPTION>, e.g. TAILSPIN_SQLITE_CACHE_SIZE=-20000
+PRAGMA_NAMES = ('journal_mode', 'synchronous', 'cache_size', 'mmap_size', 'temp_store', 'busy_timeout')
+POOL_OPTIONS = ('pool_size', 'max_overflow', 'pool_recycle', 'pool_timeout')
+
+_PRAGMA_VALUE_PATTERN = re.compile(r'^-?\w+$')
+
 
 def get_connection_string() -> str:
     """
@@ -13,4 +57,129 @@ def get_connection_string() -> str:
     # Create the data directory if it doesn't exist
     os.makedirs(data_dir, exist_ok=True)
     
-    return f'sqlite:///{os.path.join(data_dir, "tailspin-toys.db")}'
\ No newline at end of file
+    return f'sqlite:///{os.path.join(data_dir, "tailspin-toys.db")}'
+
+
+def get_read_only_uri(database_uri: str) -> str:
+    """
+    Returns a URI opening the same SQLite file with mode=ro, so connections
+    can read but never write, lock for writing or create the file.
+    """
+    url = make_url(database_uri)
+    if url.get_backend_name() != 'sqlite' or url.database in (None, '', ':memory:'):
+        raise ValueError(f"Read-only mode needs a file-backed SQLite database, got '{database_uri}'")
+    if url.query.get('mode') == 'ro':
+        return database_uri
+    path = quote(os.path.abspath(url.database).replace(os.sep, '/'), safe='/:')
+    return f'sqlite:///file:{path}?mode=ro&uri=true'
+
+
+def get_engine_profile(name: str | None = None) -> dict[str, dict[str, Any]]:
+    """
+    Returns the PRAGMAs and pool settings for the named profile, defaulting
+    to the profile selected by TAILSPIN_DB_PROFILE, with any per-setting
+    environment overrides applied.
+    """
+    name = name or os.environ.get(PROFILE_ENV_VAR, DEFAULT_PROFILE)
+    if name not in ENGINE_PROFILES:
+        raise ValueError(f"Unknown database profile '{name}', expected one of {', '.join(ENGINE_PROFILES)}")
+
+    pragmas = dict(ENGINE_PROFILES[name]['pragmas'])
+    for pragma in PRAGMA_NAMES:
+        value = os.environ.get(f'TAILSPIN_SQLITE_{pragma.upper()}')
+        if value is not None:
+            pragmas[pragma] = value
+
+    pool = dict(ENGINE_PROFILES[name]['pool'])
+    for option in POOL_OPTIONS:
+        value = os.environ.get(f'TAILSPIN_DB_{option.upper()}')
+        if value is not None:
+            pool[option] = int(value)
+
+    return {'pragmas': pragmas, 'pool': pool}
+
+
+def get_engine_options(profile: dict[str, dict[str, Any]], database_uri: str) -> dict[str, Any]:
+    """
+    Returns SQLALCHEMY_ENGINE_OPTIONS for a profile. Pool sizing only applies
+    to file-backed databases; in-memory SQLite uses a single static connection.
+    """
+    if database_uri in ('sqlite://', 'sqlite:///:memory:'):
+        return {}
+    return dict(profile['pool'])
+
+
+def apply_sqlite_pragmas(engine: Engine, pragmas: dict[str, Any]) -> None:
+    """
+    Runs the given PRAGMAs on every new connection the engine opens.
+    """
+    if engine.url.query.get('mode') == 'ro':
+        # The journal mode is stored in the file and only a writer can change it
+        pragmas = {name: value for name, value in pragmas.items() if name != 'journal_mode'}
+    if engine.dialect.name != 'sqlite' or not pragmas:
+        return
+
+    for name, value in pragmas.items():
+        if name not in PRAGMA_NAMES or not _PRAGMA_VALUE_PATTERN.match(str(value)):
+            raise ValueError(f"Invalid SQLite pragma {name}={value}")
+
+    @event.listens_for(engine, 'connect')
+    def set_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f'PRAGMA {name}={value}')
+        cursor.close()
+
+
+def init_database(app: Flask, profile_name: str | None = None) -> None:
+    """
+    Binds the shared SQLAlchemy instance to the app using the selected engine
+    profile. SQLALCHEMY_DATABASE_URI must already be set.
+    """
+    profile = get_engine_profile(profile_name)
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', get_engine_options(profile, app.config['SQLALCHEMY_DATABASE_URI']))
+    db.init_app(app)
+    
+    with app.app_context():
+        apply_sqlite_pragmas(db.engine, profile['pragmas'])
+
+
+def ensure_indexes(connection: Connection) -> list[str]:
+    """
+    Creates any index declared on the models that is missing from an
+    existing database, so new indexes reach old databases without a
+    rebuild. Tables that gained an index are re-analyzed so the query
+    planner knows about it. Returns the names of the created indexes.
+    """
+    inspector = inspect(connection)
+    created: list[str] = []
+    analyze_tables: set[str] = set()
+    
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(connection)
+                created.append(index.name)
+                analyze_tables.add(table.name)
+    
+    if connection.dialect.name == 'sqlite':
+        for table_name in sorted(analyze_tables):
+            connection.execute(text(f'ANALYZE "{table_name}"'))
+    
+    return created
+
+
+def init_schema(app: Flask) -> list[str]:
+    """
+    Creates missing tables, the search index and any indexes added since the
+    database was created. Safe to run against an existing database. Returns
+    the names of the created indexes.
+    """
+    with app.app_context():
+        db.create_all()
+        with db.engine.begin() as connection:
+            ensure_search_index(connection)
+            return ensure_indexes(connection)
@@ -0,0 +1,200 @@
+"""
+Per-id LRU cache of serialized game detail responses.
+
+Detail traffic is skewed toward a few popular games, so the rendered
+response for each id is kept until it expires, is evicted as least
+recently used, or the game changes. Missing ids are cached as 404s too.
+
+Unlike QueryCache, which drops everything when the data version moves,
+entries are invalidated one by one: session events collect the ids of
+games written in a transaction, and of games whose publisher or category
+was renamed or deleted, and drop just those entries once it commits. Bulk
+update/delete/insert statements can't be traced to ids and clear the cache.
+"""
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+from flask import Flask, current_app, has_app_context
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, ORMExecuteState
+from utils.metrics import get_process_labels
+
+# Key of the GameDetailCache in app.extensions
+EXTENSION_KEY = 'tailspin_game_detail_cache'
+
+# Config keys; a size of 0 disables the cache
+SIZE_CONFIG_KEY = 'GAME_DETAIL_CACHE_SIZE'
+TTL_CONFIG_KEY = 'GAME_DETAIL_CACHE_TTL'
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 300.0
+
+# Session.info key collecting what a transaction invalidates
+_PENDING_KEY = 'game_detail_cache_pending'
+
+
+@dataclass(frozen=True)
+class GameDetail:
+    status: int
+    body: bytes
+    # None for cached 404s
+    publisher_id: int | None = None
+    category_id: int | None = None
+
+
+@dataclass
+class _PendingInvalidations:
+    game_ids: set[int]
+    publisher_ids: set[int]
+    category_ids: set[int]
+    clear: bool = False
+
+
+class GameDetailCache:
+    """Thread-safe LRU cache of GameDetail entries with a time to live"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL_SECONDS) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries: OrderedDict[int, tuple[float, GameDetail]] = OrderedDict()
+        # Incremented by every invalidation so values computed meanwhile aren't stored
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, game_id: int, compute: Callable[[], GameDetail]) -> GameDetail:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(game_id)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(game_id)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[game_id]
+            self.misses += 1
+            generation = self._generation
+
+        detail = compute()
+
+        with self._lock:
+            if generation == self._generation:
+                self._entries[game_id] = (time.monotonic() + self.ttl, detail)
+                self._entries.move_to_end(game_id)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return detail
+
+    def invalidate(self, game_ids: set[int], publisher_ids: set[int], category_ids: set[int]) -> None:
+        with self._lock:
+            self._generation += 1
+            stale = [
+                game_id for game_id, (_, detail) in self._entries.items()
+                if game_id in game_ids or detail.publisher_id in publisher_ids or detail.category_id in category_ids
+            ]
+            for game_id in stale:
+                del self._entries[game_id]
+            self.invalidations += len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def render_prometheus(self) -> str:
+        labels = get_process_labels()
+        lines: list[str] = []
+        for name, help_text, value in (
+            ('hits', 'Detail requests answered from the cache.', self.hits),
+            ('misses', 'Detail requests that queried the database.', self.misses),
+            ('evictions', 'Entries evicted as least recently used.', self.evictions),
+            ('invalidations', 'Entries dropped because their game changed.', self.invalidations),
+        ):
+            lines += [f'# HELP tailspin_game_detail_cache_{name}_total {help_text}',
+                      f'# TYPE tailspin_game_detail_cache_{name}_total counter',
+                      f'tailspin_game_detail_cache_{name}_total{{{labels}}} {value}']
+        lines += ['# HELP tailspin_game_detail_cache_entries Entries currently cached.',
+                  '# TYPE tailspin_game_detail_cache_entries gauge',
+                  f'tailspin_game_detail_cache_entries{{{labels}}} {len(self)}']
+        return '\n'.join(lines) + '\n'
+
+
+def get_game_detail_cache() -> GameDetailCache | None:
+    return current_app.extensions.get(EXTENSION_KEY)
+
+
+def init_game_detail_cache(app: Flask) -> GameDetailCache | None:
+    """Registers a detail cache on the app unless GAME_DETAIL_CACHE_SIZE is 0"""
+    max_entries = int(app.config.get(SIZE_CONFIG_KEY, DEFAULT_MAX_ENTRIES))
+    if max_entries <= 0:
+        return None
+    cache = GameDetailCache(max_entries, float(app.config.get(TTL_CONFIG_KEY, DEFAULT_TTL_SECONDS)))
+    app.extensions[EXTENSION_KEY] = cache
+    return cache
+
+
+def _get_pending(session: Session) -> _PendingInvalidations:
+    return session.info.setdefault(_PENDING_KEY, _PendingInvalidations(set(), set(), set()))
+
+
+def _name_changed(instance: Any) -> bool:
+    return inspect(instance).attrs.name.history.has_changes()
+
+
+@event.listens_for(Session, 'after_flush')
+def _record_detail_writes(session: Session, flush_context: Any) -> None:
+    # Imported lazily to avoid a circular import with the models package
+    from models import Game, Category, Publisher
+
+    pending: _PendingInvalidations | None = None
+    for instances, is_deleted in ((session.new, False), (session.dirty, False), (session.deleted, True)):
+        for instance in instances:
+            if isinstance(instance, Game):
+                pending = pending or _get_pending(session)
+                pending.game_ids.add(instance.id)
+            elif isinstance(instance, Publisher) and (is_deleted or _name_changed(instance)):
+                pending = pending or _get_pending(session)
+                pending.publisher_ids.add(instance.id)
+            elif isinstance(instance, Category) and (is_deleted or _name_changed(instance)):
+                pending = pending or _get_pending(session)
+                pending.category_ids.add(instance.id)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _record_bulk_detail_writes(orm_execute_state: ORMExecuteState) -> None:
+    from models import Game, Category, Publisher
+
+    if orm_execute_state.is_select:
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and issubclass(mapper.class_, (Game, Category, Publisher)):
+        _get_pending(orm_execute_state.session).clear = True
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_after_commit(session: Session) -> None:
+    pending: _PendingInvalidations | None = session.info.pop(_PENDING_KEY, None)
+    if pending is None or not has_app_context():
+        return
+    cache = get_game_detail_cache()
+    if cache is None:
+        return
+    if pending.clear:
+        cache.clear()
+    else:
+        cache.invalidate(pending.game_ids, pending.publisher_ids, pending.category_ids)
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_after_rollback(session: Session, previous_transaction: Any) -> None:
+    session.info.pop(_PENDING_KEY, None)
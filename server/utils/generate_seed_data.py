@@ -0,0 +1,52 @@
+import argparse
+import csv
+import random
+from utils.seed_database import DEFAULT_CSV_PATH, read_game_rows
+
+CSV_FIELDS = ['Title', 'Category', 'Publisher', 'Description']
+
+def generate_synthetic_csv(output_path: str, count: int, seed: int | None = None,
+                           source_csv_path: str = DEFAULT_CSV_PATH) -> int:
+    """Write a games CSV with count synthetic rows derived from the seed data.
+    
+    The first pass over the source rows is copied as-is; later passes add an
+    edition number to each title. Every row gets a category and publisher
+    picked at random from the source, so filtered queries see a realistic
+    spread. The same seed always produces the same file.
+    
+    Returns:
+        Number of rows written
+    """
+    rng = random.Random(seed)
+    source_rows = list(read_game_rows(source_csv_path))
+    if not source_rows:
+        raise ValueError(f"No games found in {source_csv_path}")
+    
+    categories = sorted({row['Category'] for row in source_rows})
+    publishers = sorted({row['Publisher'] for row in source_rows})
+    
+    with open(output_path, mode='w', encoding='utf-8', newline='') as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDS, quoting=csv.QUOTE_ALL)
+        writer.writeheader()
+        for index in range(count):
+            edition, position = divmod(index, len(source_rows))
+            row = source_rows[position]
+            title = row['Title'] if edition == 0 else f"{row['Title']} {edition + 1}"
+            writer.writerow({
+                'Title': title,
+                'Category': rng.choice(categories),
+                'Publisher': rng.choice(publishers),
+                'Description': row['Description'],
+            })
+    
+    return count
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Generate a synthetic games CSV for load and benchmark environments")
+    parser.add_argument('count', type=int, help="Number of games to generate")
+    parser.add_argument('output', help="Path of the CSV file to write")
+    parser.add_argument('--seed', type=int, default=None, help="RNG seed for a reproducible file")
+    parser.add_argument('--source', default=DEFAULT_CSV_PATH, help="CSV the synthetic rows are derived from")
+    args = parser.parse_args()
+    written = generate_synthetic_csv(args.output, args.count, args.seed, args.source)
+    print(f"Wrote {written} games to {args.output}")
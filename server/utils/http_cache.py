@@ -0,0 +1,34 @@
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+from flask import Response, current_app, make_response, request
+from utils.data_version import get_data_etag
+
+# Seconds clients may reuse a response before revalidating it
+DEFAULT_CACHE_MAX_AGE = 0
+
+
+def conditional_get(view: Callable[..., Any]) -> Callable[..., Response]:
+    """
+    Tags successful responses with an ETag derived from the catalog data
+    version and answers matching If-None-Match requests with 304 before the
+    view runs, so revalidation never touches the database.
+    """
+    @wraps(view)
+    def wrapper(*args: Any, **kwargs: Any) -> Response:
+        etag = get_data_etag()
+
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+
+        response.set_etag(etag, weak=True)
+        response.cache_control.public = True
+        response.cache_control.max_age = current_app.config.get('API_CACHE_MAX_AGE', DEFAULT_CACHE_MAX_AGE)
+        response.cache_control.must_revalidate = True
+        return response
+
+    return wrapper
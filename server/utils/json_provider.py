@@ -0,0 +1,99 @@
+from collections.abc import Iterator
+from typing import Any
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+# orjson is in requirements.txt; environments installed without it fall back to the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Lists with at least this many items are streamed instead of encoded in one piece
+DEFAULT_STREAM_THRESHOLD = 1000
+# Number of list items encoded per streamed chunk
+STREAM_CHUNK_SIZE = 100
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON provider that encodes with orjson when it is installed.
+
+    Output matches DefaultJSONProvider: keys are sorted and types orjson
+    doesn't handle the same way (dates, dataclasses) go through the same
+    default() hook. Responses whose payload contains a list of at least
+    JSON_STREAM_THRESHOLD items are streamed in chunks rather than built
+    as one string. Debug-mode pretty printing falls back to the stdlib.
+    """
+
+    def _orjson_options(self) -> int:
+        options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        return options
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes."""
+        if orjson is not None:
+            try:
+                return orjson.dumps(obj, default=self.default, option=self._orjson_options())
+            except TypeError:
+                # e.g. non-string dict keys, which the stdlib encoder converts
+                pass
+        return super().dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if orjson is not None and not kwargs:
+            return self.dumps_bytes(obj).decode('utf-8')
+        return super().dumps(obj, **kwargs)
+
+    def iter_dumps(self, obj: Any) -> Iterator[bytes]:
+        """Serialize obj as a sequence of byte chunks, splitting top-level lists
+        and lists held directly by a top-level dict into item batches."""
+        if isinstance(obj, list):
+            yield from self._iter_list(obj)
+        elif isinstance(obj, dict) and all(isinstance(key, str) for key in obj):
+            keys = sorted(obj) if self.sort_keys else list(obj)
+            yield b'{'
+            for index, key in enumerate(keys):
+                prefix = b',' if index else b''
+                yield prefix + self.dumps_bytes(key) + b':'
+                value = obj[key]
+                if isinstance(value, list):
+                    yield from self._iter_list(value)
+                else:
+                    yield self.dumps_bytes(value)
+            yield b'}'
+        else:
+            yield self.dumps_bytes(obj)
+
+    def _iter_list(self, items: list[Any]) -> Iterator[bytes]:
+        yield b'['
+        for start in range(0, len(items), STREAM_CHUNK_SIZE):
+            chunk = self.dumps_bytes(items[start:start + STREAM_CHUNK_SIZE])
+            # Drop the chunk's own brackets so chunks join into one array
+            prefix = b',' if start else b''
+            yield prefix + chunk[1:-1]
+        yield b']'
+
+    def _should_stream(self, obj: Any) -> bool:
+        threshold = self._app.config.get('JSON_STREAM_THRESHOLD', DEFAULT_STREAM_THRESHOLD)
+        if isinstance(obj, list):
+            return len(obj) >= threshold
+        if isinstance(obj, dict):
+            return any(isinstance(value, list) and len(value) >= threshold for value in obj.values())
+        return False
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        if self._should_stream(obj):
+            body: Any = self._iter_stream_lines(obj)
+        else:
+            body = self.dumps_bytes(obj) + b'\n'
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+    def _iter_stream_lines(self, obj: Any) -> Iterator[bytes]:
+        yield from self.iter_dumps(obj)
+        yield b'\n'
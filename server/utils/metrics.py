@@ -0,0 +1,187 @@
+import os
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any
+from flask import Flask, Response, current_app, g, has_request_context, request
+from sqlalchemy import Engine, event
+from models import db
+
+# Upper bounds of the request latency histogram, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# Upper bounds of the SQL statements per request histogram; a page that
+# suddenly lands in the higher buckets usually means an N+1 query
+STATEMENT_BUCKETS = (1, 2, 3, 5, 10, 25, 50, 100)
+
+# Key of the RequestMetrics instance in app.extensions
+EXTENSION_KEY = 'tailspin_metrics'
+# Route label for requests that matched no URL rule
+UNMATCHED_ROUTE = 'unmatched'
+
+
+class Histogram:
+    """Cumulative Prometheus-style histogram with fixed bucket bounds"""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+
+
+@dataclass
+class RouteMetrics:
+    latency: Histogram = field(default_factory=lambda: Histogram(LATENCY_BUCKETS))
+    statements: Histogram = field(default_factory=lambda: Histogram(STATEMENT_BUCKETS))
+    db_seconds: float = 0.0
+    response_bytes: int = 0
+    responses: dict[int, int] = field(default_factory=lambda: defaultdict(int))
+
+
+class RequestMetrics:
+    """Thread-safe per-route request statistics, rendered for Prometheus"""
+
+    def __init__(self) -> None:
+        self._routes: dict[tuple[str, str], RouteMetrics] = {}
+        self._lock = threading.Lock()
+
+    def record(self, route: str, method: str, status: int, seconds: float, statements: int,
+               db_seconds: float, response_bytes: int | None) -> None:
+        with self._lock:
+            metrics = self._routes.setdefault((route, method), RouteMetrics())
+            metrics.latency.observe(seconds)
+            metrics.statements.observe(statements)
+            metrics.db_seconds += db_seconds
+            metrics.response_bytes += response_bytes or 0
+            metrics.responses[status] += 1
+
+    def get(self, route: str, method: str = 'GET') -> RouteMetrics | None:
+        return self._routes.get((route, method))
+
+    def render_prometheus(self) -> str:
+        """Returns every metric in the Prometheus text exposition format"""
+        lines: list[str] = []
+        with self._lock:
+            routes = sorted(self._routes.items())
+
+            lines += ['# HELP tailspin_http_requests_total Requests served, by route, method and status.',
+                      '# TYPE tailspin_http_requests_total counter']
+            for (route, method), metrics in routes:
+                for status, count in sorted(metrics.responses.items()):
+                    lines.append(f'tailspin_http_requests_total{{{_labels(route, method)},status="{status}"}} {count}')
+
+            lines += ['# HELP tailspin_http_request_duration_seconds Time spent in the app per request.',
+                      '# TYPE tailspin_http_request_duration_seconds histogram']
+            for (route, method), metrics in routes:
+                lines += _histogram_lines('tailspin_http_request_duration_seconds', _labels(route, method), metrics.latency)
+
+            lines += ['# HELP tailspin_db_statements_per_request SQL statements executed per request.',
+                      '# TYPE tailspin_db_statements_per_request histogram']
+            for (route, method), metrics in routes:
+                lines += _histogram_lines('tailspin_db_statements_per_request', _labels(route, method), metrics.statements)
+
+            lines += ['# HELP tailspin_db_duration_seconds_total Time spent executing SQL.',
+                      '# TYPE tailspin_db_duration_seconds_total counter']
+            for (route, method), metrics in routes:
+                lines.append(f'tailspin_db_duration_seconds_total{{{_labels(route, method)}}} {metrics.db_seconds:.6f}')
+
+            lines += ['# HELP tailspin_http_response_size_bytes_total Response body bytes sent, after compression.',
+                      '# TYPE tailspin_http_response_size_bytes_total counter']
+            for (route, method), metrics in routes:
+                lines.append(f'tailspin_http_response_size_bytes_total{{{_labels(route, method)}}} {metrics.response_bytes}')
+
+        return '\n'.join(lines) + '\n'
+
+
+def get_process_labels() -> str:
+    """
+    Labels every sample with the worker's pid. Each serve.py worker counts
+    only the requests it served, and a scrape reaches whichever worker
+    accepts it, so series must be told apart per worker and summed without
+    the pid label.
+    """
+    return f'pid="{os.getpid()}"'
+
+
+def _labels(route: str, method: str) -> str:
+    route = route.replace('\\', '\\\\').replace('"', '\\"')
+    return f'route="{route}",method="{method}",{get_process_labels()}'
+
+
+def _histogram_lines(name: str, labels: str, histogram: Histogram) -> list[str]:
+    lines = [f'{name}_bucket{{{labels},le="{bound}"}} {count}'
+             for bound, count in zip(histogram.buckets, histogram.counts)]
+    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+    lines.append(f'{name}_sum{{{labels}}} {histogram.sum:.6f}')
+    lines.append(f'{name}_count{{{labels}}} {histogram.count}')
+    return lines
+
+
+def get_request_metrics() -> RequestMetrics:
+    return current_app.extensions[EXTENSION_KEY]
+
+
+def _start_request() -> None:
+    g.metrics_start = time.perf_counter()
+    g.sql_statements = 0
+    g.sql_seconds = 0.0
+
+
+def _finish_request(response: Response) -> Response:
+    start: float | None = g.get('metrics_start')
+    if start is None:
+        return response
+    seconds = time.perf_counter() - start
+    statements: int = g.sql_statements
+    sql_seconds: float = g.sql_seconds
+
+    route = request.url_rule.rule if request.url_rule is not None else UNMATCHED_ROUTE
+    # Streamed bodies have no length until they have been sent
+    response_bytes = None if response.is_streamed else response.calculate_content_length()
+    get_request_metrics().record(route, request.method, response.status_code, seconds,
+                                 statements, sql_seconds, response_bytes)
+
+    response.headers.add(
+        'Server-Timing',
+        f'db;dur={sql_seconds * 1000:.1f};desc="{statements} queries", app;dur={seconds * 1000:.1f}'
+    )
+    return response
+
+
+def _instrument_engine(engine: Engine) -> None:
+    @event.listens_for(engine, 'before_cursor_execute')
+    def start_statement(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any,
+                        executemany: bool) -> None:
+        conn.info['metrics_statement_start'] = time.perf_counter()
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def finish_statement(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any,
+                         executemany: bool) -> None:
+        start: float | None = conn.info.pop('metrics_statement_start', None)
+        if start is not None and has_request_context() and 'sql_statements' in g:
+            seconds = time.perf_counter() - start
+            g.sql_statements += 1
+            g.sql_seconds += seconds
+
+
+def init_metrics(app: Flask) -> None:
+    """
+    Records latency, SQL statement count, SQL time and response size for
+    every request, and reports them in a Server-Timing header. Call after
+    init_database, and before init_compression so sizes are measured after
+    compression (after_request hooks run in reverse order).
+    """
+    app.extensions[EXTENSION_KEY] = RequestMetrics()
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
+
+    with app.app_context():
+        _instrument_engine(db.engine)
@@ -0,0 +1,44 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+
+# SQLite stores integers as signed 64-bit values; binding anything outside
+# this range raises OverflowError
+SQLITE_INTEGER_MIN = -2**63
+SQLITE_INTEGER_MAX = 2**63 - 1
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+def is_sqlite_integer(value: Any) -> bool:
+    """True for ints (not bools) that SQLite can store"""
+    return type(value) is int and SQLITE_INTEGER_MIN <= value <= SQLITE_INTEGER_MAX
+
+
+def encode_cursor(payload: dict[str, Any]) -> str:
+    """
+    Encodes a keyset position as an opaque, URL-safe cursor string.
+    """
+    raw = json.dumps(payload, separators=(',', ':'), sort_keys=True).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """
+    Decodes a cursor produced by encode_cursor back into its keyset position.
+    """
+    padding = '=' * (-len(cursor) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(cursor + padding)
+        payload = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as error:
+        raise InvalidCursorError("Invalid cursor") from error
+
+    if not isinstance(payload, dict) or not is_sqlite_integer(payload.get('id')):
+        raise InvalidCursorError("Invalid cursor")
+
+    return payload
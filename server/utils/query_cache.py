@@ -0,0 +1,79 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+from flask import current_app
+from utils.data_version import get_data_version
+
+T = TypeVar('T')
+
+
+class QueryCache:
+    """Thread-safe in-process LRU cache for query results derived from catalog data.
+
+    Entries are tagged with the data version they were computed under and
+    the whole cache is dropped as soon as the version moves on. Within a
+    version, the least recently used entry makes room for a new one.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._version: int = get_data_version()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        version = get_data_version()
+        with self._lock:
+            if self._version != version:
+                self._entries.clear()
+                self._version = version
+            elif key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        value = compute()
+
+        with self._lock:
+            # Don't store a value computed while the data was changing
+            if self._version == version == get_data_version():
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Key of the app's QueryCaches in app.extensions
+EXTENSION_KEY = 'tailspin_query_caches'
+
+
+@dataclass
+class QueryCaches:
+    """
+    The query caches of one app. They are kept per app because their keys
+    don't identify the database, and two apps in one process (tests,
+    benchmarks) may be bound to different ones.
+    """
+    # Total number of games per (category_id, publisher_id) filter combination
+    game_counts: QueryCache = field(default_factory=QueryCache)
+    # Number of search matches per (match expression, category_id, publisher_id)
+    search_counts: QueryCache = field(default_factory=QueryCache)
+    # Category and publisher facet counts per (category_id, publisher_id) filter combination
+    facets: QueryCache = field(default_factory=QueryCache)
+
+
+def get_query_caches() -> QueryCaches:
+    """Returns the current app's query caches, creating them on first use"""
+    caches: QueryCaches | None = current_app.extensions.get(EXTENSION_KEY)
+    if caches is None:
+        caches = current_app.extensions.setdefault(EXTENSION_KEY, QueryCaches())
+    return caches
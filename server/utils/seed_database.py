@@ -1,38 +1,112 @@
+import argparse
 import csv
 import os
 import random
+from collections.abc import Callable, Iterator
+from typing import Any
 from flask import Flask
-from models import db, Category, Game, Publisher
-from utils.database import get_connection_string
+from sqlalchemy import insert, select
+from app import create_app as create_api_app
+from models import db, Category, Game, Publisher, search_index_suspended
+from utils.database import init_schema
 
-def create_app():
-    """Create and configure Flask app for database operations"""
-    app = Flask(__name__)
+DEFAULT_CSV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'seed_data', 'games.csv')
+DEFAULT_BATCH_SIZE = 5000
 
-    # Configure and initialize the database
-    app.config['SQLALCHEMY_DATABASE_URI'] = get_connection_string()
-    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-    db.init_app(app)
+def create_app(config: dict[str, Any] | None = None) -> Flask:
+    """
+    Create the API app for database operations, with its schema in place.
+    config overrides the API app's settings, e.g. the database URI for tests.
+    """
+    # Seeding serves no requests, and the tables may not exist yet to snapshot
+    app = create_api_app({'CATALOG_SNAPSHOT_ENABLED': False, **(config or {})})
+    init_schema(app)
+    return app
+
+def category_description(name: str) -> str:
+    return f"Collection of {name} games available for crowdfunding"
+
+def publisher_description(name: str) -> str:
+    return f"{name} is a game publisher seeking funding for exciting new titles"
+
+def game_description(description: str) -> str:
+    return description + " Support this game through our crowdfunding platform!"
+
+def random_star_rating(rng: random.Random) -> float:
+    """Random star rating between 3.0 and 5.0 (one decimal place)"""
+    return round(rng.uniform(3.0, 5.0), 1)
+
+def read_game_rows(csv_path: str) -> Iterator[dict[str, str]]:
+    """Stream rows from a games CSV without loading the whole file"""
+    with open(csv_path, mode='r', encoding='utf-8', newline='') as csv_file:
+        yield from csv.DictReader(csv_file)
+
+def resolve_ids(model: type[Category] | type[Publisher], names: set[str],
+                describe: Callable[[str], str]) -> dict[str, int]:
+    """Map names to ids for a lookup table, inserting any missing rows in one batch"""
+    existing = dict(db.session.execute(select(model.name, model.id)).all())
+    missing = sorted(names - existing.keys())
+    if missing:
+        db.session.execute(insert(model), [{'name': name, 'description': describe(name)} for name in missing])
+        existing = dict(db.session.execute(select(model.name, model.id)).all())
+    return existing
+
+def bulk_load_games(csv_path: str = DEFAULT_CSV_PATH, batch_size: int = DEFAULT_BATCH_SIZE,
+                    seed: int | None = None) -> int:
+    """Load games from CSV with batched executemany inserts.
     
-    # Create tables
-    with app.app_context():
-        db.create_all()
+    Category and publisher ids are resolved up front in one pass over the
+    file, then game rows are streamed in batches of batch_size. Rows skip
+    ORM object construction and @validates hooks, so the CSV must already
+    be valid. The search index is rebuilt once at the end rather than
+    updated per row. Must be called within an app context.
     
-    return app
+    Returns:
+        Number of games inserted
+    """
+    rng = random.Random(seed)
+    
+    category_names: set[str] = set()
+    publisher_names: set[str] = set()
+    for row in read_game_rows(csv_path):
+        category_names.add(row['Category'])
+        publisher_names.add(row['Publisher'])
+    
+    category_ids = resolve_ids(Category, category_names, category_description)
+    publisher_ids = resolve_ids(Publisher, publisher_names, publisher_description)
+    
+    game_count = 0
+    batch: list[dict[str, Any]] = []
+    with search_index_suspended(db.session.connection()):
+        for row in read_game_rows(csv_path):
+            batch.append({
+                'title': row['Title'],
+                'description': game_description(row['Description']),
+                'category_id': category_ids[row['Category']],
+                'publisher_id': publisher_ids[row['Publisher']],
+                'star_rating': random_star_rating(rng),
+            })
+            if len(batch) >= batch_size:
+                db.session.execute(insert(Game), batch)
+                game_count += len(batch)
+                batch = []
+        if batch:
+            db.session.execute(insert(Game), batch)
+            game_count += len(batch)
+    
+    db.session.commit()
+    return game_count
 
-def create_games():
+def create_games(csv_path: str = DEFAULT_CSV_PATH, seed: int | None = None):
     """Create games, categories and publishers from CSV data for crowd funding platform"""
     app = create_app()
+    rng = random.Random(seed)
     
     with app.app_context():
         # Track which categories and publishers have been created
         categories = {}  # name -> category object
         publishers = {}  # name -> publisher object
         
-        # Read the CSV file
-        csv_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 
-                              'seed_data', 'games.csv')
-        
         game_count = 0
         with open(csv_path, mode='r', encoding='utf-8') as csv_file:
             csv_reader = csv.DictReader(csv_file)
@@ -43,10 +117,9 @@ def create_games():
                 category_name = row['Category']
                 if category_name not in categories:
                     # Create new category if it doesn't exist
-                    category_description = f"Collection of {category_name} games available for crowdfunding"
                     category = Category(
                         name=category_name,
-                        description=category_description
+                        description=category_description(category_name)
                     )
                     db.session.add(category)
                     db.session.flush()  # Get ID without committing
@@ -56,22 +129,20 @@ def create_games():
                 publisher_name = row['Publisher']
                 if publisher_name not in publishers:
                     # Create new publisher if it doesn't exist
-                    publisher_description = f"{publisher_name} is a game publisher seeking funding for exciting new titles"
                     publisher = Publisher(
                         name=publisher_name,
-                        description=publisher_description
+                        description=publisher_description(publisher_name)
                     )
                     db.session.add(publisher)
                     db.session.flush()  # Get ID without committing
                     publishers[publisher_name] = publisher
                 
-                # Generate random star rating between 3.0 and 5.0 (one decimal place)
-                star_rating = round(random.uniform(3.0, 5.0), 1)
+                star_rating = random_star_rating(rng)
                 
                 # Create the game with enhanced description for crowdfunding context
                 game = Game(
                     title=row['Title'],
-                    description=row['Description'] + " Support this game through our crowdfunding platform!",
+                    description=game_description(row['Description']),
                     category_id=categories[category_name].id,
                     publisher_id=publishers[publisher_name].id,
                     star_rating=star_rating,
@@ -83,8 +154,22 @@ def create_games():
             
         print(f"Added {game_count} games with {len(categories)} categories and {len(publishers)} publishers")
 
-def seed_database():
-    create_games()
+def seed_database(bulk: bool = False, csv_path: str = DEFAULT_CSV_PATH,
+                  batch_size: int = DEFAULT_BATCH_SIZE, seed: int | None = None):
+    if not bulk:
+        create_games(csv_path, seed)
+        return
+    
+    app = create_app()
+    with app.app_context():
+        game_count = bulk_load_games(csv_path, batch_size, seed)
+    print(f"Bulk loaded {game_count} games")
 
 if __name__ == '__main__':
-    seed_database()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Seed the Tailspin Toys database from a games CSV")
+    parser.add_argument('--csv', dest='csv_path', default=DEFAULT_CSV_PATH, help="Games CSV to load")
+    parser.add_argument('--bulk', action='store_true', help="Use the batched bulk loader for large files")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help="Rows per insert batch in bulk mode")
+    parser.add_argument('--seed', type=int, default=None, help="RNG seed for reproducible star ratings")
+    args = parser.parse_args()
+    seed_database(args.bulk, args.csv_path, args.batch_size, args.seed)
\ No newline at end of file
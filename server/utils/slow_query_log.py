@@ -0,0 +1,79 @@
+import logging
+import os
+import random
+import time
+from typing import Any
+from flask import Flask, has_request_context, request
+from sqlalchemy import Engine, event
+from models import db
+
+logger = logging.getLogger('tailspin.slow_query')
+
+# Statements slower than this many milliseconds are logged; unset disables the log
+THRESHOLD_CONFIG_KEY = 'SLOW_QUERY_THRESHOLD_MS'
+# Fraction of slow statements that are logged, so the log is safe under load
+SAMPLE_RATE_CONFIG_KEY = 'SLOW_QUERY_SAMPLE_RATE'
+DEFAULT_SAMPLE_RATE = 1.0
+# Both settings can also come from TAILSPIN_<CONFIG_KEY> environment variables
+ENV_PREFIX = 'TAILSPIN_'
+
+# Bound parameters are cut to this many characters, e.g. for large IN lists
+MAX_PARAMETERS_LENGTH = 500
+
+
+def _get_setting(app: Flask, key: str) -> str | float | None:
+    value = app.config.get(key)
+    return value if value is not None else os.environ.get(f'{ENV_PREFIX}{key}')
+
+
+def _describe_request() -> str:
+    if not has_request_context():
+        return 'outside a request'
+    return f'{request.endpoint or request.path} args={request.args.to_dict(flat=False)}'
+
+
+def _instrument_engine(engine: Engine, threshold: float, sample_rate: float) -> None:
+    @event.listens_for(engine, 'before_cursor_execute')
+    def start_statement(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any,
+                        executemany: bool) -> None:
+        conn.info['slow_query_start'] = time.perf_counter()
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def finish_statement(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any,
+                         executemany: bool) -> None:
+        start: float | None = conn.info.pop('slow_query_start', None)
+        if start is None:
+            return
+        duration_ms = (time.perf_counter() - start) * 1000
+        if duration_ms < threshold or random.random() >= sample_rate:
+            return
+
+        formatted_parameters = repr(parameters)
+        if len(formatted_parameters) > MAX_PARAMETERS_LENGTH:
+            formatted_parameters = formatted_parameters[:MAX_PARAMETERS_LENGTH] + '...'
+        logger.warning(
+            'Slow query (%.1f ms) [%s]: %s parameters=%s',
+            duration_ms, _describe_request(), ' '.join(statement.split()), formatted_parameters
+        )
+
+
+def init_slow_query_log(app: Flask) -> bool:
+    """
+    Logs SQL statements slower than SLOW_QUERY_THRESHOLD_MS to the
+    tailspin.slow_query logger with their parameters, duration, endpoint and
+    request args. Only SLOW_QUERY_SAMPLE_RATE of slow statements are logged.
+    Does nothing when no threshold is configured. Returns whether the log
+    was enabled.
+    """
+    threshold = _get_setting(app, THRESHOLD_CONFIG_KEY)
+    if threshold is None or threshold == '':
+        return False
+
+    sample_rate = _get_setting(app, SAMPLE_RATE_CONFIG_KEY)
+    sample_rate = DEFAULT_SAMPLE_RATE if sample_rate is None else float(sample_rate)
+    if not 0.0 <= sample_rate <= 1.0:
+        raise ValueError(f"{SAMPLE_RATE_CONFIG_KEY} must be between 0 and 1, got {sample_rate}")
+
+    with app.app_context():
+        _instrument_engine(db.engine, float(threshold), sample_rate)
+    return True